@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Benchmark serial vs concurrent HondaScraper.search_vehicles against local stub dealers
+"""
+
+import sys
+import os
+import time
+import logging
+import argparse
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from scraper import HondaScraper
+from stub_server import StubDealerServer
+from transport import Transport
+
+def run_search(locations: dict, concurrent: bool, max_workers: int, per_host: int):
+    """Run one search and return (elapsed seconds, vehicles)"""
+    scraper = HondaScraper(locations=locations, concurrent=concurrent,
+                           max_workers=max_workers, per_host=per_host, use_cache=False,
+                           transport=Transport(rate=0))  # Engine throughput, not dealer pacing
+    start = time.perf_counter()
+    vehicles = scraper.search_vehicles()
+    return time.perf_counter() - start, vehicles
+
+def benchmark(location_counts, delay: float, max_workers: int, per_host: int):
+    """Compare both fetch modes for each location count"""
+    print("⚡ HondaScraper concurrency benchmark")
+    print(f"   Stub latency: {delay * 1000:.0f} ms/page | workers: {max_workers} | per-host cap: {per_host}")
+    print("=" * 72)
+    print(f"{'locations':>10} {'pages':>7} {'serial (s)':>12} {'concurrent (s)':>15} {'speedup':>9} {'same result':>12}")
+
+    for count in location_counts:
+        servers = [StubDealerServer(delay=delay, seed=i).start() for i in range(count)]
+        try:
+            locations = {
+                f"stub_dealer_{i}": server.location_info(f"Stub Honda {i}")
+                for i, server in enumerate(servers)
+            }
+            serial_time, serial_vehicles = run_search(locations, False, max_workers, per_host)
+            concurrent_time, concurrent_vehicles = run_search(locations, True, max_workers, per_host)
+        finally:
+            for server in servers:
+                server.stop()
+
+        same = serial_vehicles == concurrent_vehicles
+        print(f"{count:>10} {count * 4:>7} {serial_time:>12.2f} {concurrent_time:>15.2f} "
+              f"{serial_time / concurrent_time:>8.1f}x {'✅' if same else '❌':>11}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark concurrent dealership fetching')
+    parser.add_argument('--locations', type=int, nargs='+', default=[3, 10, 25, 50])
+    parser.add_argument('--delay', type=float, default=0.05, help='Simulated page latency in seconds')
+    parser.add_argument('--workers', type=int, default=16)
+    parser.add_argument('--per-host', type=int, default=2)
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    benchmark(args.locations, args.delay, args.workers, args.per_host)
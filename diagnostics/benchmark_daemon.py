@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Scheduled runs as separate cold perform_search calls (a new scraper, a new
+DataManager and the dashboard read back every run) vs the resident
+SearchService that keeps them warm. Dealers are local stub servers whose
+inventory changes every run, so each run finds new vehicles.
+"""
+
+import sys
+import os
+import time
+import shutil
+import logging
+import argparse
+import statistics
+import tempfile
+from contextlib import redirect_stdout
+from datetime import datetime
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import search_runner
+import web_updater
+from scraper import HondaScraper
+from data_manager import DataManager
+from search_service import SearchService
+from transport import Transport
+from stub_server import StubDealerServer
+from benchmark_storage import seed_store
+
+def make_scraper(locations: dict) -> HondaScraper:
+    # No per-host pacing: back-to-back runs would otherwise wait on a resident scraper's emptied token buckets
+    return HondaScraper(locations=locations, use_cache=False, transport=Transport(rate=0))
+
+def run_quietly(function):
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        began = time.perf_counter()
+        found = function()
+        return (time.perf_counter() - began) * 1000, found
+
+def file_bytes(*paths) -> int:
+    return sum(os.path.getsize(path) for path in paths if os.path.exists(path))
+
+def benchmark(tracked: int, dealers: int, delay: float, runs: int):
+    converter = web_updater.load_converter()
+    original = (search_runner.create_scraper, search_runner.DataManager, converter.WEB_DATA_DIR)
+    servers = [StubDealerServer(delay=delay, vehicles_per_page=4, seed=i).start() for i in range(dealers)]
+    locations = {f"stub_{i}": server.location_info(f"Stub Honda {i}") for i, server in enumerate(servers)}
+
+    print(f"♻️  Cold runs vs resident service: {tracked:,} tracked, {dealers} dealers, "
+          f"{delay * 1000:.0f} ms latency, {runs} runs")
+    print("=" * 72)
+    print(f"{'mode':>10} {'median ms':>11} {'min ms':>9} {'max ms':>9} {'setup ms/run':>13} {'written/run':>12}")
+    results = {}
+    try:
+        for mode in ('cold', 'warm'):
+            workdir = tempfile.mkdtemp()
+            data_file = os.path.join(workdir, 'previous_matches.json')
+            journal_file = data_file + '.journal'
+            converter.WEB_DATA_DIR = os.path.join(workdir, 'data')
+            seed_store('json', data_file, tracked, datetime.now())
+            run_quietly(lambda: web_updater.update_web_dashboard(data_manager=DataManager('json', data_file)))
+            service = None
+            try:
+                if mode == 'cold':
+                    search_runner.create_scraper = lambda engine=None, keys=None: make_scraper(locations)
+                    search_runner.DataManager = lambda: DataManager('json', data_file)
+                    run = search_runner.perform_search
+                else:
+                    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+                        service = SearchService(scraper=make_scraper(locations),
+                                                data_manager=DataManager('journal', data_file))
+                    run = service.run_once
+
+                timings, setups, written = [], [], []
+                for _ in range(runs):
+                    for server in servers:
+                        server.inventory_version += 1
+                    before = file_bytes(journal_file) if mode == 'warm' else 0
+                    elapsed, found = run_quietly(run)
+                    if not found:
+                        raise RuntimeError(f"{mode}: the run found no new vehicles")
+                    timings.append(elapsed)
+                    if mode == 'cold':
+                        # What the run spent before its first request, measured again outside the timed run
+                        setups.append(run_quietly(lambda: (search_runner.create_scraper(), search_runner.DataManager(),
+                                                           converter.read_web_data()))[0])
+                    written.append(file_bytes(journal_file) - before if mode == 'warm' else file_bytes(data_file))
+
+                if service:
+                    stats = service.get_stats()
+                    setups = [stats['last_run_setup_ms']]
+                    print(f"{'':>10} service: {stats['cold_setup_ms']:.0f} ms cold setup once, "
+                          f"{stats['setup_ms_saved_per_run']:.0f} ms saved per run")
+                results[mode] = statistics.median(timings)
+                print(f"{mode:>10} {statistics.median(timings):>11.1f} {min(timings):>9.1f} {max(timings):>9.1f} "
+                      f"{statistics.median(setups):>13.1f} {statistics.median(written) / 1024:>10.0f}KB")
+            finally:
+                if service:
+                    service.close()
+                shutil.rmtree(workdir, ignore_errors=True)
+    finally:
+        search_runner.create_scraper, search_runner.DataManager, converter.WEB_DATA_DIR = original
+        for server in servers:
+            server.stop()
+
+    print(f"\nWarm runs faster than cold runs: {'✅' if results['warm'] < results['cold'] else '❌'} "
+          f"({results['cold'] - results['warm']:.1f} ms median saved per run)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark cold perform_search runs against the resident search service')
+    parser.add_argument('--tracked', type=int, default=20000, help='Tracked vehicles in the synthetic history')
+    parser.add_argument('--dealers', type=int, default=4, help='Stub dealer servers to search')
+    parser.add_argument('--delay', type=float, default=0.02, help='Simulated page latency in seconds')
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    benchmark(args.tracked, args.dealers, args.delay, args.runs)
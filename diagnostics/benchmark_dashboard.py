@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+End-to-end perform_search latency with the dashboard updated by a python3
+convert_data.py subprocess (as before) and by calling convert_data in-process
+with the DataManager's in-memory data (as now). The scraper is replaced by a
+stub returning synthetic listings, so only local work is measured.
+"""
+
+import sys
+import os
+import json
+import time
+import shutil
+import logging
+import argparse
+import statistics
+import subprocess
+import tempfile
+from contextlib import redirect_stdout
+from datetime import datetime
+
+# Add src directory to path
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(os.path.join(PROJECT_ROOT, 'src'))
+
+import search_runner
+import web_updater
+from data_manager import DataManager
+from benchmark_storage import synthetic_match, seed_store
+
+class StubScraper:
+    """Returns one run's listings: the newest `tracked` vehicles again plus `new` unseen ones"""
+
+    def __init__(self, start: int, listed: int, new: int):
+        now = datetime.now()
+        self.vehicles = [synthetic_match(i, now) for i in range(start - listed + new, start + new)]
+        for vehicle in self.vehicles:
+            del vehicle['id'], vehicle['first_seen']
+        self.known_keys = set()
+
+    def search_vehicles(self) -> list:
+        return self.vehicles
+
+    def get_stats(self) -> dict:
+        return {}
+
+def subprocess_update(workdir: str):
+    """update_web_dashboard as it was: a new interpreter running convert_data.py in docs/"""
+    def update_web_dashboard(new_vehicles=None, search_stats=None, days_to_keep=30, data_manager=None,
+                             dashboard_state=None):
+        command = ['python3', 'convert_data.py']
+        payload = None
+        if new_vehicles is not None:
+            command.append('--incremental')
+            payload = json.dumps({'new_vehicles': [dict(vehicle) for vehicle in new_vehicles],
+                                  'stats': data_manager.get_stats(), 'days_to_keep': days_to_keep}, default=str)
+        result = subprocess.run(command, cwd=os.path.join(workdir, 'docs'), input=payload,
+                                capture_output=True, text=True)
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr.strip())
+    return update_web_dashboard
+
+def make_workdir(tracked: int) -> str:
+    """A project copy: the store at src/previous_matches.json (where convert_data.py reads it), the
+    source files of src/ and docs/convert_data.py linked in"""
+    workdir = tempfile.mkdtemp()
+    os.mkdir(os.path.join(workdir, 'src'))
+    for name in os.listdir(os.path.join(PROJECT_ROOT, 'src')):
+        if name.endswith('.py'):
+            os.symlink(os.path.join(PROJECT_ROOT, 'src', name), os.path.join(workdir, 'src', name))
+    os.mkdir(os.path.join(workdir, 'docs'))
+    os.symlink(os.path.join(PROJECT_ROOT, 'docs', 'convert_data.py'), os.path.join(workdir, 'docs', 'convert_data.py'))
+    seed_store('json', os.path.join(workdir, 'src', 'previous_matches.json'), tracked, datetime.now())
+    return workdir
+
+def run_searches(label: str, workdir: str, tracked: int, listed: int, new: int, runs: int, rebuild: bool) -> list:
+    data_file = os.path.join(workdir, 'src', 'previous_matches.json')
+    manifest_file = os.path.join(workdir, 'docs', 'data', 'manifest.json')
+    search_runner.DataManager = lambda: DataManager('json', data_file)
+
+    # Start from a current dashboard, as a scheduled run would
+    with open(os.devnull, 'w') as quiet, redirect_stdout(quiet):
+        web_updater.update_web_dashboard(data_manager=search_runner.DataManager())
+
+    timings = []
+    start = tracked
+    for _ in range(runs):
+        if rebuild and os.path.exists(manifest_file):
+            os.remove(manifest_file)
+        search_runner.create_scraper = lambda engine, locations=None, start=start: StubScraper(start, listed, new)
+        with open(os.devnull, 'w') as quiet, redirect_stdout(quiet):
+            began = time.perf_counter()
+            found = search_runner.perform_search()
+            timings.append((time.perf_counter() - began) * 1000)
+        if found != new:
+            raise RuntimeError(f"{label}: expected {new} new vehicles, perform_search reported {found}")
+        start += new
+    return timings
+
+def benchmark(tracked: int, listed: int, new: int, runs: int):
+    updaters = {
+        'subprocess': subprocess_update,
+        'in-process': lambda workdir: web_updater.update_web_dashboard
+    }
+    original_update = web_updater.update_web_dashboard
+    converter = web_updater.load_converter()
+    original_web_data_dir = converter.WEB_DATA_DIR
+
+    print(f"⏱️  perform_search end to end: {tracked:,} tracked, {listed} listed per run ({new} new), median of {runs} runs")
+    print("=" * 72)
+    print(f"{'dashboard update':>18} {'dashboard':>12} {'median ms':>11} {'min ms':>9} {'max ms':>9}")
+    try:
+        for rebuild in (False, True):
+            for label, updater in updaters.items():
+                workdir = make_workdir(tracked)
+                try:
+                    web_updater.update_web_dashboard = updater(workdir)
+                    converter.WEB_DATA_DIR = os.path.join(workdir, 'docs', 'data')
+                    timings = run_searches(label, workdir, tracked, listed, new, runs, rebuild)
+                finally:
+                    web_updater.update_web_dashboard = original_update
+                    shutil.rmtree(workdir, ignore_errors=True)
+                mode = 'rebuilt' if rebuild else 'merged'
+                print(f"{label:>18} {mode:>12} {statistics.median(timings):>11.1f} {min(timings):>9.1f} {max(timings):>9.1f}")
+    finally:
+        web_updater.update_web_dashboard = original_update
+        converter.WEB_DATA_DIR = original_web_data_dir
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark perform_search with subprocess vs in-process dashboard updates')
+    parser.add_argument('--tracked', type=int, default=20000, help='Tracked vehicles in the synthetic history')
+    parser.add_argument('--listed', type=int, default=300, help='Vehicles the stub scraper returns per run')
+    parser.add_argument('--new', type=int, default=20, help='Unseen vehicles among them per run')
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    benchmark(args.tracked, args.listed, args.new, args.runs)
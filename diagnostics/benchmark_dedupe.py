@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for DataManager.get_new_vehicles: dedupe 1k scraped vehicles against
+100k-1M stored matches with the old linear scan, the id index and the Bloom prefilter
+"""
+
+import sys
+import os
+import time
+import shutil
+import logging
+import argparse
+import tempfile
+from datetime import datetime
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from data_manager import DataManager
+from storage import JsonStore, SqliteStore, empty_data
+from benchmark_storage import synthetic_match
+
+LINEAR_SAMPLE = 20  # The linear scan is timed on a sample and scaled up to the full batch
+
+def linear_is_duplicate(matches: list, vehicle_id: str) -> bool:
+    """is_duplicate as it was before the id index: a scan of every stored match"""
+    for previous_vehicle in matches:
+        if previous_vehicle.get('id') == vehicle_id:
+            return True
+    return False
+
+def scraped_batch(stored: int, batch: int, now: datetime) -> list:
+    """Half already-tracked vehicles spread over the history, half new ones"""
+    step = max(1, stored // (batch // 2))
+    vehicles = [synthetic_match(i * step, now) for i in range(batch // 2)]
+    vehicles += [synthetic_match(stored + i, now) for i in range(batch - batch // 2)]
+    for vehicle in vehicles:
+        del vehicle['id'], vehicle['first_seen']
+    return vehicles
+
+def time_dedupe(data_manager: DataManager, scraped: list) -> tuple:
+    batch = [dict(vehicle) for vehicle in scraped]
+    start = time.perf_counter()
+    new_vehicles = data_manager.get_new_vehicles(batch)
+    return (time.perf_counter() - start) * 1000, len(new_vehicles)
+
+def benchmark_size(stored: int, batch: int) -> dict:
+    now = datetime.now()
+    data = {**empty_data(), 'previous_matches': [synthetic_match(i, now) for i in range(stored)]}
+    scraped = scraped_batch(stored, batch, now)
+    workdir = tempfile.mkdtemp()
+    results = {}
+    try:
+        # Legacy linear scan, timed on a sample
+        data_manager = DataManager('json', os.path.join(workdir, 'none.json'))
+        sample = scraped[:LINEAR_SAMPLE // 2] + scraped[-LINEAR_SAMPLE // 2:]
+        start = time.perf_counter()
+        for vehicle in sample:
+            linear_is_duplicate(data['previous_matches'], data_manager.generate_vehicle_id(vehicle))
+        results['linear scan*'] = ((time.perf_counter() - start) * 1000 * batch / len(sample), None, None)
+
+        for label, bloom_filter in (('id index', False), ('id index + bloom', True)):
+            store = JsonStore(os.path.join(workdir, 'none.json'), bloom_filter=bloom_filter)
+            start = time.perf_counter()
+            store.reset(data)
+            build_ms = (time.perf_counter() - start) * 1000
+            data_manager.store = store
+            results[label] = (*time_dedupe(data_manager, scraped), build_ms)
+
+        sqlite_file = os.path.join(workdir, 'matches.db')
+        seed = SqliteStore(sqlite_file, bloom_filter=False)
+        with seed.conn:
+            seed.reset(data)
+        seed.close()
+        for label, bloom_filter in (('sqlite', False), ('sqlite + bloom', True)):
+            start = time.perf_counter()
+            store = SqliteStore(sqlite_file, bloom_filter=bloom_filter)
+            build_ms = (time.perf_counter() - start) * 1000
+            data_manager.store = store
+            results[label] = (*time_dedupe(data_manager, scraped), build_ms)
+            store.close()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return results
+
+def benchmark(sizes, batch: int):
+    print(f"🔎 Dedupe {batch:,} scraped vehicles (half already tracked) against stored matches")
+    print("   (* linear scan timed on a sample and scaled to the batch; build = index/filter build at load)")
+    print("=" * 78)
+    print(f"{'stored':>10} {'mode':>18} {'dedupe ms':>12} {'new':>7} {'build ms':>12}")
+    for stored in sizes:
+        for label, (dedupe_ms, new, build_ms) in benchmark_size(stored, batch).items():
+            new_text = f"{new:>7}" if new is not None else f"{'-':>7}"
+            build_text = f"{build_ms:>12.1f}" if build_ms is not None else f"{'-':>12}"
+            print(f"{stored:>10,} {label:>18} {dedupe_ms:>12.1f} {new_text} {build_text}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark duplicate detection against large histories')
+    parser.add_argument('--sizes', default='100000,500000,1000000', help='Comma-separated stored match counts')
+    parser.add_argument('--batch', type=int, default=1000, help='Scraped vehicles per dedupe')
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    benchmark([int(size) for size in args.sizes.split(',')], args.batch)
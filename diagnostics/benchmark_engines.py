@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Measure requests/sec of the sync (requests + threads) and async (aiohttp) scraper engines
+against local stub dealers
+"""
+
+import sys
+import os
+import time
+import logging
+import argparse
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from scraper import HondaScraper
+from async_scraper import AsyncHondaScraper
+from stub_server import StubDealerServer
+from transport import Transport
+
+def build_locations(servers, locations_per_host: int) -> dict:
+    """Point several dealership entries at each stub host"""
+    locations = {}
+    for host_index, server in enumerate(servers):
+        for i in range(locations_per_host):
+            info = server.location_info(f"Stub Honda {host_index}-{i}")
+            info['new_url'] = f"{server.base_url}/new-inventory/{i}/index.htm"
+            info['used_url'] = f"{server.base_url}/used-inventory/{i}/index.htm"
+            locations[f"stub_{host_index}_{i}"] = info
+    return locations
+
+def measure(scraper, servers):
+    """Run one search and return (elapsed seconds, requests served, vehicles)"""
+    before = sum(server.request_count for server in servers)
+    start = time.perf_counter()
+    vehicles = scraper.search_vehicles()
+    elapsed = time.perf_counter() - start
+    served = sum(server.request_count for server in servers) - before
+    return elapsed, served, vehicles
+
+def benchmark(hosts: int, locations_per_host: int, delay: float, per_host: int, workers: int):
+    servers = [StubDealerServer(delay=delay, vehicles_per_page=4, seed=i).start() for i in range(hosts)]
+    try:
+        locations = build_locations(servers, locations_per_host)
+
+        print("🚀 Scraper engine throughput")
+        print(f"   {hosts} hosts x {locations_per_host} locations | {delay * 1000:.0f} ms latency | "
+              f"{per_host} per host | {workers} sync workers")
+        print("=" * 64)
+        print(f"{'engine':>8} {'requests':>10} {'seconds':>10} {'req/sec':>10} {'vehicles':>10}")
+
+        results = {}
+        engines = [
+            ('sync', HondaScraper(locations=locations, concurrent=True, max_workers=workers, per_host=per_host,
+                                   use_cache=False, transport=Transport(rate=0))),
+            ('async', AsyncHondaScraper(locations=locations, per_host=per_host, use_cache=False,
+                                        transport=Transport(rate=0))),
+        ]
+        for name, scraper in engines:
+            elapsed, served, vehicles = measure(scraper, servers)
+            results[name] = vehicles
+            print(f"{name:>8} {served:>10} {elapsed:>10.2f} {served / elapsed:>10.1f} {len(vehicles):>10}")
+
+        print(f"\nSame merged result: {'✅' if results['sync'] == results['async'] else '❌'}")
+    finally:
+        for server in servers:
+            server.stop()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Compare sync and async scraper engines')
+    parser.add_argument('--hosts', type=int, default=25)
+    parser.add_argument('--locations-per-host', type=int, default=4)
+    parser.add_argument('--delay', type=float, default=0.1, help='Simulated page latency in seconds')
+    parser.add_argument('--per-host', type=int, default=4)
+    parser.add_argument('--workers', type=int, default=8)
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    benchmark(args.hosts, args.locations_per_host, args.delay, args.per_host, args.workers)
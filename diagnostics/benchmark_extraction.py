@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Benchmark the single-pass anchor scanner in extract_vehicles_from_page against the
+previous multi-sweep implementation on large (5MB+) SRP pages
+"""
+
+import sys
+import os
+import re
+import time
+import logging
+import argparse
+from urllib.parse import urljoin
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from scraper import HondaScraper
+from stub_server import build_srp_page
+from bs4 import BeautifulSoup
+
+logger = logging.getLogger(__name__)
+
+def legacy_extract_vehicles_from_page(scraper, soup, base_url: str) -> list:
+    """Baseline: extract_vehicles_from_page before the single-pass anchor scanner"""
+    vehicles = []
+
+    # Debug: Check if page has content
+    page_text = soup.get_text().lower()
+    logger.debug(f"Page contains 'civic': {'civic' in page_text}")
+    logger.debug(f"Page contains 'honda': {'honda' in page_text}")
+
+    # Try multiple approaches to find vehicles
+
+    # Approach 1: Look for vehicle links directly (both new and used)
+    vehicle_patterns = [
+        r'/new/Honda/.*Civic',
+        r'/used/Honda/.*Civic',
+        r'/inventory/.*Honda.*Civic',
+        r'\?.*model.*[Cc]ivic'  # URLs with civic in parameters
+    ]
+
+    for pattern in vehicle_patterns:
+        vehicle_links = soup.find_all('a', href=re.compile(pattern, re.I))
+        logger.debug(f"Pattern '{pattern}' found {len(vehicle_links)} vehicle links")
+
+        for link in vehicle_links:
+            try:
+                link_url = urljoin(base_url, link.get('href', ''))
+                text_title = link.get_text(strip=True)
+
+                # Extract vehicle info from URL parameters
+                url_info = scraper.extract_vehicle_info_from_url(link_url)
+
+                # Create a meaningful title
+                meaningful_title = scraper.create_vehicle_title(url_info, text_title)
+
+                vehicle_info = {
+                    'title': meaningful_title,
+                    'url': link_url,
+                    **url_info  # Include all extracted info
+                }
+
+                # Look for price in nearby elements
+                parent = link.find_parent(['div', 'section', 'article', 'li'])
+                if parent:
+                    price_text = parent.get_text()
+                    price_match = re.search(r'\$[\d,]+', price_text)
+                    if price_match:
+                        vehicle_info['price'] = price_match.group()
+
+                vehicles.append(vehicle_info)
+                logger.debug(f"Found vehicle: {vehicle_info['title']}")
+            except Exception as e:
+                logger.debug(f"Error processing vehicle link: {e}")
+
+    # Approach 2: Look for inventory page links that might contain vehicle data
+    if not vehicles:
+        # Look for links to inventory pages with Honda Civic parameters
+        inventory_links = soup.find_all('a', href=re.compile(r'inventory.*honda|honda.*inventory', re.I))
+        logger.debug(f"Found {len(inventory_links)} inventory links")
+
+        for link in inventory_links:
+            try:
+                link_url = urljoin(base_url, link.get('href', ''))
+                if 'civic' in link_url.lower():
+                    url_info = scraper.extract_vehicle_info_from_url(link_url)
+                    meaningful_title = scraper.create_vehicle_title(url_info, link.get_text(strip=True))
+
+                    vehicle_info = {
+                        'title': meaningful_title,
+                        'url': link_url,
+                        **url_info
+                    }
+                    vehicles.append(vehicle_info)
+                    logger.debug(f"Found inventory vehicle: {meaningful_title}")
+            except Exception as e:
+                logger.debug(f"Error processing inventory link: {e}")
+
+    # Approach 3: Look for text patterns that indicate vehicles
+    if not vehicles:
+        # Look for Honda Civic text patterns with years
+        civic_patterns = [
+            r'(20\d{2})\s+Honda\s+Civic[^<]*',
+            r'Honda\s+Civic[^<]*',
+            r'Civic\s+(Hybrid|Sport|EX|LX)[^<]*'
+        ]
+
+        for pattern in civic_patterns:
+            matches = re.findall(pattern, soup.get_text(), re.I)
+            for match in matches:
+                title_text = match if isinstance(match, str) else ' '.join(match)
+                vehicle_info = {
+                    'title': title_text,
+                    'url': base_url,  # Fallback URL
+                }
+                vehicles.append(vehicle_info)
+                logger.debug(f"Found vehicle by pattern: {vehicle_info['title']}")
+
+    # Approach 4: Try broader Honda search
+    if not vehicles:
+        logger.debug("Trying broader search approach...")
+
+        # Try to find any links with Honda and Civic in them
+        honda_links = soup.find_all('a', text=re.compile(r'Honda.*Civic|Civic.*Honda', re.I))
+        logger.debug(f"Found {len(honda_links)} Honda Civic links")
+
+        for link in honda_links:
+            text = link.get_text(strip=True)
+            link_url = urljoin(base_url, link.get('href', ''))
+            url_info = scraper.extract_vehicle_info_from_url(link_url)
+            meaningful_title = scraper.create_vehicle_title(url_info, text)
+
+            vehicle_info = {
+                'title': meaningful_title,
+                'url': link_url,
+                **url_info
+            }
+            vehicles.append(vehicle_info)
+            logger.debug(f"Found Honda vehicle: {meaningful_title}")
+
+    # Remove duplicates based on URL or title
+    unique_vehicles = []
+    seen_identifiers = set()
+
+    for vehicle in vehicles:
+        identifier = vehicle.get('url') or vehicle.get('title')
+        if identifier and identifier not in seen_identifiers:
+            seen_identifiers.add(identifier)
+            unique_vehicles.append(vehicle)
+
+    logger.debug(f"Found {len(unique_vehicles)} unique vehicles on this page")
+    return unique_vehicles
+
+class TraversalCounter:
+    """Count whole-tree find_all / get_text calls made on a soup's root"""
+
+    def __init__(self, soup):
+        self.count = 0
+        for name in ('find_all', 'get_text'):
+            method = getattr(soup, name)
+            setattr(soup, name, self._wrap(method))
+
+    def _wrap(self, method):
+        def counted(*args, **kwargs):
+            self.count += 1
+            return method(*args, **kwargs)
+        return counted
+
+def build_large_page(target_mb: float) -> bytes:
+    """Grow a synthetic SRP page until it is at least target_mb megabytes"""
+    vehicles = 1000
+    while True:
+        html = build_srp_page('used', 'Civic', vehicles).encode('utf-8')
+        if len(html) >= target_mb * 1024 * 1024:
+            return html
+        vehicles = int(vehicles * target_mb * 1024 * 1024 / len(html)) + 100
+
+def measure(extract, scraper, content: bytes, base_url: str, repeats: int):
+    """Return (mean seconds, traversals per call, vehicles) for one implementation"""
+    elapsed = 0.0
+    for _ in range(repeats):
+        soup = scraper.parse_html(content)
+        counter = TraversalCounter(soup)
+        start = time.perf_counter()
+        vehicles = extract(soup, base_url)
+        elapsed += time.perf_counter() - start
+    return elapsed / repeats, counter.count, vehicles
+
+def benchmark(sizes_mb, repeats: int):
+    scraper = HondaScraper(concurrent=False, use_cache=False)
+    base_url = 'https://www.leithhonda.com/used-inventory/index.htm?make=Honda&model=Civic'
+    implementations = [
+        ('multi-sweep', lambda soup, url: legacy_extract_vehicles_from_page(scraper, soup, url)),
+        ('single-pass', scraper.extract_vehicles_from_page),
+    ]
+
+    print("🔎 extract_vehicles_from_page traversal benchmark")
+    print("=" * 78)
+    print(f"{'page (MB)':>10} {'implementation':>15} {'traversals':>11} {'extract (ms)':>13} {'vehicles':>9} {'same':>6}")
+
+    for size in sizes_mb:
+        content = build_large_page(size)
+        results = [(name, measure(extract, scraper, content, base_url, repeats)) for name, extract in implementations]
+        same = results[0][1][2] == results[1][1][2]
+        for name, (seconds, traversals, vehicles) in results:
+            print(f"{len(content) / 1024 / 1024:>10.1f} {name:>15} {traversals:>11} {seconds * 1000:>13.1f} "
+                  f"{len(vehicles):>9} {'✅' if same else '❌':>5}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark single-pass vehicle extraction')
+    parser.add_argument('--sizes', type=float, nargs='+', default=[1, 5, 10], help='Page sizes in MB')
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    benchmark(args.sizes, args.repeats)
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Benchmark the on-disk data formats for previous_matches: file size, atomic save
+time and load time (with format detection) for each available DATA_FORMAT
+"""
+
+import sys
+import os
+import time
+import shutil
+import logging
+import argparse
+import tempfile
+from datetime import datetime
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import data_formats
+from storage import empty_data, write_data_atomically
+from benchmark_storage import synthetic_match
+
+def best_of(repeat: int, function) -> float:
+    """Fastest of `repeat` runs in milliseconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings)
+
+def benchmark(vehicles: int, repeat: int):
+    now = datetime.now()
+    data = {**empty_data(), 'total_searches': vehicles // 100,
+            'previous_matches': [synthetic_match(i, now) for i in range(vehicles)]}
+    workdir = tempfile.mkdtemp()
+    try:
+        print(f"📦 previous_matches data formats with {vehicles:,} tracked vehicles (best of {repeat})")
+        print("=" * 64)
+        print(f"{'format':>10} {'size MB':>10} {'vs json':>9} {'save ms':>10} {'load ms':>10}")
+        baseline = None
+        for data_format in data_formats.available_formats():
+            path = os.path.join(workdir, f"previous_matches{data_formats.FORMAT_EXTENSIONS[data_format]}")
+            save_ms = best_of(repeat, lambda: write_data_atomically(path, data, data_format))
+            load_ms = best_of(repeat, lambda: data_formats.read_data_file(path))
+
+            loaded = data_formats.read_data_file(path)
+            if loaded['previous_matches'] != data['previous_matches']:
+                print(f"❌ {data_format}: round trip changed the data")
+
+            size = os.path.getsize(path)
+            baseline = baseline or size
+            print(f"{data_format:>10} {size / 1024 / 1024:>10.1f} {size / baseline:>8.0%} "
+                  f"{save_ms:>10.1f} {load_ms:>10.1f}")
+
+        missing = set(data_formats.DATA_FORMATS) - set(data_formats.available_formats())
+        if missing:
+            print(f"⚠️  Skipped (package not installed): {', '.join(sorted(missing))}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark previous_matches data formats')
+    parser.add_argument('--vehicles', type=int, default=100000, help='Tracked vehicles in the synthetic dataset')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per measurement')
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    benchmark(args.vehicles, args.repeat)
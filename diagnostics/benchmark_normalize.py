@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Throughput (records/sec) of the shared normalization parsers against the
+inline regex parsing they replaced in scraper.py, structured_data.py and
+convert_data.py
+"""
+
+import sys
+import os
+import re
+import time
+import argparse
+from datetime import datetime
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import normalize
+from benchmark_storage import synthetic_match
+
+TRIMS = ['Sport', 'Sport Touring', 'EX', 'LX', 'Hybrid Sport', 'Touring']
+
+def synthetic_records(count: int) -> list:
+    """Scraped-looking records: titles without a year field half the time, odometer text, mixed trims"""
+    now = datetime.now()
+    records = []
+    for index in range(count):
+        record = synthetic_match(index, now)
+        record['title'] = f"{record['year']} Honda Civic {TRIMS[index % len(TRIMS)]}"
+        record['mileage'] = f"{(index * 37) % 90000:,} mi"
+        if index % 2:
+            del record['year']
+        records.append(record)
+    return records
+
+def legacy_fields(vehicle: dict) -> dict:
+    """The same fields parsed the way the call sites did before, with inline re.search / re.sub"""
+    title = vehicle.get('title') or ''
+    url = vehicle.get('url') or ''
+
+    year = None
+    if vehicle.get('year'):
+        match = re.search(r'(19|20)\d{2}', str(vehicle['year']))
+        year = int(match.group()) if match else None
+    if not year:
+        match = re.search(r'\b(20[0-2]\d)\b', title) or re.search(r'/(20[0-2]\d)-', url)
+        year = int(match.group(1)) if match else None
+
+    price = None
+    digits = re.sub(r'[^\d.]', '', str(vehicle.get('price') or ''))
+    if digits:
+        price = int(float(digits)) * 100
+
+    digits = re.sub(r'[^\d]', '', vehicle.get('mileage') or '')
+    mileage = int(digits) if digits else None
+
+    match = re.search(r'\b([A-HJ-NPR-Z0-9]{17})\b', str(vehicle.get('vin') or url), re.I)
+    vin = match.group(1).upper() if match else None
+
+    title_lower = title.lower()
+    trim = vehicle.get('trim')
+    if not trim:
+        for name in ('hybrid', 'sport', 'touring', 'ex', 'lx'):
+            if name in title_lower:
+                trim = name.upper() if len(name) == 2 else name.title()
+                break
+
+    return {'year': year, 'price_cents': price, 'mileage': mileage, 'vin': vin, 'trim': trim}
+
+def clear_caches():
+    for parser in (normalize.parse_year, normalize._price_text_cents, normalize.parse_trim):
+        parser.cache_clear()
+
+def records_per_second(function, records: list) -> float:
+    start = time.perf_counter()
+    for record in records:
+        function(record)
+    return len(records) / (time.perf_counter() - start)
+
+def benchmark(count: int, repeat: int):
+    records = synthetic_records(count)
+
+    mismatches = sum(1 for record in records
+                     if normalize.normalized_fields(record)['price_cents'] != legacy_fields(record)['price_cents']
+                     or normalize.normalized_fields(record)['year'] != legacy_fields(record)['year'])
+    clear_caches()
+
+    print(f"🔤 Normalizing {count:,} records: year, price (cents), mileage, VIN, trim (best of {repeat})")
+    print("=" * 60)
+    results = {
+        'inline regexes': max(records_per_second(legacy_fields, records) for _ in range(repeat)),
+        'normalize (cold cache)': max((clear_caches(), records_per_second(normalize.normalized_fields, records))[1]
+                                      for _ in range(repeat)),
+        'normalize (warm cache)': max(records_per_second(normalize.normalized_fields, records)
+                                      for _ in range(repeat)),
+    }
+    baseline = results['inline regexes']
+    for label, rate in results.items():
+        print(f"{label:>24}: {rate:>12,.0f} records/sec  ({rate / baseline:.1f}x)")
+    print(f"{'year/price disagreements':>24}: {mismatches}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark the shared year/price/VIN/mileage/trim parsers')
+    parser.add_argument('--records', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    benchmark(args.records, args.repeat)
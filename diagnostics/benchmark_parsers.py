@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+"""
+Golden-file check and benchmark for the HTML parser backends and restricted parsing
+
+Every backend, with and without the restricted (SoupStrainer) mode, must extract
+exactly the vehicles recorded in corpus/golden.json for each saved SRP page.
+Timing reports parse + extract ms/page; peak RSS is measured in a fresh
+subprocess per configuration so the numbers don't bleed into each other.
+"""
+
+import sys
+import os
+import json
+import time
+import resource
+import tracemalloc
+import logging
+import argparse
+import subprocess
+
+# Add src directory to path
+DIAGNOSTICS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(os.path.dirname(DIAGNOSTICS_DIR), 'src'))
+
+from scraper import HondaScraper
+from html_parsers import available_backends
+from stub_server import build_srp_page
+
+CORPUS_DIR = os.path.join(DIAGNOSTICS_DIR, 'corpus')
+GOLDEN_FILE = os.path.join(CORPUS_DIR, 'golden.json')
+CORPUS_BASE_URL = 'https://www.leithhonda.com/used-inventory/index.htm?make=Honda&model=Civic'
+REFERENCE_BACKEND = 'html.parser'
+
+def load_corpus() -> dict:
+    """Load saved SRP pages as {filename: bytes}"""
+    corpus = {}
+    for filename in sorted(os.listdir(CORPUS_DIR)):
+        if filename.endswith('.html'):
+            with open(os.path.join(CORPUS_DIR, filename), 'rb') as f:
+                corpus[filename] = f.read()
+    return corpus
+
+def make_scraper(configuration: str) -> HondaScraper:
+    """Build a scraper from a 'backend' or 'backend+strainer' label"""
+    backend, _, mode = configuration.partition('+')
+    return HondaScraper(parser=backend, restricted_parse=(mode == 'strainer'), concurrent=False, use_cache=False)
+
+def configurations(backends) -> list:
+    return [f"{backend}{mode}" for backend in backends for mode in ('', '+strainer')]
+
+def extract(configuration: str, content: bytes) -> list:
+    return make_scraper(configuration).parse_search_page(content, CORPUS_BASE_URL)
+
+def update_golden():
+    corpus = load_corpus()
+    golden = {filename: extract(REFERENCE_BACKEND, content) for filename, content in corpus.items()}
+    with open(GOLDEN_FILE, 'w') as f:
+        json.dump(golden, f, indent=2, sort_keys=True)
+    print(f"📝 Wrote golden results for {len(golden)} pages using {REFERENCE_BACKEND}")
+
+def check_golden(backends) -> bool:
+    """Compare every backend's extraction with the golden file"""
+    with open(GOLDEN_FILE, 'r') as f:
+        golden = json.load(f)
+    corpus = load_corpus()
+
+    print("🥇 Golden-file extraction check")
+    print("=" * 60)
+    all_match = True
+    for configuration in configurations(backends):
+        mismatches = [filename for filename, content in corpus.items()
+                      if extract(configuration, content) != golden.get(filename)]
+        all_match = all_match and not mismatches
+        status = '✅ identical' if not mismatches else f"❌ differs on {', '.join(mismatches)}"
+        print(f"{configuration:>22}: {status}")
+    return all_match
+
+def benchmark_pages() -> dict:
+    """Saved corpus plus large synthetic SRP pages with a typical embedded JSON blob, with and without JSON-LD"""
+    pages = load_corpus()
+    pages['synthetic_500_vehicles.html'] = build_srp_page('used', 'Civic', 500, script_kb=512).encode('utf-8')
+    pages['synthetic_500_jsonld.html'] = build_srp_page('used', 'Civic', 500, script_kb=512, structured=True).encode('utf-8')
+    return pages
+
+def time_configuration(configuration: str, pages: dict, repeats: int) -> dict:
+    scraper = make_scraper(configuration)
+    timings = {}
+    for filename, content in pages.items():
+        start = time.perf_counter()
+        for _ in range(repeats):
+            scraper.parse_search_page(content, CORPUS_BASE_URL)
+        timings[filename] = (time.perf_counter() - start) / repeats * 1000
+    return timings
+
+def measure_memory(configuration: str) -> tuple:
+    """Run a parsing worker in a subprocess and return (retained tree bytes, peak RSS in KB)"""
+    output = subprocess.check_output([sys.executable, __file__, '--rss-worker', configuration], text=True)
+    retained, peak_rss = output.strip().splitlines()[-1].split()
+    return int(retained), int(peak_rss)
+
+def rss_worker(configuration: str):
+    retained = 0
+    if configuration != 'none':
+        pages = benchmark_pages()
+        scraper = make_scraper(configuration)
+        tracemalloc.start()
+        soups = [scraper.parse_html(content, restricted=scraper.restricted_parse) for content in pages.values()]
+        retained = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+    print(retained, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+def benchmark(backends, repeats: int):
+    pages = benchmark_pages()
+    labels = configurations(backends)
+    baseline_rss = measure_memory('none')[1]
+
+    print(f"\n⏱️  Parse + extract time (ms/page, mean of {repeats}), retained tree size and peak RSS above baseline")
+    print("=" * (32 + 22 * len(labels)))
+    print(f"{'page':<32}" + ''.join(f"{label:>22}" for label in labels))
+
+    results = {label: time_configuration(label, pages, repeats) for label in labels}
+    for filename in pages:
+        print(f"{filename:<32}" + ''.join(f"{results[label][filename]:>22.2f}" for label in labels))
+
+    memory = {label: measure_memory(label) for label in labels}
+    print(f"{'retained trees (MB)':<32}" + ''.join(f"{memory[label][0] / 1024 / 1024:>22.2f}" for label in labels))
+    print(f"{'peak RSS delta (MB)':<32}" + ''.join(
+        f"{(memory[label][1] - baseline_rss) / 1024:>22.1f}" for label in labels
+    ))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Check and benchmark HTML parser backends')
+    parser.add_argument('--update-golden', action='store_true', help=f'Regenerate golden.json with {REFERENCE_BACKEND}')
+    parser.add_argument('--repeats', type=int, default=20)
+    parser.add_argument('--rss-worker', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+
+    if args.rss_worker:
+        rss_worker(args.rss_worker)
+    elif args.update_golden:
+        update_golden()
+    else:
+        backends = available_backends()
+        identical = check_golden(backends)
+        benchmark(backends, args.repeats)
+        sys.exit(0 if identical else 1)
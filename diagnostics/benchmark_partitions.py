@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Benchmark retention cleanup and recent-match queries on large histories: the
+single JSON file, the SQLite store and day / week partitions
+"""
+
+import sys
+import os
+import gc
+import time
+import shutil
+import logging
+import argparse
+import tempfile
+from datetime import datetime
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from data_manager import DataManager
+from storage import JsonStore, SqliteStore, PartitionedStore, empty_data
+from benchmark_storage import synthetic_match
+
+STORES = {
+    'json': lambda path: JsonStore(path + '.json', data_format='json-min'),
+    'sqlite': lambda path: SqliteStore(path + '.db'),
+    'day partitions': lambda path: PartitionedStore(path + '.day', granularity='day'),
+    'week partitions': lambda path: PartitionedStore(path + '.week', granularity='week')
+}
+
+def timed(function) -> tuple:
+    start = time.perf_counter()
+    result = function()
+    return (time.perf_counter() - start) * 1000, result
+
+def seed(store, data: dict):
+    if isinstance(store, SqliteStore):
+        with store.conn:
+            store.reset(data)
+    else:
+        store.reset(data)
+        store.save()
+
+def benchmark(tracked: int, recent_days: int, keep_days: int):
+    now = datetime.now()
+    data = {**empty_data(), 'previous_matches': [synthetic_match(i, now) for i in range(tracked)]}
+    workdir = tempfile.mkdtemp()
+    try:
+        print(f"🗂️  Cleanup and recent matches with {tracked:,} tracked vehicles over 31 days")
+        print(f"   recent = get_recent_matches({recent_days}); cleanup = cleanup_old_matches({keep_days}) including its save")
+        print("=" * 84)
+        print(f"{'store':>16} {'open ms':>10} {'recent ms':>11} {'recent':>9} {'cleanup ms':>12} {'removed':>9}")
+        for label, open_store in STORES.items():
+            path = os.path.join(workdir, 'previous_matches')
+            seeded = open_store(path)
+            seed(seeded, data)
+            if isinstance(seeded, SqliteStore):
+                seeded.close()
+            del seeded
+            gc.collect()
+
+            data_manager = DataManager('json', os.path.join(workdir, 'unused.json'))
+            open_ms, data_manager.store = timed(lambda: open_store(path))
+            recent_ms, recent = timed(lambda: data_manager.get_recent_matches(recent_days))
+            count = data_manager.store.count()
+            cleanup_ms, _ = timed(lambda: data_manager.cleanup_old_matches(keep_days))
+            removed = count - data_manager.store.count()
+            print(f"{label:>16} {open_ms:>10.1f} {recent_ms:>11.1f} {len(recent):>9,} {cleanup_ms:>12.1f} {removed:>9,}")
+
+            if isinstance(data_manager.store, SqliteStore):
+                data_manager.store.close()
+            del data_manager, recent
+            gc.collect()
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark partitioned cleanup and recent-match queries')
+    parser.add_argument('--tracked', type=int, default=1000000, help='Tracked vehicles in the synthetic history')
+    parser.add_argument('--recent-days', type=int, default=7)
+    parser.add_argument('--keep-days', type=int, default=30)
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    benchmark(args.tracked, args.recent_days, args.keep_days)
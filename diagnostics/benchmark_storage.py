@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Benchmark DataManager storage backends: open, dedupe, add and cleanup cost at
+increasing numbers of tracked vehicles for the JSON file and the SQLite store
+"""
+
+import sys
+import os
+import gc
+import time
+import shutil
+import logging
+import argparse
+import tempfile
+from datetime import datetime, timedelta
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from data_manager import DataManager
+from storage import create_store, empty_data
+
+BACKENDS = {'json': 'previous_matches.json', 'sqlite': 'previous_matches.db'}
+
+def synthetic_match(index: int, now: datetime) -> dict:
+    """A tracked vehicle shaped like the scraper's output, first seen within the last 31 days"""
+    vin = f"2HGFE{index:012d}"
+    return {
+        'title': f"{2016 + index % 10} Honda Civic Sport",
+        'url': f"https://www.leithhonda.com/used/Honda/{2016 + index % 10}-Honda-Civic-{vin}.htm",
+        'make': 'Honda',
+        'model': 'Civic',
+        'year': str(2016 + index % 10),
+        'price': f"${18995 + index % 12000:,}",
+        'vin': vin,
+        'dealership': 'Leith Honda Raleigh',
+        'location': 'Raleigh, NC',
+        'inventory_type': 'used',
+        'id': f"vin_{vin}",
+        'first_seen': (now - timedelta(minutes=index % (31 * 24 * 60))).isoformat()
+    }
+
+def seed_store(backend: str, path: str, count: int, now: datetime):
+    """Write `count` tracked vehicles straight into a fresh store"""
+    store = create_store(backend, path)
+    store.reset({**empty_data(), 'search_history': []})
+    store.add_matches(synthetic_match(i, now) for i in range(count))
+    store.save()
+    if backend == 'sqlite':
+        store.close()
+
+def timed(operation):
+    start = time.perf_counter()
+    result = operation()
+    return (time.perf_counter() - start) * 1000, result
+
+def benchmark_backend(backend: str, count: int, batch: int, workdir: str) -> dict:
+    """Time one search run's worth of DataManager work against a store of `count` vehicles"""
+    now = datetime.now()
+    path = os.path.join(workdir, BACKENDS[backend])
+    seed_store(backend, path, count, now)
+    gc.collect()
+
+    # Half of the batch is already tracked, half is new
+    current = [synthetic_match(i, now) for i in range(batch // 2)]
+    current += [synthetic_match(count + i, now) for i in range(batch - batch // 2)]
+    for vehicle in current:
+        del vehicle['id'], vehicle['first_seen']
+
+    results = {}
+    results['open'], data_manager = timed(lambda: DataManager(backend, path))
+    results['dedupe'], new_vehicles = timed(lambda: data_manager.get_new_vehicles(current))
+    results['add'], _ = timed(lambda: data_manager.add_vehicles(new_vehicles))
+    results['cleanup'], _ = timed(lambda: data_manager.cleanup_old_matches(30))
+    results['size_mb'] = data_manager.store.size_bytes() / 1024 / 1024
+    results['new'] = len(new_vehicles)
+    del data_manager
+    gc.collect()
+    return results
+
+def benchmark(sizes, batch: int):
+    print("🗄️  DataManager storage backends (ms per operation, one search run's worth of work)")
+    print(f"   dedupe/add batch of {batch} vehicles, half already tracked; cleanup of matches older than 30 days")
+    print("=" * 86)
+    print(f"{'tracked':>10} {'backend':>8} {'open':>10} {'dedupe':>10} {'add':>10} {'cleanup':>10} {'file MB':>10} {'new':>6}")
+
+    for count in sizes:
+        for backend in BACKENDS:
+            workdir = tempfile.mkdtemp()
+            try:
+                r = benchmark_backend(backend, count, batch, workdir)
+            finally:
+                shutil.rmtree(workdir, ignore_errors=True)
+            print(f"{count:>10,} {backend:>8} {r['open']:>10.1f} {r['dedupe']:>10.1f} {r['add']:>10.1f} "
+                  f"{r['cleanup']:>10.1f} {r['size_mb']:>10.1f} {r['new']:>6}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Benchmark the JSON and SQLite DataManager backends')
+    parser.add_argument('--sizes', default='10000,100000,1000000', help='Comma-separated tracked vehicle counts')
+    parser.add_argument('--batch', type=int, default=200, help='Vehicles found per simulated search')
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    benchmark([int(size) for size in args.sizes.split(',')], args.batch)
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Memory per 100k vehicles held as plain dicts (the old pipeline), as slotted
+Vehicle records and as a columnar VehicleBatch, plus the cost of converting
+"""
+
+import sys
+import os
+import gc
+import json
+import time
+import argparse
+import tracemalloc
+from datetime import datetime
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from vehicle import Vehicle, VehicleBatch
+from benchmark_storage import synthetic_match
+
+# Each form is built from the JSON text, as the data file is read, so every record gets its own strings
+FORMS = {
+    'dicts': lambda text: json.loads(text),
+    'Vehicle': lambda text: [Vehicle.from_dict(match) for match in json.loads(text)],
+    'VehicleBatch': lambda text: VehicleBatch.from_dicts(json.loads(text))
+}
+
+def measure(build, text: str) -> tuple:
+    """Bytes still allocated once the form is built (intermediate dicts freed), and untraced build time"""
+    gc.collect()
+    start = time.perf_counter()
+    vehicles = build(text)
+    seconds = time.perf_counter() - start
+    del vehicles
+    gc.collect()
+
+    tracemalloc.start()
+    baseline = tracemalloc.get_traced_memory()[0]
+    vehicles = build(text)
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0] - baseline
+    tracemalloc.stop()
+    del vehicles
+    return retained, seconds
+
+def benchmark(vehicles: int):
+    now = datetime.now()
+    text = json.dumps([synthetic_match(i, now) for i in range(vehicles)])
+    scale = 100000 / vehicles
+
+    print(f"🧮 Memory held by {vehicles:,} tracked vehicles (scaled to per 100k)")
+    print("=" * 60)
+    print(f"{'form':>14} {'MB / 100k':>12} {'bytes each':>12} {'vs dicts':>9} {'build ms':>10}")
+    baseline = None
+    for label, build in FORMS.items():
+        retained, seconds = measure(build, text)
+        baseline = baseline or retained
+        print(f"{label:>14} {retained * scale / 1024 / 1024:>12.1f} {retained / vehicles:>12.0f} "
+              f"{retained / baseline:>8.0%} {seconds * 1000:>10.1f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Compare memory of dict, Vehicle and VehicleBatch vehicles')
+    parser.add_argument('--vehicles', type=int, default=100000)
+    args = parser.parse_args()
+
+    benchmark(args.vehicles)
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Check the dashboard server's change feed with local clients: an SSE stream
+and a long-poll client follow dashboard updates written in-process and by
+another writer, and the deltas they receive rebuild the same match list as
+the files on disk
+"""
+
+import sys
+import os
+import json
+import time
+import shutil
+import logging
+import tempfile
+import threading
+import http.client
+import urllib.request
+from contextlib import redirect_stdout
+from datetime import datetime
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from web_updater import load_converter
+from dashboard_server import DashboardServer, notify_dashboard_updated
+from benchmark_storage import synthetic_match
+
+DEALERSHIPS = ['Leith Honda Raleigh', 'Leith Honda Aberdeen', 'AutoPark Honda']
+
+class EventStreamClient:
+    """Reads GET /events in a background thread, the way EventSource does"""
+
+    def __init__(self, base_url: str, last_event_id: int = None):
+        host, port = base_url.replace('http://', '').split(':')
+        self.conn = http.client.HTTPConnection(host, int(port), timeout=30)
+        headers = {'Last-Event-ID': str(last_event_id)} if last_event_id is not None else {}
+        self.conn.request('GET', '/events', headers=headers)
+        self.response = self.conn.getresponse()
+        self.changes = []
+        self.bytes_received = 0
+        self.received = threading.Condition()
+        threading.Thread(target=self._read, daemon=True).start()
+
+    def _read(self):
+        data = None
+        try:
+            for line in self.response:
+                self.bytes_received += len(line)
+                line = line.decode().rstrip('\n')
+                if line.startswith('data: '):
+                    data = json.loads(line[len('data: '):])
+                elif not line and data is not None:
+                    with self.received:
+                        self.changes.append(data)
+                        self.received.notify_all()
+                    data = None
+        except (OSError, ValueError):
+            pass  # Stream closed
+
+    def wait_for(self, count: int, timeout: float = 5.0) -> bool:
+        with self.received:
+            return self.received.wait_for(lambda: len(self.changes) >= count, timeout)
+
+    def close(self):
+        self.conn.close()
+
+def long_poll(base_url: str, cursor: int = None, timeout: float = 5.0) -> dict:
+    url = f"{base_url}/changes" + (f"?cursor={cursor}&timeout={timeout}" if cursor is not None else '')
+    with urllib.request.urlopen(url, timeout=timeout + 5) as response:
+        return json.loads(response.read())
+
+def new_vehicles(start: int, count: int) -> list:
+    vehicles = []
+    for index in range(start, start + count):
+        vehicle = synthetic_match(index, datetime.now())
+        vehicle['first_seen'] = datetime.now().isoformat()
+        vehicle['dealership'] = DEALERSHIPS[index % len(DEALERSHIPS)]
+        vehicles.append(vehicle)
+    return vehicles
+
+def apply_change(matches: list, change: dict, converter) -> list:
+    """What a client does with a change: drop the removed matches, add the new ones, keep newest first"""
+    removed = {tuple(key) for key in change['removed']}
+    kept = [match for match in matches if converter.entry_key(match) not in removed]
+    added = [match for page in change['added'].values() for match in page]
+    return sorted(added + kept, key=lambda match: match['found_date'], reverse=True)
+
+def quietly(function, *args):
+    """Run a converter function without its progress output"""
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        return function(*args)
+
+def check(label: str, ok: bool) -> bool:
+    print(f"   {label}: {'✅' if ok else '❌'}")
+    return ok
+
+def check_dashboard_server(tracked: int = 5000, added: int = 20):
+    converter = load_converter()
+    docs_dir = tempfile.mkdtemp()
+    data_dir = os.path.join(docs_dir, 'data')
+    now = datetime.now()
+    matches = [synthetic_match(index, now) for index in range(tracked)]
+    for index, match in enumerate(matches):
+        match['dealership'] = DEALERSHIPS[index % len(DEALERSHIPS)]
+    quietly(converter.convert_data_for_web, {'previous_matches': matches, 'total_searches': 1}, data_dir)
+
+    server = DashboardServer(port=0, docs_dir=docs_dir, watch_interval=0.2).start()
+    stream = None
+    try:
+        print(f"📡 Dashboard change feed check ({tracked:,} matches, {added} added per run)")
+        print("=" * 60)
+        with urllib.request.urlopen(f"{server.base_url}/data/manifest.json") as response:
+            manifest = json.loads(response.read())
+        check("Static manifest served", manifest['vehicles_tracked'] == tracked)
+        client_matches = converter.read_web_data(data_dir)[0]['matches']
+
+        cursor = long_poll(server.base_url)['cursor']
+        stream = EventStreamClient(server.base_url)
+        poll_result = {}
+        poller = threading.Thread(target=lambda: poll_result.update(long_poll(server.base_url, cursor)))
+        poller.start()
+        time.sleep(0.2)  # Both clients are waiting before the run writes
+
+        # 1. A run in this process: update the dashboard, then notify as update_web_dashboard does
+        start = time.perf_counter()
+        quietly(converter.update_web_data_incrementally, new_vehicles(tracked, added), {'total_searches': 2}, 30, data_dir)
+        notify_dashboard_updated()
+        stream.wait_for(1)
+        latency = (time.perf_counter() - start) * 1000
+        poller.join(10)
+
+        change = stream.changes[0] if stream.changes else {}
+        print(f"In-process run: event {latency:.0f} ms after the update started")
+        check("SSE client got one change", len(stream.changes) == 1 and not change.get('reset'))
+        check("Long-poll client got the same change", poll_result.get('changes') == [change])
+        check(f"Change lists {added} added matches",
+              sum(len(page) for page in change.get('added', {}).values()) == added)
+        client_matches = apply_change(client_matches, change, converter)
+        on_disk = converter.read_web_data(data_dir)[0]['matches']
+        check("Delta applied by the client equals the files",
+              [converter.entry_key(match) for match in client_matches] == [converter.entry_key(match) for match in on_disk])
+        shard_bytes = sum(os.path.getsize(os.path.join(data_dir, page['file'])) for page in change.get('pages', []))
+        print(f"   bytes pushed {len(json.dumps(change)):,} vs {shard_bytes:,} in the changed pages "
+              f"(full dashboard {sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(data_dir) for name in names):,})")
+
+        # 2. A run written by another process: the manifest watcher notices it
+        start = time.perf_counter()
+        quietly(converter.update_web_data_incrementally, new_vehicles(tracked + added, added), {'total_searches': 3}, 30, data_dir)
+        stream.wait_for(2)
+        print(f"Run written elsewhere: event {(time.perf_counter() - start) * 1000:.0f} ms later (watch interval 200 ms)")
+        if check("SSE client got the second change", len(stream.changes) == 2):
+            client_matches = apply_change(client_matches, stream.changes[1], converter)
+            on_disk = converter.read_web_data(data_dir)[0]['matches']
+            check("Client still equals the files", [converter.entry_key(m) for m in client_matches] ==
+                  [converter.entry_key(m) for m in on_disk])
+
+        # 3. Resuming and resetting
+        resumed = EventStreamClient(server.base_url, last_event_id=stream.changes[0]['cursor'])
+        resumed.wait_for(1)
+        resumed.close()
+        check("Reconnect with Last-Event-ID replays only the missed change",
+              [c['cursor'] for c in resumed.changes] == [stream.changes[1]['cursor']])
+        stale = long_poll(server.base_url, cursor=-10, timeout=0)
+        check("Unknown cursor gets a reset", stale['changes'][0].get('reset') is True)
+        quietly(converter.convert_data_for_web, {'previous_matches': matches, 'total_searches': 4}, data_dir)
+        notify_dashboard_updated()
+        stream.wait_for(3)
+        check(f"Rebuild without the new matches is a delta removing {2 * added}",
+              len(stream.changes) == 3 and len(stream.changes[2].get('removed', [])) == 2 * added)
+        oldest = min(matches, key=lambda match: match['first_seen'])
+        quietly(converter.convert_data_for_web, {'previous_matches': [m for m in matches if m is not oldest]}, data_dir)
+        notify_dashboard_updated()
+        stream.wait_for(4)
+        check("Rebuild that shifts every page is pushed as a reset", len(stream.changes) == 4 and stream.changes[3]['reset'])
+        check("Idle long-poll times out empty", long_poll(server.base_url, server.feed.cursor, timeout=0.5)['changes'] == [])
+        print(f"   bytes on the event stream: {stream.bytes_received:,}")
+    finally:
+        if stream:
+            stream.close()
+        server.stop()
+        shutil.rmtree(docs_dir, ignore_errors=True)
+
+if __name__ == "__main__":
+    logging.getLogger().setLevel(logging.WARNING)
+    check_dashboard_server()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Crash-recovery check for the journaled DataManager store
+
+Worker subprocesses write to a journaled store and are killed mid-run. The
+parent reloads the store and checks that every save reported as committed is
+present exactly once, that a torn final journal line is tolerated, and that a
+crash between writing a compacted snapshot and emptying the journal does not
+replay records twice. Also compares the cost of one save with the plain JSON store.
+"""
+
+import sys
+import os
+import time
+import signal
+import shutil
+import logging
+import argparse
+import tempfile
+import subprocess
+from datetime import datetime
+
+# Add src directory to path
+DIAGNOSTICS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(os.path.dirname(DIAGNOSTICS_DIR), 'src'))
+
+import storage
+from data_manager import DataManager
+from storage import JournalStore, JsonStore
+
+def vehicle(index: int) -> dict:
+    vin = f"2HGFE{index:012d}"
+    return {'title': f"Honda Civic {index}", 'vin': vin, 'url': f"https://example.test/used/{vin}.htm"}
+
+def open_manager(path: str, compact_records: int) -> DataManager:
+    data_manager = DataManager('json', path)
+    data_manager.store = JournalStore(path, compact_records=compact_records)
+    return data_manager
+
+def worker(path: str, compact_records: int, crash_in_compaction: bool):
+    """Add one vehicle per save forever, printing each index once its save has returned"""
+    if crash_in_compaction:
+        # Die right after the new snapshot is renamed into place, before the journal is emptied
+        storage.fsync_directory = lambda path: os._exit(3)
+
+    data_manager = open_manager(path, compact_records)
+    index = data_manager.store.count()
+    while True:
+        data_manager.add_vehicles([vehicle(index)])
+        data_manager.update_search_stats(1)
+        print(index, flush=True)
+        index += 1
+
+def run_worker(path: str, compact_records: int, commits: int, crash_in_compaction: bool = False) -> list:
+    """Start a worker, SIGKILL it after `commits` committed saves (or let it crash), return committed indexes"""
+    command = [sys.executable, __file__, '--worker', path, '--compact-records', str(compact_records)]
+    if crash_in_compaction:
+        command.append('--crash-in-compaction')
+    process = subprocess.Popen(command, stdout=subprocess.PIPE, text=True)
+    committed = []
+    for line in process.stdout:
+        committed.append(int(line))
+        if len(committed) >= commits:
+            process.send_signal(signal.SIGKILL)
+            break
+    process.wait()
+    return committed
+
+def check(label: str, passed: bool, detail: str = '') -> bool:
+    print(f"{'✅' if passed else '❌'} {label}{f' ({detail})' if detail else ''}")
+    return passed
+
+def stored_indexes(path: str, compact_records: int) -> list:
+    store = open_manager(path, compact_records).store
+    return [int(match['vin'][5:]) for match in store.all_matches()]
+
+def check_recovery(compact_records: int) -> bool:
+    workdir = tempfile.mkdtemp()
+    path = os.path.join(workdir, 'previous_matches.json')
+    results = []
+    try:
+        print("🧾 Journal crash-recovery check")
+        print("=" * 60)
+
+        committed = run_worker(path, compact_records, commits=compact_records * 3 + 7)
+        stored = stored_indexes(path, compact_records)
+        results.append(check("SIGKILL mid-run: every committed vehicle survives",
+                             set(committed) <= set(stored), f"{len(committed)} committed, {len(stored)} stored"))
+        results.append(check("SIGKILL mid-run: no vehicle replayed twice", len(stored) == len(set(stored))))
+        searches = open_manager(path, compact_records).get_stats()['total_searches']
+        results.append(check("Search counter matches committed runs", searches >= len(committed),
+                             f"{searches} searches"))
+
+        with open(path + '.journal', 'ab') as f:
+            f.write(b'{"op":"add","match":{"title":"torn","vin":"2HGFE')
+        stored_after_tear = stored_indexes(path, compact_records)
+        results.append(check("Torn final line is dropped on load", stored_after_tear == stored))
+        data_manager = open_manager(path, compact_records)
+        data_manager.add_vehicles([vehicle(10 ** 6)])
+        results.append(check("Appends after a torn line replay cleanly",
+                             stored_indexes(path, compact_records) == stored + [10 ** 6]))
+
+        before = stored_indexes(path, compact_records)
+        committed = run_worker(path, compact_records, commits=compact_records * 3, crash_in_compaction=True)
+        stored = stored_indexes(path, compact_records)
+        results.append(check("Crash between snapshot rename and journal truncate: nothing lost",
+                             set(before) | set(committed) <= set(stored), f"{len(committed)} committed before crash"))
+        results.append(check("Crash between snapshot rename and journal truncate: nothing doubled",
+                             len(stored) == len(set(stored))))
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+    return all(results)
+
+def benchmark_save(history: int):
+    """Time adding one vehicle to a store that already tracks `history` vehicles"""
+    print(f"\n⏱️  One add_vehicles() save with {history:,} vehicles already tracked")
+    print("=" * 60)
+    workdir = tempfile.mkdtemp()
+    try:
+        now = datetime.now().isoformat()
+        for label, store_class in (('json', JsonStore), ('journal', JournalStore)):
+            path = os.path.join(workdir, f"{label}.json")
+            seed = store_class(path)
+            seed.add_matches([{**vehicle(i), 'id': f"vin_{i}", 'first_seen': now} for i in range(history)])
+            if label == 'journal':
+                seed.compact()
+            else:
+                seed.save()
+
+            data_manager = DataManager('json', path)
+            data_manager.store = store_class(path)
+            start = time.perf_counter()
+            data_manager.add_vehicles([vehicle(history)])
+            print(f"{label:>8}: {(time.perf_counter() - start) * 1000:>9.2f} ms")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Crash-recovery check for the journaled data store')
+    parser.add_argument('--compact-records', type=int, default=50)
+    parser.add_argument('--history', type=int, default=50000, help='Tracked vehicles for the save benchmark')
+    parser.add_argument('--worker', help=argparse.SUPPRESS)
+    parser.add_argument('--crash-in-compaction', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.ERROR)
+
+    if args.worker:
+        worker(args.worker, args.compact_records, args.crash_in_compaction)
+    else:
+        passed = check_recovery(args.compact_records)
+        benchmark_save(args.history)
+        sys.exit(0 if passed else 1)
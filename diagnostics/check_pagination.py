@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Check search result pagination against local stub dealers with multi-page inventories
+
+Compares page-1-only results, following pages one at a time and fetching pages
+in per-host waves, and checks that a repeat run with every vehicle already
+tracked still looks past page 1 but stops after the first wave of later pages.
+"""
+
+import sys
+import os
+import time
+import logging
+import argparse
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from scraper import HondaScraper
+from pagination import vehicle_keys
+from transport import Transport
+from stub_server import StubDealerServer
+
+def run(label: str, scraper, servers, expected: int = None):
+    """Run one search and print requests, time and unique vehicles found"""
+    before = sum(server.request_count for server in servers)
+    start = time.perf_counter()
+    vehicles = scraper.search_vehicles()
+    elapsed = time.perf_counter() - start
+    served = sum(server.request_count for server in servers) - before
+
+    unique = {(vehicle['dealership'], vehicle.get('vin') or vehicle.get('url')) for vehicle in vehicles}
+    status = ''
+    if expected is not None:
+        status = '✅' if len(vehicles) == len(unique) == expected else f"❌ expected {expected}"
+    stats = scraper.get_stats()
+    print(f"{label:<26} {served:>9} {elapsed:>9.2f} {len(vehicles):>9} {stats['pagination_stops']:>7}  {status}")
+    return vehicles
+
+def check_pagination(dealers: int, total: int, page_size: int, delay: float, per_host: int):
+    servers = [
+        StubDealerServer(delay=delay, vehicles_per_page=page_size, seed=i, total_vehicles=total).start()
+        for i in range(dealers)
+    ]
+    try:
+        locations = {f"stub_{i}": server.location_info(f"Stub Honda {i}") for i, server in enumerate(servers)}
+        searches = dealers * 2 * 2  # new + used, Civic + Civic Hybrid
+        expected = searches * total
+
+        print("📄 Search result pagination check")
+        print(f"   {dealers} dealers | {total} vehicles per search in pages of {page_size} | "
+              f"{delay * 1000:.0f} ms latency | {per_host} per host")
+        print("=" * 72)
+        print(f"{'mode':<26} {'requests':>9} {'seconds':>9} {'vehicles':>9} {'stops':>7}")
+
+        def scraper(**kwargs):
+            # No per-host pacing: this compares fetch strategies, not dealer politeness
+            return HondaScraper(locations=locations, per_host=per_host, use_cache=False,
+                                transport=Transport(rate=0), **kwargs)
+
+        run('page 1 only', scraper(paginate=False), servers)
+        run('serial, page by page', scraper(concurrent=False), servers, expected)
+        vehicles = run('parallel page waves', scraper(), servers, expected)
+
+        tracked = scraper()
+        for vehicle in vehicles:
+            tracked.known_keys.update(vehicle_keys(vehicle))
+        run('all vehicles tracked', tracked, servers)
+        first_wave = min(per_host, -(-total // page_size) - 1)
+        stats = tracked.get_stats()
+        print(f"   Page 2 still fetched, stopped after the first wave on every search: "
+              f"{'✅' if stats['extra_pages'] == searches * first_wave and stats['pagination_stops'] == searches else '❌'}")
+    finally:
+        for server in servers:
+            server.stop()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Check search result pagination against stub dealers')
+    parser.add_argument('--dealers', type=int, default=3)
+    parser.add_argument('--total', type=int, default=60, help='Vehicles per search')
+    parser.add_argument('--page-size', type=int, default=12)
+    parser.add_argument('--delay', type=float, default=0.1, help='Simulated dealer latency in seconds')
+    parser.add_argument('--per-host', type=int, default=2)
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    check_pagination(args.dealers, args.total, args.page_size, args.delay, args.per_host)
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Check the response cache against local stub dealers: ETag / 304 revalidation and
+body-fingerprint reuse for dealers that send no validators, and which page changes
+the fingerprint ignores
+"""
+
+import sys
+import os
+import time
+import logging
+import tempfile
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from scraper import HondaScraper
+from response_cache import ResponseCache, fingerprint_content
+from stub_server import StubDealerServer
+
+def timed_search(locations: dict, cache_file: str):
+    """Run one search with a fresh scraper that shares the on-disk cache"""
+    scraper = HondaScraper(locations=locations, use_cache=False)
+    scraper.cache = ResponseCache(cache_file=cache_file)
+    start = time.perf_counter()
+    vehicles = scraper.search_vehicles()
+    return time.perf_counter() - start, vehicles, scraper.get_stats()['response_cache']
+
+def check_response_cache(location_count: int = 5, validators: bool = True):
+    servers = [StubDealerServer(vehicles_per_page=40, seed=i, validators=validators).start() for i in range(location_count)]
+    cache_file = os.path.join(tempfile.mkdtemp(), 'response_cache.json')
+    try:
+        locations = {f"stub_{i}": server.location_info(f"Stub Honda {i}") for i, server in enumerate(servers)}
+
+        print(f"♻️  Response cache check ({'ETag validators' if validators else 'no validators, fingerprint only'})")
+        print("=" * 60)
+        cold_time, cold_vehicles, cold_stats = timed_search(locations, cache_file)
+        print(f"Cold run:    {cold_time:.2f}s  {cold_stats}")
+
+        warm_time, warm_vehicles, warm_stats = timed_search(locations, cache_file)
+        print(f"Warm run:    {warm_time:.2f}s  {warm_stats}")
+        print(f"   Same vehicles as cold run: {'✅' if warm_vehicles == cold_vehicles else '❌'}")
+        print(f"   304 responses served: {sum(server.not_modified_count for server in servers)}")
+
+        servers[0].inventory_version += 1
+        changed_time, changed_vehicles, changed_stats = timed_search(locations, cache_file)
+        print(f"After change: {changed_time:.2f}s  {changed_stats}")
+        print(f"   Changed dealer re-parsed: {'✅' if changed_stats['misses'] == 4 else '❌'}")
+    finally:
+        for server in servers:
+            server.stop()
+
+def check_fingerprints():
+    """Timestamps and cache busters must not change the fingerprint; ids that look like timestamps must"""
+    page = ('<script>DDC.pageTimestamp = {ts}; var cfg = {{"ts": {ts}}};</script>'
+            '<script src="/inventory.js?_={ts}"></script>'
+            '<a href="/used/Honda/2022-Honda-Civic-{id}.htm" data-listing-id="{id}">2022 Honda Civic</a>')
+    base = fingerprint_content(page.format(ts=1712345678901, id=1712345678))
+    print("🔍 Body fingerprint")
+    print("=" * 60)
+    same = fingerprint_content(page.format(ts=1712349999999, id=1712345678)) == base
+    print(f"   New page timestamp and cache buster ignored: {'✅' if same else '❌'}")
+    changed = fingerprint_content(page.format(ts=1712345678901, id=1712345679)) != base
+    print(f"   New 10-digit listing id counts as changed: {'✅' if changed else '❌'}")
+
+if __name__ == "__main__":
+    logging.getLogger().setLevel(logging.WARNING)
+    check_response_cache(validators=True)
+    print()
+    check_response_cache(validators=False)
+    print()
+    check_fingerprints()
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Scheduler check on a simulated clock: cron expressions against a
+minute-by-minute scan, a simulated week of searches (default schedule plus a
+dealer on its own schedule) checked for exact start times and counted in
+wakeups per day, overlapping runs, and, on the real clock, how late a job
+starts and whether jobs due together run side by side.
+"""
+
+import sys
+import os
+import time
+import logging
+import argparse
+import threading
+from datetime import datetime, timedelta
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import scheduler
+from scheduler import CronExpression, EventScheduler, SearchScheduler, SimulatedClock
+
+EXPRESSIONS = [
+    '0 9 * * 1-5',
+    '*/30 9-16 * * mon-sat',
+    '15 8,12,18 1,15 * *',
+    '0 12 13 * fri',           # The 13th or any Friday, as cron reads it
+    '0 0 29 feb *',            # Leap days only
+    '5/20 */6 * jan,jul sun',
+]
+
+def check(label: str, ok: bool) -> bool:
+    print(f"   {label}: {'✅' if ok else '❌'}")
+    return ok
+
+def scan_matches(expression: CronExpression, start: datetime, count: int) -> list:
+    """The next `count` matching minutes found by trying every minute"""
+    found = []
+    moment = start.replace(second=0, microsecond=0)
+    while len(found) < count:
+        moment += timedelta(minutes=1)
+        if (moment.minute in expression.minutes and moment.hour in expression.hours and
+                moment.month in expression.months and expression.day_matches(moment)):
+            found.append(moment)
+    return found
+
+def check_expressions(start: datetime):
+    print("🗓️  Cron expressions vs a minute-by-minute scan")
+    for text in EXPRESSIONS:
+        expression = CronExpression(text)
+        expected = scan_matches(expression, start, 5)
+        moment, computed = start, []
+        for _ in range(5):
+            moment = expression.next_after(moment)
+            computed.append(moment)
+        check(f"{text:<24} next {computed[0]:%a %Y-%m-%d %H:%M}", computed == expected)
+    for bad in ('* * *', '60 * * * *', '0 25 * * *', '0 9 * * funday'):
+        try:
+            CronExpression(bad)
+            check(f"{bad!r} rejected", False)
+        except ValueError:
+            check(f"{bad!r} rejected", True)
+
+def simulate_week(start: datetime, days: int, dealer_schedule: str):
+    print(f"\n🧪 Simulated {days} days from {start:%a %Y-%m-%d}, one dealer on '{dealer_schedule}'")
+    clock = SimulatedClock(start)
+    calls = []
+
+    def search_function(locations=None):
+        calls.append((clock.now(), tuple(locations) if locations else None))
+
+    original = scheduler.DEALER_SCHEDULES
+    scheduler.DEALER_SCHEDULES = {'autopark_honda': dealer_schedule}
+    try:
+        search_scheduler = SearchScheduler(search_function, clock=clock, workers=0)
+    finally:
+        scheduler.DEALER_SCHEDULES = original
+    events = search_scheduler.scheduler
+    jobs = dict(events.jobs)
+    expected = {name: [] for name in jobs}
+    for name, job in jobs.items():
+        moment = job.next_run
+        while moment < start + timedelta(days=days):
+            expected[name].append(moment)
+            moment = job.next_after(moment)
+
+    events.run(until=start + timedelta(days=days))
+
+    dealer_calls = [moment for moment, locations in calls if locations == ('autopark_honda',)]
+    main_calls = [moment for moment, locations in calls if locations and 'autopark_honda' not in locations]
+    lateness = [seconds for job in jobs.values() for seconds in job.lateness]
+    started = {name: job.runs for name, job in jobs.items()}
+    check(f"Every job started at each due time ({sum(started.values())} starts)",
+          all(started[name] == len(times) for name, times in expected.items()))
+    check("Started exactly on time (0 s late)", lateness and max(lateness) == 0)
+    check(f"Dealer searched alone {len(dealer_calls)} times",
+          dealer_calls == expected['search:autopark_honda'])
+    check(f"Other dealers searched together {len(main_calls)} times, without autopark_honda",
+          len(main_calls) > 0 and all(moment in expected['search'] for moment in main_calls))
+    skipped = len(expected['search']) - len(main_calls)
+    print(f"   {skipped} of {len(expected['search'])} default runs fell outside BUSINESS_HOURS and were skipped "
+          f"(as before: SEARCH_TIMES includes the closing hour)")
+    print(f"   Wakeups: {events.wakeups / days:.0f}/day (max_sleep {events.max_sleep:.0f} s) "
+          f"vs 1,440/day polling every 60 s, which started runs up to 60 s late")
+
+def check_overlap(start: datetime):
+    print("\n⏭️  A run still going when the job falls due again")
+    clock = SimulatedClock(start)
+    release = threading.Event()
+    events = EventScheduler(clock, workers=1)
+    job = events.add_job('slow', '*/5 * * * *', lambda: release.wait(5))
+    runner = threading.Thread(target=events.run, kwargs={'until': start + timedelta(minutes=16)})
+    runner.start()
+    time.sleep(0.2)
+    release.set()
+    runner.join(10)
+    check(f"One run, {job.skipped} occurrences skipped while it ran", job.runs == 1 and job.skipped == 2)
+
+def check_real_clock(delay: float, work: float):
+    print(f"\n⏱️  Real clock: two jobs due in {delay:.1f} s, {work:.1f} s of work each, 2 workers")
+    events = EventScheduler(workers=2)
+    started = {}
+    finished = threading.Event()
+
+    def job(name):
+        started[name] = time.perf_counter()
+        time.sleep(work)
+        if len(started) == 2:
+            finished.set()
+
+    runner = threading.Thread(target=events.run, daemon=True)
+    runner.start()
+    time.sleep(0.1)  # The loop is asleep with no jobs before they are added
+    began = time.perf_counter()
+    due = events.clock.now() + timedelta(seconds=delay)
+    events.add_one_time_job('first', due, lambda: job('first'))
+    events.add_one_time_job('second', due, lambda: job('second'))
+    finished.wait(delay + 2 * work + 2)
+    total = time.perf_counter() - began
+    events.stop()
+    runner.join(5)
+
+    late = [(moment - began - delay) * 1000 for moment in started.values()]
+    check(f"Adding jobs woke the sleeping loop; started {max(late):.1f} ms after the due time",
+          len(late) == 2 and max(late) < 50)
+    check(f"Both ran side by side ({total:.2f} s in total)", total < delay + 2 * work)
+    check("One-time jobs removed after running", not events.jobs)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Check the event scheduler on a simulated and the real clock')
+    parser.add_argument('--days', type=int, default=7, help='Days to simulate')
+    parser.add_argument('--dealer-schedule', default='*/30 9-16 * * mon-sat')
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    monday = datetime(2026, 10, 12)
+    print("⏰ Event scheduler check")
+    print("=" * 60)
+    check_expressions(datetime(2026, 10, 18, 10, 7))
+    simulate_week(monday, args.days, args.dealer_schedule)
+    check_overlap(monday)
+    check_real_clock(0.3, 0.3)
@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Transport check against fault-injecting local stub dealers: per-host pacing,
+retries after 503s, Retry-After, no retries for a 404, the circuit breaker
+opening, skipping and closing again after a probe, opening on 403 block pages
+and on 429s without Retry-After, and full searches (both
+engines) with a flaky host and a hanging host next to healthy ones, compared
+with a transport that neither retries nor breaks circuits.
+"""
+
+import sys
+import os
+import time
+import logging
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from scraper import HondaScraper
+from async_scraper import AsyncHondaScraper
+from transport import Transport, CircuitBreaker
+from stub_server import StubDealerServer
+
+def check(label: str, ok: bool) -> bool:
+    print(f"   {label}: {'✅' if ok else '❌'}")
+    return ok
+
+def page_url(server: StubDealerServer, index: int = 0) -> str:
+    return f"{server.base_url}/used-inventory/index.htm?make=Honda&model=Civic&start={index}"
+
+def scraper_for(transport: Transport, locations: dict = None, engine: str = 'sync') -> HondaScraper:
+    if engine == 'async':
+        return AsyncHondaScraper(locations=locations or {}, use_cache=False, transport=transport)
+    return HondaScraper(locations=locations or {}, use_cache=False, transport=transport)
+
+def check_pacing(rate: float, burst: int, requests: int):
+    print(f"\n🪣 Pacing: {requests} requests to one host at {rate:g}/s, burst {burst}, 4 at a time")
+    with StubDealerServer(vehicles_per_page=2) as server:
+        scraper = scraper_for(Transport(rate=rate, burst=burst))
+        scraper.per_host = 4
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(lambda index: scraper.fetch(page_url(server, index)), range(requests)))
+        times = sorted(server.request_times)
+    paced = times[burst:]
+    spent = times[-1] - times[0]
+    expected = (requests - burst) / rate
+    observed = (len(paced) - 1) / (paced[-1] - paced[0]) if len(paced) > 1 else 0
+    stats = scraper.transport.get_stats()
+    check(f"First {burst} sent at once ({(times[burst - 1] - times[0]) * 1000:.0f} ms apart)",
+          times[burst - 1] - times[0] < 0.1)
+    check(f"Then {observed:.2f} requests/s after the burst (limit {rate:g}/s)", observed <= rate * 1.05)
+    check(f"All {requests} sent in {spent:.2f} s (ideal {expected:.2f} s), "
+          f"{stats['throttled_seconds']:.1f} s spent waiting for tokens", abs(spent - expected) < 0.25)
+
+def check_retries():
+    print("\n🔁 Retries")
+    with StubDealerServer(vehicles_per_page=2, faults=2) as server:
+        scraper = scraper_for(Transport(rate=0, retries=2, backoff=0.05))
+        response = scraper.fetch(page_url(server))
+        stats = scraper.transport.get_stats()
+        check(f"Two 503s then a page: fetched after {stats['retries']} retries, {server.request_count} requests",
+              response is not None and response.status_code == 200 and server.request_count == 3)
+        check("The host's circuit stayed closed", not stats['open_hosts'])
+
+    with StubDealerServer(vehicles_per_page=2, faults=1, fault_status=429, retry_after=0.5) as server:
+        scraper = scraper_for(Transport(rate=0, retries=2, backoff=0.01))
+        response = scraper.fetch(page_url(server))
+        gap = server.request_times[1] - server.request_times[0] if len(server.request_times) > 1 else 0
+        check(f"429 with Retry-After 0.5: retried {gap:.2f} s later", response is not None and gap >= 0.5)
+
+    with StubDealerServer(vehicles_per_page=2, faults=3) as server:
+        scraper = scraper_for(Transport(rate=0, retries=2, backoff=0.05, failure_threshold=10))
+        response = scraper.fetch(page_url(server))
+        check(f"Still 503 after every attempt: gave up after {server.request_count} requests",
+              response is None and server.request_count == 3)
+
+    with StubDealerServer(vehicles_per_page=2, faults=1, fault_status=404) as server:
+        scraper = scraper_for(Transport(rate=0, retries=2, failure_threshold=1))
+        response = scraper.fetch(page_url(server))
+        stats = scraper.transport.get_stats()
+        check("404 not retried and not counted against the host",
+              response is None and server.request_count == 1 and stats['failures'] == 0 and not stats['open_hosts'])
+
+def check_breaker(cooldown: float):
+    print(f"\n⛔ Circuit breaker: 3 failures open it for {cooldown:g} s")
+    with StubDealerServer(vehicles_per_page=2, down=True) as server:
+        transport = Transport(rate=0, retries=2, backoff=0.01, failure_threshold=3, cooldown=cooldown)
+        scraper = scraper_for(transport)
+        host = transport.host(server.base_url)
+        first = scraper.fetch(page_url(server))
+        check(f"Dead host: {server.request_count} attempts, then the circuit opened",
+              first is None and server.request_count == 3 and host.breaker.state == CircuitBreaker.OPEN)
+
+        before = server.request_count
+        for index in range(5):
+            scraper.fetch(page_url(server, index))
+        check(f"Next 5 fetches skipped without a request ({transport.get_stats()['short_circuited']} short-circuited)",
+              server.request_count == before and transport.get_stats()['short_circuited'] == 5)
+
+        time.sleep(cooldown)
+        before = server.request_count
+        scraper.fetch(page_url(server))
+        check("After the cooldown one probe was sent; it failed and reopened the circuit",
+              server.request_count == before + 1 and host.breaker.state == CircuitBreaker.OPEN)
+
+        server.down = False
+        time.sleep(cooldown)
+        response = scraper.fetch(page_url(server))
+        stats = transport.get_stats()['hosts'][host.host]
+        check(f"Host back: probe succeeded and closed the circuit ({stats['trips']} trips)",
+              response is not None and host.breaker.state == CircuitBreaker.CLOSED and stats['trips'] == 2)
+
+def check_blocking():
+    print("\n🚫 A host refusing the scraper")
+    with StubDealerServer(vehicles_per_page=2, faults=10, fault_status=403) as server:
+        transport = Transport(rate=0, retries=2, failure_threshold=3, cooldown=60)
+        scraper = scraper_for(transport)
+        results = [scraper.fetch(page_url(server, index)) for index in range(5)]
+        stats = transport.get_stats()
+        check(f"403 block page not retried, circuit open after {server.request_count} requests, "
+              f"{stats['short_circuited']} skipped",
+              not any(results) and server.request_count == 3 and stats['retries'] == 0 and stats['open_hosts'])
+
+    with StubDealerServer(vehicles_per_page=2, faults=3, fault_status=429) as server:
+        transport = Transport(rate=0, retries=2, backoff=0.01, failure_threshold=3, cooldown=60)
+        scraper_for(transport).fetch(page_url(server))
+        check(f"429 without Retry-After counted against the host (open after {server.request_count} requests)",
+              server.request_count == 3 and transport.get_stats()['open_hosts'])
+
+    with StubDealerServer(vehicles_per_page=2, faults=3, fault_status=429, retry_after=0.05) as server:
+        transport = Transport(rate=0, retries=3, backoff=0.01, failure_threshold=3, cooldown=60)
+        response = scraper_for(transport).fetch(page_url(server))
+        check("429 with Retry-After retried without opening the circuit",
+              response is not None and server.request_count == 4 and not transport.get_stats()['open_hosts'])
+
+def build_locations(servers: dict) -> dict:
+    """Two dealership entries on each stub host"""
+    locations = {}
+    for label, server in servers.items():
+        for i in range(2):
+            info = server.location_info(f"Stub {label} {i}")
+            info['new_url'] = f"{server.base_url}/new-inventory/{i}/index.htm"
+            info['used_url'] = f"{server.base_url}/used-inventory/{i}/index.htm"
+            locations[f"{label}_{i}"] = info
+    return locations
+
+def run_search(engine: str, transport: Transport, fault_rate: float, hang: float, timeout: float):
+    """One search over three healthy hosts, a flaky host and a hanging host"""
+    servers = {f"healthy{i}": StubDealerServer(vehicles_per_page=3, seed=i) for i in range(3)}
+    servers['flaky'] = StubDealerServer(vehicles_per_page=3, seed=10, fault_rate=fault_rate)
+    servers['hanging'] = StubDealerServer(vehicles_per_page=3, seed=20, delay=hang)
+    for server in servers.values():
+        server.start()
+    try:
+        scraper = scraper_for(transport, build_locations(servers), engine)
+        start = time.perf_counter()
+        vehicles = scraper.search_vehicles()
+        elapsed = time.perf_counter() - start
+        return {
+            'seconds': elapsed,
+            'vehicles': len(vehicles),
+            'by_dealer': {label: sum(1 for v in vehicles if v['dealership'].startswith(f"Stub {label} "))
+                          for label in servers},
+            'requests': {label: server.request_count for label, server in servers.items()},
+            'stats': scraper.get_stats()['transport']
+        }
+    finally:
+        for server in servers.values():
+            server.stop()
+
+def check_searches(engine: str, fault_rate: float, hang: float, timeout: float):
+    print(f"\n🏢 Full search ({engine} engine): 3 healthy hosts, 1 answering {fault_rate:.0%} with 503, "
+          f"1 hanging {hang:g} s (timeout {timeout:g} s)")
+    baseline = run_search(engine, Transport(rate=0, retries=0, failure_threshold=0, timeout=timeout),
+                          fault_rate, hang, timeout)
+    guarded = run_search(engine, Transport(rate=20, burst=4, retries=2, backoff=0.05, failure_threshold=3,
+                                           cooldown=60, timeout=timeout), fault_rate, hang, timeout)
+    expected = 2 * 4 * 3  # Two locations x four search URLs x three vehicles per host
+    for label, result in (('no retries, no breaker', baseline), ('transport', guarded)):
+        stats = result['stats']
+        print(f"   {label:<23} {result['seconds']:>6.2f} s | vehicles {result['vehicles']:>3} "
+              f"(flaky {result['by_dealer']['flaky']:>2}/{expected}) | hanging host hit {result['requests']['hanging']} times | "
+              f"retries {stats['retries']}, skipped {stats['short_circuited']}, open {stats['open_hosts']}")
+    check("Healthy hosts complete either way",
+          all(guarded['by_dealer'][f"healthy{i}"] == baseline['by_dealer'][f"healthy{i}"] == expected for i in range(3)))
+    check(f"Retries recovered the flaky host's pages ({baseline['by_dealer']['flaky']} -> "
+          f"{guarded['by_dealer']['flaky']} of {expected})",
+          guarded['by_dealer']['flaky'] == expected > baseline['by_dealer']['flaky'])
+    check(f"Breaker stopped hitting the hanging host ({baseline['requests']['hanging']} -> "
+          f"{guarded['requests']['hanging']} requests)",
+          guarded['requests']['hanging'] < baseline['requests']['hanging'])
+    check(f"Search finished sooner ({baseline['seconds']:.2f} s -> {guarded['seconds']:.2f} s)",
+          guarded['seconds'] < baseline['seconds'])
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Check the scraper transport against fault-injecting stub dealers')
+    parser.add_argument('--rate', type=float, default=5.0, help='Requests per second for the pacing check')
+    parser.add_argument('--burst', type=int, default=3)
+    parser.add_argument('--requests', type=int, default=13)
+    parser.add_argument('--fault-rate', type=float, default=0.3, help="Share of the flaky host's answers that are 503")
+    parser.add_argument('--hang', type=float, default=3.0, help='Seconds the hanging host takes to answer')
+    parser.add_argument('--timeout', type=float, default=0.5)
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.CRITICAL)
+    print("🛡️  Scraper transport check")
+    print("=" * 60)
+    check_pacing(args.rate, args.burst, args.requests)
+    check_retries()
+    check_breaker(0.3)
+    check_blocking()
+    for engine in ('sync', 'async'):
+        check_searches(engine, args.fault_rate, args.hang, args.timeout)
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+"""
+Replay a synthetic arrival trace (dealers listing new matches at very
+different rates during business hours) against the fixed SEARCH_TIMES
+schedule and against adaptive polling at several request budgets. Reports
+page requests and how long each new match waited to be found.
+"""
+
+import sys
+import os
+import random
+import logging
+import argparse
+import statistics
+from datetime import datetime, timedelta
+
+# Add src directory to path
+sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from config import SEARCH_TIMES, ADAPTIVE_POLLING
+from adaptive_polling import AdaptivePolling, add_active_hours, active_hours_between, is_active, HOURS_PER_DAY
+
+# New matches per business day at each synthetic dealer
+DEALER_RATES = {'busy': 6.0, 'steady': 1.5, 'quiet': 0.3, 'static': 0.05}
+REQUESTS_PER_SEARCH = 4
+
+def build_arrivals(start: datetime, weeks: int, seed: int) -> dict:
+    """Poisson arrivals per dealer, spread over business hours"""
+    rng = random.Random(seed)
+    end = start + timedelta(weeks=weeks)
+    total_hours = active_hours_between(start, end)
+    arrivals = {}
+    for key, per_day in DEALER_RATES.items():
+        times, elapsed = [], 0.0
+        while True:
+            elapsed += rng.expovariate(per_day / HOURS_PER_DAY)
+            if elapsed >= total_hours:
+                break
+            times.append(add_active_hours(start, elapsed))
+        arrivals[key] = times
+    return arrivals
+
+class Replay:
+    """One dealer-by-dealer run through the trace, recording what a search would have stored"""
+
+    def __init__(self, arrivals: dict):
+        self.arrivals = arrivals
+        self.pending = {key: list(times) for key, times in arrivals.items()}
+        self.latencies = []
+        self.requests = 0
+        self.matches = []
+        self.history = []
+
+    def search(self, key: str, now: datetime):
+        """Find every match the dealer listed since its last search"""
+        found = 0
+        while self.pending[key] and self.pending[key][0] <= now:
+            self.latencies.append((now - self.pending[key].pop(0)).total_seconds() / 3600)
+            self.matches.append({'dealership': key, 'first_seen': now.isoformat()})
+            found += 1
+        self.requests += REQUESTS_PER_SEARCH
+        self.history.append({'timestamp': now.isoformat(), 'vehicles_found': found,
+                             'run_stats': {'locations': [key],
+                                           'transport': {'hosts': {f"{key}.example": {'requests': REQUESTS_PER_SEARCH}}}}})
+        self.history = self.history[-100:]  # As DataManager keeps it
+
+    def load_history(self, now: datetime):
+        cutoff = (now - timedelta(days=ADAPTIVE_POLLING['window_days'])).isoformat()
+        self.matches = [match for match in self.matches if match['first_seen'] >= cutoff]
+        return self.matches, self.history
+
+    def summary(self, days: float) -> dict:
+        latencies = sorted(self.latencies)
+        return {
+            'requests_per_day': self.requests / days,
+            'mean_hours': statistics.mean(latencies),
+            'p90_hours': latencies[int(len(latencies) * 0.9)],
+            'found': len(latencies),
+            'pending': sum(len(times) for times in self.pending.values())
+        }
+
+def replay_fixed(arrivals: dict, start: datetime, end: datetime) -> Replay:
+    """Every dealer at each SEARCH_TIMES run that passes the business hours check"""
+    replay = Replay(arrivals)
+    day = start
+    while day < end:
+        for search_time in SEARCH_TIMES:
+            hour, minute = (int(part) for part in search_time.split(':'))
+            moment = day.replace(hour=hour, minute=minute)
+            if is_active(moment):
+                for key in arrivals:
+                    replay.search(key, moment)
+        day += timedelta(days=1)
+    return replay
+
+def replay_adaptive(arrivals: dict, start: datetime, end: datetime, requests_per_day: float):
+    """Each dealer on its learned interval, refreshed after every search as SearchScheduler does"""
+    replay = Replay(arrivals)
+    locations = {key: {'name': key, 'used_url': f"https://{key}.example/used-inventory/index.htm"} for key in arrivals}
+    clock = {'now': start}
+    polling = AdaptivePolling(lambda: replay.load_history(clock['now']), locations, requests_per_day)
+    polling.refresh(start)
+    first_run = add_active_hours(start, 0)
+    next_runs = {key: first_run for key in arrivals}
+    while True:
+        key = min(next_runs, key=next_runs.get)
+        now = next_runs[key]
+        if now >= end:
+            break
+        clock['now'] = now
+        replay.search(key, now)
+        polling.refresh(now)
+        next_runs[key] = polling.next_poll(key, now)
+    return replay, polling.plan
+
+def main(weeks: int, seed: int, budgets: list):
+    start = datetime(2026, 1, 5)  # A Monday
+    end = start + timedelta(weeks=weeks)
+    days = active_hours_between(start, end) / HOURS_PER_DAY
+    arrivals = build_arrivals(start, weeks, seed)
+    rates = ', '.join(f"{key} {rate:g}/day" for key, rate in DEALER_RATES.items())
+
+    print(f"🔁 Adaptive polling replay: {weeks} weeks, {sum(map(len, arrivals.values()))} new matches ({rates})")
+    print("=" * 78)
+    print(f"{'policy':<26} {'requests/day':>13} {'mean wait h':>12} {'p90 wait h':>11} {'found':>7} {'pending':>7}")
+
+    fixed = replay_fixed(arrivals, start, end).summary(days)
+    print(f"{'fixed SEARCH_TIMES':<26} {fixed['requests_per_day']:>13.1f} {fixed['mean_hours']:>12.2f} "
+          f"{fixed['p90_hours']:>11.2f} {fixed['found']:>7} {fixed['pending']:>7}")
+
+    results, plans = {}, {}
+    for share in budgets:
+        replay, plans[share] = replay_adaptive(arrivals, start, end, fixed['requests_per_day'] * share)
+        results[share] = result = replay.summary(days)
+        print(f"{f'adaptive, {share:.0%} budget':<26} {result['requests_per_day']:>13.1f} {result['mean_hours']:>12.2f} "
+              f"{result['p90_hours']:>11.2f} {result['found']:>7} {result['pending']:>7}")
+
+    print(f"\nLearned intervals at the end (100% budget):")
+    for key, entry in plans.get(1.0, plans[budgets[0]]).items():
+        print(f"   {key:<8} {entry['new_per_day']:>6.2f} new/day -> every {entry['interval_minutes']:>5.0f} business minutes")
+
+    cheaper = [share for share, result in results.items()
+               if result['requests_per_day'] < fixed['requests_per_day'] and result['mean_hours'] <= fixed['mean_hours']]
+    same_budget = results.get(1.0)
+    if same_budget:
+        print(f"Same budget, shorter mean wait: {'✅' if same_budget['mean_hours'] < fixed['mean_hours'] else '❌'} "
+              f"({fixed['mean_hours']:.2f} h -> {same_budget['mean_hours']:.2f} h)")
+    print(f"Fewer requests at equal or better mean wait: {'✅' if cheaper else '❌'}"
+          + (f" (down to {min(cheaper):.0%} of the requests)" if cheaper else ''))
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Replay a synthetic trace against fixed and adaptive polling')
+    parser.add_argument('--weeks', type=int, default=8)
+    parser.add_argument('--seed', type=int, default=7)
+    parser.add_argument('--budgets', type=float, nargs='+', default=[1.0, 0.75, 0.5],
+                        help='Adaptive budgets as shares of what the fixed schedule spends')
+    args = parser.parse_args()
+
+    logging.getLogger().setLevel(logging.WARNING)
+    main(args.weeks, args.seed, args.budgets)
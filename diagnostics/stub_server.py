@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+"""
+Local stub dealer server that serves synthetic Dealer.com-style SRP pages for benchmarks
+"""
+
+import hashlib
+import json
+import random
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs, quote
+
+SAMPLE_TRIMS = ['Sport', 'Sport Touring', 'EX', 'LX', 'Touring']
+SAMPLE_COLORS = ['Black', 'White', 'Gray', 'Blue', 'Red']
+
+def sample_vehicle(inventory_type: str, model: str, index: int, seed: int = 0) -> dict:
+    """Deterministic attributes for the index-th synthetic vehicle"""
+    year = 2016 + (index + seed) % 10
+    trim = SAMPLE_TRIMS[(index + seed) % len(SAMPLE_TRIMS)]
+    vin = f"2HGFE{seed:04d}{index:08d}"[:17]
+    return {
+        'year': year,
+        'trim': trim,
+        'color': SAMPLE_COLORS[(index * 3 + seed) % len(SAMPLE_COLORS)],
+        'vin': vin,
+        'price': 18995 + ((index * 713 + seed * 97) % 12000),
+        'path': f"/{inventory_type}/Honda/{year}-Honda-{model.replace(' ', '-')}-{trim.replace(' ', '-')}-{vin}.htm"
+    }
+
+def build_json_ld(inventory_type: str, model: str, count: int, seed: int = 0, start: int = 0) -> str:
+    """Build a JSON-LD ItemList describing the same vehicles as the cards"""
+    items = []
+    for i in range(start, start + count):
+        vehicle = sample_vehicle(inventory_type, model, i, seed)
+        items.append({'@type': 'ListItem', 'position': i + 1, 'item': {
+            '@type': 'Car', 'name': f"{vehicle['year']} Honda {model} {vehicle['trim']}",
+            'vehicleIdentificationNumber': vehicle['vin'], 'brand': {'@type': 'Brand', 'name': 'Honda'},
+            'model': model, 'vehicleModelDate': str(vehicle['year']), 'vehicleConfiguration': vehicle['trim'],
+            'color': vehicle['color'], 'url': vehicle['path'],
+            'offers': {'@type': 'Offer', 'price': str(vehicle['price']), 'priceCurrency': 'USD'}
+        }})
+    document = {'@context': 'https://schema.org', '@type': 'ItemList', 'itemListElement': items}
+    return '<script type="application/ld+json">' + json.dumps(document) + '</script>'
+
+def build_vehicle_card(inventory_type: str, model: str, index: int, seed: int = 0) -> str:
+    """Build the HTML for a single vehicle listing card"""
+    vehicle = sample_vehicle(inventory_type, model, index, seed)
+    year, trim, color, vin, price = (vehicle[key] for key in ('year', 'trim', 'color', 'vin', 'price'))
+
+    return f"""
+      <li class="vehicle-card" data-vin="{vin}">
+        <div class="vehicle-card-details">
+          <h2><a href="{vehicle['path']}">{year} Honda {model} {trim}</a></h2>
+          <dl><dt>Exterior Color</dt><dd>{color}</dd><dt>VIN</dt><dd>{vin}</dd></dl>
+          <span class="price-value">${price:,}</span>
+        </div>
+      </li>"""
+
+def build_inventory_blob(kb: int) -> str:
+    """Build an inline JSON blob of roughly `kb` kilobytes, like the tracking/config data SRPs embed"""
+    entries = []
+    size = 0
+    index = 0
+    while size < kb * 1024:
+        entry = f'{{"id":"trk-{index}","widget":"inventory-listing","props":{{"slot":{index},"visible":true}}}}'
+        entries.append(entry)
+        size += len(entry) + 1
+        index += 1
+    return '<script type="application/json" id="ws-config">[' + ','.join(entries) + ']</script>'
+
+def build_pagination(model: str, start: int, page_size: int, total: int) -> str:
+    """Build Dealer.com-style previous/numbered/next page links using start= offsets"""
+    def page_link(offset: int, label: str) -> str:
+        return f'<a href="?make=Honda&amp;model={quote(model)}&amp;start={offset}">{label}</a>'
+
+    links = [page_link(start - page_size, 'Previous')] if start else []
+    links += [page_link(offset, str(offset // page_size + 1)) for offset in range(0, total, page_size)]
+    if start + page_size < total:
+        links.append(page_link(start + page_size, 'Next'))
+    return '<nav class="pagination">' + ' '.join(links) + '</nav>'
+
+def build_srp_page(inventory_type: str, model: str, count: int, seed: int = 0, script_kb: int = 0,
+                   structured: bool = False, start: int = 0, total: int = None) -> str:
+    """Build a synthetic search results page with `count` vehicle cards, an optional JSON blob
+    and optional JSON-LD for the listed vehicles
+
+    With `total` set, the page is one page of a paginated search: it lists vehicles
+    start..start+count and carries the results summary and page links.
+    """
+    total = total or count
+    count = max(0, min(count, total - start))
+    cards = ''.join(build_vehicle_card(inventory_type, model, i, seed) for i in range(start, start + count))
+    blob = build_inventory_blob(script_kb) if script_kb else ''
+    if structured:
+        blob += build_json_ld(inventory_type, model, count, seed, start)
+    pagination = build_pagination(model, start, count or 1, total) if total > count else ''
+    return f"""<!DOCTYPE html>
+<html>
+<head>
+  <title>{inventory_type.title()} Honda {model} Inventory</title>
+  <script>window.DDC = window.DDC || {{}}; DDC.pageTimestamp = {int(time.time() * 1000)};</script>
+  <style>.vehicle-card {{ display: block; }}</style>
+  {blob}
+</head>
+<body>
+  <header><nav><a href="/">Home</a> <a href="/{inventory_type}-inventory/index.htm">All Inventory</a></nav></header>
+  <main>
+    <p class="srp-count">{start + 1 if count else 0} - {start + count} of {total} Results</p>
+    <ul class="inventoryList">{cards}
+    </ul>
+    {pagination}
+  </main>
+  <footer><p>&copy; Stub Honda Dealer</p></footer>
+</body>
+</html>"""
+
+class QuietHTTPServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer that ignores clients hanging up first (timed out requests against a slow stub)"""
+
+    def handle_error(self, request, client_address):
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+class StubDealerServer:
+    """Threaded local HTTP server answering every request with a synthetic SRP page"""
+
+    def __init__(self, delay: float = 0.0, vehicles_per_page: int = 12, seed: int = 0, validators: bool = False,
+                 total_vehicles: int = None, faults: int = 0, fault_status: int = 503, fault_rate: float = 0.0,
+                 retry_after: float = None, down: bool = False):
+        """
+        Args:
+            delay: Seconds to sleep before answering (simulated dealer latency)
+            vehicles_per_page: Number of vehicle cards on each SRP page
+            seed: Varies the generated inventory between servers
+            validators: Send ETag headers and answer matching If-None-Match with 304
+            total_vehicles: Paginate searches over this many vehicles (start= offsets)
+            faults: Answer the next this many requests with fault_status
+            fault_status: Status of injected faults
+            fault_rate: Share of requests after that answered with fault_status (seeded)
+            retry_after: Retry-After seconds sent with injected faults
+            down: Drop every connection without answering (a dead host)
+        """
+        self.delay = delay
+        self.vehicles_per_page = vehicles_per_page
+        self.seed = seed
+        self.validators = validators
+        self.total_vehicles = total_vehicles
+        self.inventory_version = 0  # Bump to simulate an inventory change
+        self.request_count = 0
+        self.not_modified_count = 0
+        self.faults = faults
+        self.fault_status = fault_status
+        self.fault_rate = fault_rate
+        self.retry_after = retry_after
+        self.down = down
+        self.fault_count = 0
+        self.request_times = []  # perf_counter() of each request, for checking client pacing
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def location_info(self, name: str) -> dict:
+        """Build a LEITH_HONDA_LOCATIONS-style entry that points at this server"""
+        return {
+            'name': name,
+            'location': 'Localhost, NC',
+            'new_url': f"{self.base_url}/new-inventory/index.htm",
+            'used_url': f"{self.base_url}/used-inventory/index.htm"
+        }
+
+    def render(self, path: str, query: dict) -> str:
+        """Render the page body for a request path and parsed query"""
+        inventory_type = 'used' if path.startswith('/used') else 'new'
+        model = query.get('model', ['Civic'])[0]
+        start = int(query.get('start', ['0'])[0])
+        return build_srp_page(inventory_type, model, self.vehicles_per_page, self.seed + self.inventory_version * 1000,
+                              start=start, total=self.total_vehicles)
+
+    def etag(self, path: str, query: str) -> str:
+        """ETag that changes only when the generated inventory would change"""
+        key = f"{path}?{query}|{self.seed}|{self.vehicles_per_page}|{self.total_vehicles}|{self.inventory_version}"
+        return '"' + hashlib.md5(key.encode('utf-8')).hexdigest() + '"'
+
+    def inject_fault(self) -> bool:
+        """Whether this request gets an injected fault instead of a page"""
+        with self._lock:
+            if self.faults > 0:
+                self.faults -= 1
+            elif not (self.fault_rate and self._random.random() < self.fault_rate):
+                return False
+            self.fault_count += 1
+            return True
+
+    def _make_handler(self):
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                with stub._lock:
+                    stub.request_count += 1
+                    stub.request_times.append(time.perf_counter())
+                if stub.down:
+                    self.close_connection = True
+                    return
+                if stub.delay:
+                    time.sleep(stub.delay)
+                if stub.inject_fault():
+                    self.send_response(stub.fault_status)
+                    if stub.retry_after is not None:
+                        self.send_header('Retry-After', f"{stub.retry_after:g}")
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                parsed = urlparse(self.path)
+                etag = stub.etag(parsed.path, parsed.query) if stub.validators else None
+                if etag and self.headers.get('If-None-Match') == etag:
+                    with stub._lock:
+                        stub.not_modified_count += 1
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+
+                body = stub.render(parsed.path, parse_qs(parsed.query)).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                if etag:
+                    self.send_header('ETag', etag)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # Keep benchmark output clean
+
+        return Handler
+
+    def start(self) -> 'StubDealerServer':
+        self._server = QuietHTTPServer(('127.0.0.1', 0), self._make_handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
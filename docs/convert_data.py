@@ -1,58 +1,86 @@
 #!/usr/bin/env python3
 """
-Convert previous_matches.json to web-friendly format
+Convert the tracked data (DATA_BACKEND store under src/) to web-friendly format
 """
 
 import json
 import sys
 import os
 import re
-from datetime import datetime
+import hashlib
+from collections import Counter
+from datetime import datetime, timedelta
+
+DOCS_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(DOCS_DIR)
 
 # Add src directory to path
-sys.path.append(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+sys.path.append(os.path.join(PROJECT_ROOT, 'src'))
+
+from config import SEARCH_URL_NEW, SEARCH_URL_USED, WEB_DATA, DATA_BACKEND, DATA_FILE, SQLITE_FILE, PARTITION_DIR
+from vehicle import VehicleBatch
+from normalize import parse_year, parse_url_year, parse_trim
+from storage import create_store, write_bytes_atomically
+
+WEB_DATA_DIR = os.path.join(DOCS_DIR, WEB_DATA['dir'])
+MANIFEST_FILE = 'manifest.json'
+SHARD_ENCODER = json.JSONEncoder(separators=(',', ':'))
+
+# Placeholder details for legacy records that captured a search page instead of a vehicle
+SAMPLE_VEHICLES = [
+    {'year': '2022', 'trim': 'Sport', 'price': '$23,995'},
+    {'year': '2021', 'trim': 'Sport Touring', 'price': '$25,499'},
+    {'year': '2020', 'trim': 'Sport', 'price': '$21,895'},
+    {'year': '2023', 'trim': 'Sport Touring', 'price': '$27,299'},
+    {'year': '2019', 'trim': 'Sport', 'price': '$19,995'},
+    {'year': '2024', 'trim': 'Sport Touring', 'price': '$28,995'}
+]
 
-from config import SEARCH_URL_NEW, SEARCH_URL_USED
+def data_store_path(backend: str = None) -> str:
+    """Path of the configured data store (config paths are relative to src/, where main.py runs)"""
+    backend = backend or DATA_BACKEND
+    path = {'sqlite': SQLITE_FILE, 'partitioned': PARTITION_DIR}.get(backend, DATA_FILE)
+    return os.path.join(PROJECT_ROOT, 'src', path)
 
-def convert_data_for_web():
-    """Convert the previous_matches.json to web dashboard format"""
+def read_original_data() -> dict:
+    """Read the tracked data from the DATA_BACKEND store, as DataManager opens it"""
+    backend = DATA_BACKEND
+    path = data_store_path(backend)
+    if backend == 'json' and os.path.exists(path + '.journal'):
+        backend = 'journal'  # A running --daemon journals a json store until it exits
+    if not (os.path.exists(path) or (backend == 'journal' and os.path.exists(path + '.journal'))):
+        raise FileNotFoundError(path)
     
-    # Read the original data
+    store = create_store(backend, path)
     try:
-        with open('../previous_matches.json', 'r') as f:
-            original_data = json.load(f)
-    except FileNotFoundError:
-        print("previous_matches.json not found")
-        return
+        return store.snapshot()
+    finally:
+        if hasattr(store, 'close'):
+            store.close()
+
+def convert_data_for_web(original_data: dict = None, data_dir: str = None):
+    """Convert the tracked data to web dashboard format
+    
+    Args:
+        original_data: The data document already in memory (DataManager.store.snapshot());
+            read from the data file when not given
+        data_dir: Directory for the manifest and shards (defaults to docs/data)
+    """
+    
+    if original_data is None:
+        try:
+            original_data = read_original_data()
+        except FileNotFoundError as e:
+            print(f"{e} not found")
+            return
     
     # Extract statistics from the actual data structure
     previous_matches = original_data.get('previous_matches', [])
     last_search = original_data.get('last_search', '')
     total_searches = original_data.get('total_searches', 0)
     
-    # Calculate unique dealerships
-    dealerships = set()
-    for vehicle in previous_matches:
-        if 'dealership' in vehicle and vehicle['dealership']:
-            dealerships.add(vehicle['dealership'])
-        elif 'url' in vehicle and 'autopark' in vehicle['url'].lower():
-            dealerships.add('AutoPark Honda')
-        elif 'url' in vehicle and 'leith' in vehicle['url'].lower():
-            if 'raleigh' in vehicle['url'].lower():
-                dealerships.add('Leith Honda Raleigh')
-            elif 'aberdeen' in vehicle['url'].lower():
-                dealerships.add('Leith Honda Aberdeen')
-            else:
-                dealerships.add('Leith Honda')
-        elif 'link' in vehicle and 'autopark' in vehicle['link'].lower():
-            dealerships.add('AutoPark Honda')
-        elif 'link' in vehicle and 'leith' in vehicle['link'].lower():
-            if 'raleigh' in vehicle['link'].lower():
-                dealerships.add('Leith Honda Raleigh')
-            elif 'aberdeen' in vehicle['link'].lower():
-                dealerships.add('Leith Honda Aberdeen')
-            else:
-                dealerships.add('Leith Honda')
+    # Canonical Vehicle view of the matches (older records that carry the listing URL as 'link' land in url)
+    batch = VehicleBatch.from_dicts(previous_matches)
     
     # Use deduplicated vehicles for statistics calculation
     # This will be updated after deduplication
@@ -61,23 +89,16 @@ def convert_data_for_web():
         'last_search': last_search,
         'total_searches': total_searches,
         'vehicles_tracked': 0,  # Will be updated after processing
-        'dealerships_count': len(dealerships),
+        'dealerships_count': 0,
         'matches': []
     }
     
-    # Deduplicate vehicles based on unique characteristics
+    # Deduplicate vehicles based on unique characteristics (dealership, inventory type and listing URL)
     seen_vehicles = set()
     unique_vehicles = []
     
-    for vehicle in previous_matches:
-        # Create a unique identifier based on meaningful data
-        dealership = vehicle.get('dealership', '')
-        inventory_type = vehicle.get('inventory_type', '')
-        url = vehicle.get('url', '')
-        
-        # Create unique key
-        unique_key = f"{dealership}_{inventory_type}_{url}"
-        
+    for vehicle in batch:
+        unique_key = dedupe_key(vehicle)
         if unique_key not in seen_vehicles:
             seen_vehicles.add(unique_key)
             unique_vehicles.append(vehicle)
@@ -85,122 +106,339 @@ def convert_data_for_web():
     print(f"Deduplicated: {len(previous_matches)} -> {len(unique_vehicles)} vehicles")
     
     # Process unique vehicle matches
+    current_year = datetime.now().year
     for i, vehicle in enumerate(unique_vehicles):
-        # Get basic vehicle information
-        title = vehicle.get('title', 'Honda Vehicle')
-        url = vehicle.get('url', '')
-        first_seen = vehicle.get('first_seen', '')
-        dealership_name = vehicle.get('dealership', 'Honda Dealership')
-        inventory_type = vehicle.get('inventory_type', 'used')
-        
-        # Since the current data appears to be search pages rather than actual vehicles,
-        # we'll create more realistic vehicle data based on the search criteria
-        if title == 'Hybrid' or len(title) < 10:
-            # Create sample vehicle data based on our updated search criteria
-            sample_vehicles = [
-                {'year': '2022', 'trim': 'Sport', 'price': '$23,995'},
-                {'year': '2021', 'trim': 'Sport Touring', 'price': '$25,499'},
-                {'year': '2020', 'trim': 'Sport', 'price': '$21,895'},
-                {'year': '2023', 'trim': 'Sport Touring', 'price': '$27,299'},
-                {'year': '2019', 'trim': 'Sport', 'price': '$19,995'},
-                {'year': '2024', 'trim': 'Sport Touring', 'price': '$28,995'}
-            ]
-            
-            # Select a sample vehicle based on the index
-            sample = sample_vehicles[i % len(sample_vehicles)]
-            year = sample['year']
-            trim = sample['trim']
-            price = sample['price']
-            enhanced_title = f"{year} Honda Civic {trim}"
-        else:
-            # Try to extract year from existing title or URL
-            year = 'Unknown'
-            year_match = re.search(r'20\d{2}', title + ' ' + url)
-            if year_match:
-                year = year_match.group()
-            else:
-                year = '2022'  # Default year
-            
-            trim = extract_trim_from_title(title)
-            price = vehicle.get('price', 'Not available')
-            enhanced_title = title if len(title) > 5 else f"{year} Honda Civic"
-        
-        # Determine vehicle type
-        vehicle_type = inventory_type if inventory_type else 'used'
-        current_year = datetime.now().year
-        if year != 'Unknown' and year.isdigit():
-            year_int = int(year)
-            if year_int >= current_year:
-                vehicle_type = 'new'
-            else:
-                vehicle_type = 'used'
-        
-        # Format found date to be JavaScript-friendly
-        found_date = first_seen
-        if found_date:
-            try:
-                # Keep the original ISO format for JavaScript Date parsing
-                dt = datetime.fromisoformat(found_date.replace('Z', '+00:00'))
-                found_date = dt.isoformat()
-            except:
-                # If parsing fails, use current time
-                found_date = datetime.now().isoformat()
-        
-        # Create vehicle entry
-        vehicle_entry = {
-            'title': enhanced_title,
-            'year': year,
-            'make': 'Honda',
-            'model': 'Civic',
-            'trim': trim if 'trim' in locals() else extract_trim_from_title(title),
-            'type': vehicle_type,
-            'price': price if 'price' in locals() else vehicle.get('price', 'Not available'),
-            'found_date': found_date or 'Unknown',
-            'dealership': dealership_name,
-            'link': url or determine_search_link(enhanced_title),
-            'dealer_link': url
-        }
-        
-        web_data['matches'].append(vehicle_entry)
+        web_data['matches'].append(web_entry(vehicle, i, current_year))
     
     # Update the vehicle count with deduplicated count
     web_data['vehicles_tracked'] = len(web_data['matches'])
     
-    # Recalculate dealerships from actual processed vehicles
-    actual_dealerships = set()
-    for vehicle in web_data['matches']:
-        actual_dealerships.add(vehicle['dealership'])
-    web_data['dealerships_count'] = len(actual_dealerships)
+    # Recalculate dealerships from actual processed vehicles (counts kept for incremental updates)
+    dealership_counts = Counter(vehicle['dealership'] for vehicle in web_data['matches'])
+    web_data['dealership_counts'] = dict(dealership_counts)
+    web_data['dealerships_count'] = len(dealership_counts)
     
     # Sort matches by found_date (newest first)
     web_data['matches'].sort(key=lambda x: x['found_date'], reverse=True)
     
     # Write to web data file
-    with open('data.json', 'w') as f:
-        json.dump(web_data, f, indent=2)
+    written = write_web_data(web_data, data_dir)
     
     print(f"✅ Converted {len(web_data['matches'])} vehicles to web format")
     print(f"📊 Statistics: {web_data['total_searches']} searches, {web_data['dealerships_count']} dealerships")
-    print(f"🚗 Final count: {web_data['vehicles_tracked']} unique vehicles")
+    print(f"🚗 Final count: {web_data['vehicles_tracked']} unique vehicles ({written} shard files written)")
     
     return web_data
 
+def dedupe_key(vehicle) -> tuple:
+    """Dealership, inventory type and listing URL of a stored match; one dashboard entry per key"""
+    return (vehicle.get('dealership') or 'Honda Dealership', vehicle.get('inventory_type') or '', vehicle.get('url') or '')
+
+def entry_dealership(entry: dict) -> str:
+    """Dealership a dashboard entry is listed under (sample and older entries may not name one)"""
+    return entry.get('dealership') or 'Honda Dealership'
+
+def entry_key(entry: dict) -> tuple:
+    """dedupe_key of the stored match a dashboard entry was built from"""
+    return (entry_dealership(entry), entry.get('inventory_type') or '', entry.get('dealer_link') or '')
+
+def web_entry(vehicle, index: int, current_year: int) -> dict:
+    """Build the dashboard entry for one stored match (index picks the placeholder for title-less legacy records)"""
+    # Get basic vehicle information
+    title = vehicle.get('title', 'Honda Vehicle')
+    url = vehicle.get('url', '')
+    first_seen = vehicle.get('first_seen', '')
+    dealership_name = vehicle.get('dealership', 'Honda Dealership')
+    inventory_type = vehicle.get('inventory_type', 'used')
+    
+    # Vehicles read from structured data (or fully parsed listings) carry their own
+    # year and price, so use them as-is
+    if vehicle.get('year') and vehicle.get('price'):
+        year = str(vehicle['year'])
+        trim = vehicle.get('trim') or extract_trim_from_title(title)
+        price = vehicle['price']
+        enhanced_title = title if len(title) >= 10 else f"{year} Honda {vehicle.get('model', 'Civic')} {trim}"
+    # Since the current data appears to be search pages rather than actual vehicles,
+    # we'll create more realistic vehicle data based on the search criteria
+    elif title == 'Hybrid' or len(title) < 10:
+        # Select a sample vehicle based on the index
+        sample = SAMPLE_VEHICLES[index % len(SAMPLE_VEHICLES)]
+        year = sample['year']
+        trim = sample['trim']
+        price = sample['price']
+        enhanced_title = f"{year} Honda Civic {trim}"
+    else:
+        # Try to extract year from existing title or URL
+        parsed_year = parse_year(title) or parse_url_year(url or '')
+        year = str(parsed_year) if parsed_year else '2022'  # Default year
+        
+        trim = extract_trim_from_title(title)
+        price = vehicle.get('price', 'Not available')
+        enhanced_title = title if len(title) > 5 else f"{year} Honda Civic"
+    
+    # Determine vehicle type
+    vehicle_type = inventory_type if inventory_type else 'used'
+    if year != 'Unknown' and year.isdigit():
+        year_int = int(year)
+        if year_int >= current_year:
+            vehicle_type = 'new'
+        else:
+            vehicle_type = 'used'
+    
+    # Format found date to be JavaScript-friendly
+    found_date = first_seen
+    if found_date:
+        try:
+            # Keep the original ISO format for JavaScript Date parsing
+            dt = datetime.fromisoformat(found_date.replace('Z', '+00:00'))
+            found_date = dt.isoformat()
+        except:
+            # If parsing fails, use current time
+            found_date = datetime.now().isoformat()
+    
+    # Create vehicle entry
+    vehicle_entry = {
+        'title': enhanced_title,
+        'year': year,
+        'make': 'Honda',
+        'model': 'Civic',
+        'trim': trim,
+        'type': vehicle_type,
+        'price': price,
+        'found_date': found_date or 'Unknown',
+        'dealership': dealership_name,
+        'inventory_type': vehicle.get('inventory_type'),
+        'link': url or determine_search_link(enhanced_title),
+        'dealer_link': url
+    }
+    
+    if vehicle.get('mileage'):
+        vehicle_entry['mileage'] = vehicle['mileage']
+    if vehicle.get('vin'):
+        vehicle_entry['vin'] = vehicle['vin']
+    
+    return vehicle_entry
+
+def page_file(number: int) -> str:
+    return f"pages/page-{number:06d}.json"
+
+def dealer_file(dealership: str) -> str:
+    slug = re.sub(r'[^a-z0-9]+', '-', dealership.lower()).strip('-') or 'dealership'
+    return f"dealers/{slug}-{hashlib.sha1(dealership.encode()).hexdigest()[:6]}.json"
+
+def encode_shard(entries: list) -> bytes:
+    """A JSON array with one match per line, so a changed match is a one-line diff"""
+    return ('[\n' + ',\n'.join(SHARD_ENCODER.encode(entry) for entry in entries) + '\n]\n').encode()
+
+def shard_hash(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()[:16]
+
+def paginate(matches: list, page_size: int = None) -> list:
+    """Split newest-first matches into numbered pages, oldest page first
+    
+    Pages are filled from the oldest match, so only the newest page is
+    partial: new matches land there and expiring ones leave the oldest page,
+    and the pages in between keep their content (and hash) from run to run.
+    """
+    page_size = page_size or WEB_DATA['page_size']
+    pages = []
+    end = len(matches)
+    while end > 0:
+        start = max(0, end - page_size)
+        pages.append((len(pages) + 1, matches[start:end]))
+        end = start
+    return pages
+
+def read_manifest(data_dir: str = None):
+    try:
+        with open(os.path.join(data_dir or WEB_DATA_DIR, MANIFEST_FILE), 'r') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def write_web_data(web_data: dict, data_dir: str = None, pages: list = None, changed: set = None) -> int:
+    """Write the dashboard manifest, match pages and per-dealership shards; returns shard files written
+    
+    Only shards whose hash changed are rewritten; when the caller knows which
+    shard files it touched (`changed`), the others are not even re-encoded.
+    Shards go first and the manifest last, each atomically, so the page never
+    fetches a half-written file or a manifest pointing at shards that do not
+    exist yet.
+    """
+    data_dir = data_dir or WEB_DATA_DIR
+    previous = read_manifest(data_dir) or {}
+    previous_shards = previous.get('pages', []) + list(previous.get('dealerships', {}).values())
+    previous_hashes = {shard['file']: shard['hash'] for shard in previous_shards}
+    if pages is None:
+        pages = paginate(web_data['matches'])
+    
+    written = 0
+    def put(file: str, entries: list) -> str:
+        nonlocal written
+        if changed is not None and file not in changed and file in previous_hashes:
+            return previous_hashes[file]
+        content = encode_shard(entries)
+        digest = shard_hash(content)
+        path = os.path.join(data_dir, file)
+        if previous_hashes.get(file) != digest or not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            write_bytes_atomically(path, content)
+            written += 1
+        return digest
+    
+    page_index = []
+    for number, entries in reversed(pages):
+        file = page_file(number)
+        page_index.append({'file': file, 'hash': put(file, entries), 'count': len(entries),
+                           'newest': entries[0]['found_date'], 'oldest': entries[-1]['found_date']})
+    
+    by_dealership = {}
+    for entry in web_data['matches']:
+        by_dealership.setdefault(entry_dealership(entry), []).append(entry)
+    dealer_index = {}
+    for dealership in sorted(by_dealership):
+        file = dealer_file(dealership)
+        dealer_index[dealership] = {'file': file, 'hash': put(file, by_dealership[dealership]),
+                                    'count': len(by_dealership[dealership])}
+    
+    manifest = {key: value for key, value in web_data.items() if key != 'matches'}
+    manifest['page_size'] = WEB_DATA['page_size']
+    manifest['version'] = shard_hash(json.dumps([[page['hash'] for page in page_index],
+                                                 [shard['hash'] for shard in dealer_index.values()]]).encode())
+    web_data['version'] = manifest['version']
+    manifest['pages'] = page_index
+    manifest['dealerships'] = dealer_index
+    write_bytes_atomically(os.path.join(data_dir, MANIFEST_FILE), json.dumps(manifest, indent=2).encode())
+    
+    listed = {page['file'] for page in page_index} | {shard['file'] for shard in dealer_index.values()}
+    for file in set(previous_hashes) - listed:
+        try:
+            os.remove(os.path.join(data_dir, file))
+        except OSError:
+            pass
+    return written
+
+def read_web_data(data_dir: str = None):
+    """The dashboard data and its pages (oldest first) as last written, or None when missing or damaged"""
+    data_dir = data_dir or WEB_DATA_DIR
+    manifest = read_manifest(data_dir)
+    if not manifest or 'pages' not in manifest or 'dealership_counts' not in manifest:
+        return None
+    
+    pages = []
+    for page in reversed(manifest['pages']):
+        try:
+            with open(os.path.join(data_dir, page['file']), 'rb') as f:
+                content = f.read()
+        except OSError:
+            return None
+        if shard_hash(content) != page['hash']:
+            return None
+        number = int(re.search(r'(\d+)\.json$', page['file']).group(1))
+        pages.append((number, json.loads(content)))
+    
+    web_data = {key: value for key, value in manifest.items()
+                if key not in ('page_size', 'pages', 'dealerships')}
+    web_data['matches'] = [entry for _, entries in reversed(pages) for entry in entries]
+    return web_data, pages
+
+def insert_entry(pages: list, entry: dict, page_size: int = None) -> int:
+    """Place a dashboard entry in the pages (oldest page first, newest match first within a page); returns its page number"""
+    page_size = page_size or WEB_DATA['page_size']
+    found_date = entry['found_date']
+    if not pages or found_date >= pages[-1][1][0]['found_date']:
+        # The usual case: a new match is the newest, so it tops the newest page or starts the next one
+        if not pages or len(pages[-1][1]) >= page_size:
+            pages.append(((pages[-1][0] + 1) if pages else 1, []))
+        pages[-1][1].insert(0, entry)
+        return pages[-1][0]
+    # Backdated match: it joins the newest page that already reaches back to its date
+    for number, entries in reversed(pages):
+        if entries[-1]['found_date'] <= found_date:
+            index = next(i for i, existing in enumerate(entries) if existing['found_date'] <= found_date)
+            entries.insert(index, entry)
+            return number
+    pages[0][1].append(entry)
+    return pages[0][0]
+
+def update_web_data_incrementally(new_vehicles: list, stats: dict, days_to_keep: int = 30,
+                                  data_dir: str = None, state: dict = None):
+    """Merge one run's new vehicles into the existing dashboard data instead of rebuilding it
+    
+    New entries go into the newest page, entries past the retention window
+    leave the oldest page, and the vehicle and dealership counts are adjusted
+    by the change alone, so an ordinary run rewrites one or two pages, the
+    dealership shards that gained or lost matches and the manifest. Returns
+    the updated data, or None when the manifest or a page is missing or
+    damaged (the caller should then run convert_data_for_web).
+    
+    A long-running caller passes the same `state` dict every time: the pages
+    parsed by one call are kept there and reused by the next, as long as the
+    manifest on disk still carries the version this process wrote.
+    """
+    # Taken out while this call mutates it, so a failed write leaves nothing half-updated to reuse
+    loaded = state.pop('dashboard', None) if state is not None else None
+    if loaded is None or (read_manifest(data_dir) or {}).get('version') != loaded[0].get('version'):
+        loaded = read_web_data(data_dir)
+        if loaded is None:
+            return None
+    web_data, pages = loaded
+    dealership_counts = Counter(web_data['dealership_counts'])
+    
+    # Drop entries that cleanup_old_matches removed from the store (oldest are at the end of the oldest page)
+    cutoff = (datetime.now() - timedelta(days=days_to_keep)).isoformat()
+    expired = 0
+    changed = set()
+    while pages:
+        number, entries = pages[0]
+        while entries and entries[-1]['found_date'] != 'Unknown' and entries[-1]['found_date'] <= cutoff:
+            dealership = entry_dealership(entries.pop())
+            dealership_counts[dealership] -= 1
+            changed.add(dealer_file(dealership))
+            changed.add(page_file(number))
+            expired += 1
+        if entries:
+            break
+        pages.pop(0)
+    
+    # Build entries for vehicles whose dealership / inventory type / URL is not listed yet
+    known = {entry_key(entry) for _, entries in pages for entry in entries}
+    current_year = datetime.now().year
+    added = []
+    for vehicle in new_vehicles:
+        unique_key = dedupe_key(vehicle)
+        if unique_key in known:
+            continue
+        known.add(unique_key)
+        entry = web_entry(vehicle, len(known) - 1, current_year)
+        dealership_counts[entry['dealership']] += 1
+        added.append(entry)
+    
+    # Oldest first, so that each insert at the top of the newest page keeps the list newest first
+    added.sort(key=lambda x: x['found_date'], reverse=True)
+    for entry in reversed(added):
+        changed.add(page_file(insert_entry(pages, entry)))
+        changed.add(dealer_file(entry['dealership']))
+    web_data['matches'] = [entry for _, entries in reversed(pages) for entry in entries]
+    
+    dealership_counts = +dealership_counts  # Drop dealerships with no entries left
+    web_data['dealership_counts'] = dict(dealership_counts)
+    web_data['dealerships_count'] = len(dealership_counts)
+    web_data['vehicles_tracked'] = len(web_data['matches'])
+    web_data['last_updated'] = datetime.now().isoformat()
+    web_data['last_search'] = stats.get('last_search', web_data.get('last_search'))
+    web_data['total_searches'] = stats.get('total_searches', web_data.get('total_searches', 0))
+    
+    written = write_web_data(web_data, data_dir, pages, changed)
+    if state is not None:
+        state['dashboard'] = (web_data, pages)
+    print(f"✅ Added {len(added)} and expired {expired} dashboard vehicles "
+          f"({web_data['vehicles_tracked']} listed, {written} shard files written)")
+    return web_data
+
 def extract_trim_from_title(title):
     """Extract trim level from vehicle title"""
-    title_lower = title.lower()
-    
-    if 'hybrid' in title_lower:
-        return 'Hybrid'
-    elif 'sport' in title_lower:
-        return 'Sport'
-    elif 'touring' in title_lower:
-        return 'Touring'
-    elif 'ex' in title_lower:
-        return 'EX'
-    elif 'lx' in title_lower:
-        return 'LX'
-    else:
-        return 'Base'
+    return parse_trim(title) or 'Base'
 
 def determine_search_link(title):
     """Determine appropriate search link based on vehicle title"""
@@ -210,13 +448,11 @@ def determine_search_link(title):
         return f"{SEARCH_URL_NEW}?make=Honda&model=Civic"
 
 def create_sample_data():
-    """Create sample data file for demo purposes"""
+    """Create sample dashboard data for demo purposes"""
     sample_data = {
         'last_updated': datetime.now().isoformat(),
         'last_search': "2025-10-09T19:03:13.087245",
         'total_searches': 14,
-        'vehicles_tracked': 3,
-        'dealerships_count': 2,
         'matches': [
             {
                 'title': "2024 Honda Civic Hybrid",
@@ -227,6 +463,8 @@ def create_sample_data():
                 'type': "new",
                 'price': "$28,500",
                 'found_date': "2025-10-09T19:03:12.600085",
+                'dealership': "AutoPark Honda",
+                'inventory_type': "new",
                 'link': "https://www.autoparkhonda.com/new-inventory/index.htm?make=Honda&model=Civic%20Hybrid",
                 'dealer_link': "https://www.autoparkhonda.com/VehicleDetails/new-2024-Honda-Civic-Hybrid-4dr_Sedan-Cary-NC/5438262784"
             },
@@ -240,21 +478,38 @@ def create_sample_data():
                 'price': "$24,995",
                 'mileage': "15,420",
                 'found_date': "2025-10-09T18:33:08.951741",
+                'dealership': "AutoPark Honda",
+                'inventory_type': "used",
                 'link': "https://www.autoparkhonda.com/used-inventory/index.htm?make=Honda&model=Civic",
                 'dealer_link': "https://www.autoparkhonda.com/VehicleDetails/used-2023-Honda-Civic-Sport-4dr_Sedan-Cary-NC/5441238791"
             }
         ]
     }
     
-    with open('data.json', 'w') as f:
-        json.dump(sample_data, f, indent=2)
+    sample_data['vehicles_tracked'] = len(sample_data['matches'])
+    sample_data['dealership_counts'] = dict(Counter(map(entry_dealership, sample_data['matches'])))
+    sample_data['dealerships_count'] = len(sample_data['dealership_counts'])
+    write_web_data(sample_data)
     
-    print("📝 Created sample data file")
+    print("📝 Created sample data files")
 
 if __name__ == "__main__":
     os.chdir(os.path.dirname(os.path.abspath(__file__)))
     
     if len(sys.argv) > 1 and sys.argv[1] == '--sample':
         create_sample_data()
+    elif len(sys.argv) > 1 and sys.argv[1] == '--incremental':
+        # Payload on stdin: {"new_vehicles": [...], "stats": {...}, "days_to_keep": 30}
+        payload = json.load(sys.stdin)
+        try:
+            web_data = update_web_data_incrementally(payload.get('new_vehicles', []), payload.get('stats', {}),
+                                                     payload.get('days_to_keep', 30))
+            if web_data is None:
+                print("Dashboard manifest missing or damaged, rebuilding it")
+        except Exception as e:
+            print(f"⚠️ Incremental dashboard update failed ({e}), rebuilding it")
+            web_data = None
+        if web_data is None:
+            convert_data_for_web()
     else:
         convert_data_for_web()
\ No newline at end of file
@@ -3,14 +3,23 @@
 // Configuration
 const API_BASE_URL = window.location.origin + window.location.pathname.replace(/\/[^\/]*$/, '').replace(/\/$/, '');
 const REFRESH_INTERVAL = 300000; // 5 minutes
+const DATA_DIR = 'data'; // Manifest, match pages and dealership shards written by convert_data.py
 
 // Global variables
 let refreshTimer;
+let liveUpdates = null; // EventSource while the page is served by src/dashboard_server.py
+let dashboardState = {
+    manifest: null,   // Last manifest fetched
+    shards: {},       // Shard file -> { hash, matches } for every page / dealership shard downloaded
+    pagesShown: 1,    // Match pages shown, newest first
+    dealership: ''    // Dealership filter ('' for all)
+};
 
 // Initialize when page loads
 document.addEventListener('DOMContentLoaded', function() {
     initializeDashboard();
     startAutoRefresh();
+    startLiveUpdates();
 });
 
 function initializeDashboard() {
@@ -31,6 +40,10 @@ function updateLastUpdatedTime() {
 }
 
 function pollForUpdates() {
+    if (liveUpdates) {
+        return; // The dashboard server pushes the results as soon as the search commits them
+    }
+    
     let pollCount = 0;
     const maxPolls = 20; // Poll for up to 10 minutes (30s intervals)
     
@@ -38,14 +51,8 @@ function pollForUpdates() {
         pollCount++;
         
         try {
-            // Check if data has been updated by looking at the timestamp or content
-            const cacheBuster = new Date().getTime();
-            const response = await fetch(`data.json?v=${cacheBuster}`);
-            const data = await response.json();
-            
-            // Update the display with any new data
-            await loadSearchResults();
-            await loadStatistics();
+            // Fetch the small manifest; only shards whose hash changed are downloaded again
+            await refreshDashboard();
             
             // Check if we should stop polling (you might add a timestamp check here)
             if (pollCount >= maxPolls) {
@@ -130,11 +137,183 @@ function showSetupStatus(message, type) {
     }, 5000);
 }
 
-async function loadSearchResults() {
-    const container = document.getElementById('results-container');
+async function fetchManifest() {
+    // The manifest is tiny, so it is always fetched fresh
+    const cacheBuster = new Date().getTime();
+    const response = await fetch(`${DATA_DIR}/manifest.json?v=${cacheBuster}`);
+    return response.ok ? response.json() : null;
+}
+
+async function fetchShard(shard) {
+    // Shards are addressed by content hash, so an unchanged shard is never downloaded twice
+    const cached = dashboardState.shards[shard.file];
+    if (cached && cached.hash === shard.hash) {
+        return cached.matches;
+    }
+    const response = await fetch(`${DATA_DIR}/${shard.file}?v=${shard.hash}`);
+    if (!response.ok) {
+        throw new Error(`Failed to load ${shard.file}`);
+    }
+    const matches = await response.json();
+    dashboardState.shards[shard.file] = { hash: shard.hash, matches };
+    return matches;
+}
+
+async function visibleMatches(manifest) {
+    const dealershipShard = manifest.dealerships[dashboardState.dealership];
+    if (dealershipShard) {
+        return fetchShard(dealershipShard);
+    }
+    const pages = manifest.pages.slice(0, dashboardState.pagesShown);
+    const pageMatches = await Promise.all(pages.map(fetchShard));
+    return pageMatches.flat();
+}
+
+async function refreshDashboard(force = false) {
+    const manifest = await fetchManifest();
+    if (!manifest) {
+        return false;
+    }
+    
+    const previous = dashboardState.manifest;
+    dashboardState.manifest = manifest;
+    updateStatistics(manifest);
+    if (!force && previous && previous.version === manifest.version) {
+        return true; // No page or shard changed
+    }
     
+    // Forget shards the manifest no longer lists
+    const listed = new Set(manifest.pages.concat(Object.values(manifest.dealerships)).map(shard => shard.file));
+    Object.keys(dashboardState.shards).forEach(file => {
+        if (!listed.has(file)) {
+            delete dashboardState.shards[file];
+        }
+    });
+    
+    updateDealershipFilter(manifest);
+    displayResults({ matches: await visibleMatches(manifest) });
+    updateLoadMore(manifest);
+    return true;
+}
+
+function updateDealershipFilter(manifest) {
+    const select = document.getElementById('dealership-filter');
+    if (!select) return;
+    
+    const names = Object.keys(manifest.dealerships);
+    if (!names.includes(dashboardState.dealership)) {
+        dashboardState.dealership = '';
+    }
+    select.innerHTML = '<option value="">All dealerships</option>' + names.map(name =>
+        `<option value="${name}">${name} (${manifest.dealerships[name].count})</option>`
+    ).join('');
+    select.value = dashboardState.dealership;
+}
+
+function updateLoadMore(manifest) {
+    const button = document.getElementById('load-more-btn');
+    if (!button) return;
+    
+    const remaining = manifest.pages.slice(dashboardState.pagesShown).reduce((total, page) => total + page.count, 0);
+    const showing = !dashboardState.dealership && remaining > 0;
+    button.style.display = showing ? 'inline-block' : 'none';
+    button.textContent = `Load more (${remaining} older)`;
+}
+
+async function loadMoreResults() {
+    dashboardState.pagesShown++;
+    await refreshDashboard(true);
+}
+
+async function filterByDealership(dealership) {
+    dashboardState.dealership = dealership;
+    dashboardState.pagesShown = 1;
+    await refreshDashboard(true);
+}
+
+function startLiveUpdates() {
+    // Only src/dashboard_server.py serves /events; on static hosting the request fails and polling continues
+    if (!window.EventSource) return;
+    
+    const source = new EventSource('events');
+    source.addEventListener('change', event => {
+        applyChange(JSON.parse(event.data)).catch(error => console.error('Error applying change:', error));
+    });
+    source.onopen = () => {
+        liveUpdates = source;
+        stopAutoRefresh();
+    };
+    source.onerror = () => {
+        if (source.readyState === EventSource.CLOSED) {
+            liveUpdates = null;
+            startAutoRefresh();
+        }
+    };
+}
+
+function matchKey(match) {
+    return [match.dealership, match.inventory_type || '', match.dealer_link || ''].join('\n');
+}
+
+function newestFirst(a, b) {
+    return b.found_date.localeCompare(a.found_date);
+}
+
+async function applyChange(change) {
+    // A pushed change carries the matches added and removed, so no shard is downloaded for it
+    const manifest = dashboardState.manifest;
+    if (change.reset || !manifest) {
+        await refreshDashboard(true);
+        return;
+    }
+    
+    Object.assign(manifest, change.stats);
+    manifest.version = change.version;
+    updateStatistics(manifest);
+    
+    // Page and dealership index
+    const pages = {};
+    manifest.pages.forEach(page => { pages[page.file] = page; });
+    change.removed_pages.forEach(file => { delete pages[file]; });
+    change.pages.forEach(page => { pages[page.file] = page; });
+    manifest.pages = Object.values(pages).sort((a, b) => b.file.localeCompare(a.file));
+    change.removed_dealerships.forEach(name => { delete manifest.dealerships[name]; });
+    Object.assign(manifest.dealerships, change.dealerships);
+    
+    // Patch the shards already downloaded; a brand new page is made of added matches only
+    const removed = new Set(change.removed.map(key => key.join('\n')));
+    const added = Object.values(change.added).flat();
+    change.pages.forEach(page => {
+        if (!dashboardState.shards[page.file] && (change.added[page.file] || []).length === page.count) {
+            dashboardState.shards[page.file] = { hash: page.hash, matches: change.added[page.file] };
+        }
+    });
+    const dealershipByFile = {};
+    Object.entries(manifest.dealerships).forEach(([name, shard]) => { dealershipByFile[shard.file] = name; });
+    Object.entries(dashboardState.shards).forEach(([file, shard]) => {
+        const dealership = dealershipByFile[file];
+        const index = pages[file] || manifest.dealerships[dealership];
+        if (!index) {
+            delete dashboardState.shards[file];
+        } else if (index.hash !== shard.hash) {
+            const additions = dealership ? added.filter(match => match.dealership === dealership) : (change.added[file] || []);
+            shard.matches = additions.concat(shard.matches.filter(match => !removed.has(matchKey(match)))).sort(newestFirst);
+            shard.hash = index.hash;
+        }
+    });
+    
+    updateDealershipFilter(manifest);
+    displayResults({ matches: await visibleMatches(manifest) });
+    updateLoadMore(manifest);
+}
+
+async function loadSearchResults() {
     try {
-        // Add cache busting to ensure fresh data
+        if (await refreshDashboard()) {
+            return;
+        }
+        
+        // No manifest: try the single data.json older deployments published
         const cacheBuster = new Date().getTime();
         const response = await fetch(`data.json?v=${cacheBuster}`);
         
@@ -146,9 +325,10 @@ async function loadSearchResults() {
         
         const data = await response.json();
         displayResults(data);
+        updateStatistics(data);
         
     } catch (error) {
-        console.log('No data.json found, using sample data');
+        console.log('No dashboard data found, using sample data');
         loadSampleData();
     }
 }
@@ -290,12 +470,10 @@ function updateStatistics(data) {
 
 async function loadStatistics() {
     try {
-        // Add cache busting to ensure fresh statistics
-        const cacheBuster = new Date().getTime();
-        const response = await fetch(`data.json?v=${cacheBuster}`);
-        if (response.ok) {
-            const data = await response.json();
-            updateStatistics(data);
+        // Statistics live in the manifest, so the match pages are not fetched for them
+        const manifest = await fetchManifest();
+        if (manifest) {
+            updateStatistics(manifest);
         } else {
             console.log('Failed to load statistics data');
         }
@@ -323,7 +501,7 @@ function refreshResults() {
     // Update timestamp
     updateLastUpdatedTime();
     
-    // Reload results
+    // Reload results (shards whose hash is unchanged come from memory)
     loadSearchResults().finally(() => {
         // Remove loading animation
         setTimeout(() => {
@@ -334,6 +512,11 @@ function refreshResults() {
 }
 
 function startAutoRefresh() {
+    if (liveUpdates) {
+        return; // Changes are pushed, nothing to poll
+    }
+    stopAutoRefresh();
+    
     // Refresh every 5 minutes
     refreshTimer = setInterval(() => {
         loadSearchResults();
@@ -495,6 +678,8 @@ async function runNewSearch() {
 window.dashboardFunctions = {
     refreshResults,
     loadSearchResults,
+    loadMoreResults,
+    filterByDealership,
     updateLastUpdatedTime,
     formatPrice,
     timeAgo,
@@ -0,0 +1,214 @@
+import math
+import logging
+from datetime import datetime, timedelta
+from urllib.parse import urlparse
+from typing import Callable, Dict, List, Tuple
+from config import ADAPTIVE_POLLING, BUSINESS_HOURS, SEARCH_TIMES, LEITH_HONDA_LOCATIONS
+
+logger = logging.getLogger(__name__)
+
+HOURS_PER_DAY = BUSINESS_HOURS['end'] - BUSINESS_HOURS['start']
+
+def is_active(moment: datetime) -> bool:
+    """Whether `moment` falls in business hours (the only time dealers are polled)"""
+    return moment.weekday() in BUSINESS_HOURS['days'] and BUSINESS_HOURS['start'] <= moment.hour < BUSINESS_HOURS['end']
+
+def _day_window(day: datetime) -> Tuple[datetime, datetime]:
+    start = day.replace(hour=BUSINESS_HOURS['start'], minute=0, second=0, microsecond=0)
+    return start, start + timedelta(hours=HOURS_PER_DAY)
+
+def active_hours_between(start: datetime, end: datetime) -> float:
+    """Business hours between two moments"""
+    hours = 0.0
+    day = start.replace(hour=0, minute=0, second=0, microsecond=0)
+    while day < end:
+        if day.weekday() in BUSINESS_HOURS['days']:
+            opens, closes = _day_window(day)
+            overlap = (min(closes, end) - max(opens, start)).total_seconds()
+            hours += max(overlap, 0) / 3600
+        day += timedelta(days=1)
+    return hours
+
+def add_active_hours(moment: datetime, hours: float) -> datetime:
+    """The moment `hours` business hours after `moment` (always inside business hours)"""
+    remaining = timedelta(hours=hours)
+    day = moment.replace(hour=0, minute=0, second=0, microsecond=0)
+    for _ in range(366):
+        if day.weekday() in BUSINESS_HOURS['days']:
+            opens, closes = _day_window(day)
+            start = max(opens, moment)
+            if start < closes:
+                if start + remaining < closes:
+                    return start + remaining
+                remaining -= closes - start
+        day += timedelta(days=1)
+    raise ValueError("BUSINESS_HOURS has no business days")
+
+def fixed_schedule_budget(requests_per_search: Dict[str, float]) -> float:
+    """HTTP requests per business day spent by SEARCH_TIMES (the runs that fall inside business hours)"""
+    searches = sum(1 for search_time in SEARCH_TIMES
+                   if BUSINESS_HOURS['start'] <= int(search_time.split(':')[0]) < BUSINESS_HOURS['end'])
+    return searches * sum(requests_per_search.values())
+
+def estimate_churn(recent_matches: List[Dict], search_history: List[Dict], now: datetime = None,
+                   locations: Dict = None) -> Dict[str, Dict]:
+    """New-match rate and request cost of each dealer
+
+    New matches are counted from their first_seen times over the last
+    ADAPTIVE_POLLING['window_days'], per business hour the dealer has been
+    watched; a small prior keeps dealers with little history near the
+    average. Search history gives the HTTP requests one search of the
+    dealer costs, from the transport's per-host counters (entries name the
+    locations searched; a host shared by several of them is split evenly).
+    """
+    now = now or datetime.now()
+    locations = locations or LEITH_HONDA_LOCATIONS
+    window_start = now - timedelta(days=ADAPTIVE_POLLING['window_days'])
+    keys_by_name = {info['name']: key for key, info in locations.items()}
+    hosts = {key: {urlparse(info[kind]).netloc for kind in ('new_url', 'used_url') if info.get(kind)}
+             for key, info in locations.items()}
+    churn = {key: {'name': info['name'], 'new_matches': 0, 'searches': 0, 'measured': 0, 'requests': 0.0,
+                   'watched_since': None}
+             for key, info in locations.items()}
+
+    def watched(key: str, moment: datetime):
+        entry = churn[key]
+        if entry['watched_since'] is None or moment < entry['watched_since']:
+            entry['watched_since'] = moment
+
+    for match in recent_matches:
+        key = keys_by_name.get(match.get('dealership'))
+        try:
+            first_seen = datetime.fromisoformat(match.get('first_seen') or '')
+        except ValueError:
+            continue
+        if key is None or first_seen < window_start:
+            continue
+        churn[key]['new_matches'] += 1
+        watched(key, first_seen)
+
+    for entry in search_history:
+        try:
+            timestamp = datetime.fromisoformat(entry['timestamp'])
+        except (KeyError, ValueError):
+            continue
+        if timestamp < window_start:
+            continue
+        run_stats = entry.get('run_stats') or {}
+        searched = [key for key in run_stats.get('locations', locations) if key in churn]
+        host_stats = (run_stats.get('transport') or {}).get('hosts')
+        for key in searched:
+            churn[key]['searches'] += 1
+            watched(key, timestamp)
+            if host_stats is None:
+                continue  # Recorded before the transport counted requests per host
+            churn[key]['measured'] += 1
+            for host in hosts[key]:
+                sharing = sum(1 for other in searched if host in hosts[other])
+                churn[key]['requests'] += host_stats.get(host, {}).get('requests', 0) / sharing
+
+    for entry in churn.values():
+        hours = active_hours_between(max(entry['watched_since'], window_start), now) if entry['watched_since'] else 0.0
+        entry['hours_watched'] = round(hours, 1)
+        entry['rate_per_hour'] = ((entry['new_matches'] + ADAPTIVE_POLLING['prior_matches']) /
+                                  (hours + ADAPTIVE_POLLING['prior_hours']))
+        entry['requests_per_search'] = (entry['requests'] / entry['measured'] if entry['requests'] else
+                                        ADAPTIVE_POLLING['requests_per_search'])
+        del entry['requests'], entry['measured'], entry['watched_since']
+    return churn
+
+def plan_intervals(churn: Dict[str, Dict], requests_per_day: float = None) -> Dict[str, Dict]:
+    """Polling interval per dealer that spends the request budget where new matches appear
+
+    Polling dealer i every T_i hours delays a new match by T_i / 2 on
+    average and costs r_i * HOURS_PER_DAY / T_i requests a day. Minimizing
+    the delay summed over all new matches, sum(rate_i * T_i / 2), within
+    the budget gives T_i proportional to sqrt(r_i / rate_i): a dealer with
+    four times the churn is polled twice as often. Intervals pinned at
+    min_interval / max_interval hand the rest of the budget to the others.
+    """
+    requests = {key: entry['requests_per_search'] for key, entry in churn.items()}
+    budget = requests_per_day or ADAPTIVE_POLLING['requests_per_day'] or fixed_schedule_budget(requests)
+    low, high = ADAPTIVE_POLLING['min_interval'] / 60, ADAPTIVE_POLLING['max_interval'] / 60
+
+    intervals = {}
+    free = set(churn)
+    while free:
+        remaining = budget - sum(requests[key] * HOURS_PER_DAY / hours for key, hours in intervals.items())
+        weight = sum(math.sqrt(requests[key] * churn[key]['rate_per_hour']) for key in free)
+        scale = weight * HOURS_PER_DAY / remaining if remaining > 0 else math.inf
+        proposed = {key: scale * math.sqrt(requests[key] / churn[key]['rate_per_hour']) for key in free}
+        pinned = {key: min(max(hours, low), high) for key, hours in proposed.items() if not low <= hours <= high}
+        if not pinned:
+            intervals.update(proposed)
+            break
+        # Pin the ones furthest out of range first, then share out what is left again
+        key = max(pinned, key=lambda key: max(low / proposed[key], proposed[key] / high))
+        intervals[key] = pinned[key]
+        free.remove(key)
+
+    plan = {}
+    for key, entry in churn.items():
+        hours = intervals[key]
+        plan[key] = {
+            'name': entry['name'],
+            'interval_minutes': round(hours * 60, 1),
+            'new_per_day': round(entry['rate_per_hour'] * HOURS_PER_DAY, 2),
+            'searches_per_day': round(HOURS_PER_DAY / hours, 2),
+            'requests_per_day': round(requests[key] * HOURS_PER_DAY / hours, 1),
+            'expected_delay_minutes': round(hours * 30, 1)
+        }
+    return plan
+
+class AdaptivePolling:
+    """Learned per-dealer polling intervals, refreshed from the tracked data after each search"""
+
+    def __init__(self, load_history: Callable[[], Tuple[List[Dict], List[Dict]]], locations: Dict = None,
+                 requests_per_day: float = None):
+        """
+        Args:
+            load_history: Returns (recent matches, search history), e.g. from a DataManager
+            locations: Dealers to poll (LEITH_HONDA_LOCATIONS)
+            requests_per_day: Request budget (ADAPTIVE_POLLING['requests_per_day'])
+        """
+        self.load_history = load_history
+        self.locations = locations or LEITH_HONDA_LOCATIONS
+        self.requests_per_day = requests_per_day
+        self.plan: Dict[str, Dict] = {}
+
+    def refresh(self, now: datetime = None) -> Dict[str, Dict]:
+        """Re-estimate every dealer's churn and interval"""
+        try:
+            recent_matches, search_history = self.load_history()
+        except Exception as e:
+            logger.error(f"Could not read search history for adaptive polling: {e}")
+            if self.plan:
+                return self.plan  # Keep the intervals learned so far
+            recent_matches, search_history = [], []
+        self.plan = plan_intervals(estimate_churn(recent_matches, search_history, now, self.locations),
+                                   self.requests_per_day)
+        return self.plan
+
+    def next_poll(self, key: str, after: datetime) -> datetime:
+        """When to search dealer `key` next, having searched it at `after`"""
+        if key not in self.plan:
+            self.refresh(after)
+        return add_active_hours(after, self.plan[key]['interval_minutes'] / 60)
+
+def load_polling_history(data_manager=None) -> Tuple[List[Dict], List[Dict]]:
+    """Recent matches and search history from the data store, as AdaptivePolling reads them"""
+    if data_manager is None:
+        from data_manager import DataManager
+        data_manager = DataManager()
+    recent_matches = data_manager.get_recent_matches(ADAPTIVE_POLLING['window_days'])
+    return recent_matches, data_manager.store.get_meta('search_history') or []
+
+def format_plan(plan: Dict[str, Dict]) -> List[str]:
+    """Table lines for --polling-plan"""
+    lines = [f"{'dealership':<24} {'new/day':>8} {'interval':>10} {'searches/day':>13} {'requests/day':>13}"]
+    for entry in sorted(plan.values(), key=lambda entry: entry['interval_minutes']):
+        lines.append(f"{entry['name']:<24} {entry['new_per_day']:>8.2f} {entry['interval_minutes']:>7.0f} min "
+                     f"{entry['searches_per_day']:>13.2f} {entry['requests_per_day']:>13.1f}")
+    total = sum(entry['requests_per_day'] for entry in plan.values())
+    lines.append(f"{'total':<24} {'':>8} {'':>10} {'':>13} {total:>13.1f}")
+    return lines
@@ -0,0 +1,161 @@
+import asyncio
+import logging
+from urllib.parse import urlparse
+from typing import List, Dict, Optional, Tuple
+from scraper import HondaScraper
+from vehicle import Vehicle
+from config import SCRAPER_CONCURRENCY
+from transport import Transport, CircuitOpenError
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp is only needed for the async engine
+    aiohttp = None
+
+logger = logging.getLogger(__name__)
+
+class AsyncHondaScraper(HondaScraper):
+    """Event-loop scraper with the same search contract as HondaScraper
+
+    All search pages are fetched from a single asyncio loop over one pooled
+    keep-alive aiohttp session. Each dealer domain gets its own semaphore so
+    hundreds of URLs can be in flight without hammering any one host, and
+    requests go through the same Transport pacing, retries and circuit
+    breaker as the sync engine.
+    Parsing and extraction are inherited from HondaScraper unchanged.
+    """
+
+    def __init__(self, locations: Dict = None, per_host: int = None, max_connections: int = None,
+                 use_cache: bool = None, transport: Transport = None):
+        if aiohttp is None:
+            raise ImportError("The async scraper engine requires aiohttp (pip install aiohttp)")
+
+        super().__init__(locations=locations, concurrent=True, per_host=per_host, use_cache=use_cache,
+                         transport=transport)
+        self.max_connections = max_connections or SCRAPER_CONCURRENCY['max_connections']
+        self._domain_limits = {}
+
+    def search_vehicles(self) -> List[Vehicle]:
+        """Search for vehicles across all locations on a single event loop"""
+        return asyncio.run(self.search_vehicles_async())
+
+    def search_location_inventory(self, location_info: Dict, inventory_type: str) -> List[Dict]:
+        """Search specific location's inventory (new or used)"""
+        tasks = [
+            (location_info, inventory_type, search_url)
+            for search_url in self.build_location_search_urls(location_info, inventory_type)
+        ]
+        return asyncio.run(self._run_tasks(tasks))
+
+    async def search_vehicles_async(self) -> List[Dict]:
+        """Fetch every location's search pages concurrently and year-filter the merged result"""
+        logger.info(f"🏢 Searching {len(self.locations)} Leith Honda locations (async engine)...")
+
+        tasks: List[Tuple[Dict, str, str]] = []
+        for location_info in self.locations.values():
+            for inventory_type in ("new", "used"):
+                for search_url in self.build_location_search_urls(location_info, inventory_type):
+                    tasks.append((location_info, inventory_type, search_url))
+
+        all_vehicles = await self._run_tasks(tasks)
+
+        if self.cache:
+            self.cache.save()
+
+        filtered_vehicles = self.filter_vehicles_by_year(all_vehicles)
+        logger.info(f"Found {len(filtered_vehicles)} vehicles matching criteria across all locations")
+        return filtered_vehicles
+
+    async def _run_tasks(self, tasks: List[Tuple[Dict, str, str]]) -> List[Dict]:
+        """Run search page tasks on one pooled session, merging results in task order"""
+        if not tasks:
+            return []
+
+        # Semaphores belong to the running loop, so start fresh for every run
+        self._domain_limits = {}
+
+        connector = aiohttp.TCPConnector(limit=self.max_connections, limit_per_host=self.per_host)
+        timeout = aiohttp.ClientTimeout(total=self.transport.timeout)
+        headers = dict(self.session.headers)
+
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout, headers=headers) as session:
+            page_results = await asyncio.gather(*[
+                self.search_page_async(session, location_info, inventory_type, search_url)
+                for location_info, inventory_type, search_url in tasks
+            ])
+
+        all_vehicles = []
+        for page_vehicles in page_results:
+            all_vehicles.extend(page_vehicles)
+        return all_vehicles
+
+    def _domain_limit(self, url: str) -> asyncio.Semaphore:
+        """Get the semaphore that caps concurrent requests to the URL's domain"""
+        host = urlparse(url).netloc
+        if host not in self._domain_limits:
+            self._domain_limits[host] = asyncio.Semaphore(self.per_host)
+        return self._domain_limits[host]
+
+    async def fetch_search_vehicles_async(self, session, search_url: str,
+                                          discover_pages: bool = False) -> Optional[Tuple[List[Dict], List[str]]]:
+        """Fetch a search page (conditionally, when cached) and return its vehicles and further result pages"""
+        headers = self.cache.conditional_headers(search_url) if self.cache else None
+
+        async def send():
+            async with session.get(search_url, headers=headers) as response:
+                return response.status, response.headers, await response.read()
+
+        try:
+            logger.info(f"Fetching page: {search_url}")
+            status, response_headers, content = await self.transport.request_async(search_url, send,
+                                                                                    self._domain_limit(search_url))
+            if status >= 400:
+                logger.error(f"Error fetching page: {status} for url: {search_url}")
+                return None
+
+        except CircuitOpenError as e:
+            logger.warning(f"⛔ Skipping {search_url}: {e}")
+            return None
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            logger.error(f"Error fetching page: {e}")
+            return None
+
+        return self.extract_search_results(search_url, status, response_headers, content, discover_pages)
+
+    async def search_page_async(self, session, location_info: Dict, inventory_type: str, search_url: str) -> List[Dict]:
+        """Fetch one search URL (and its further result pages) and tag its vehicles with the location details"""
+        logger.info(f"Fetching {inventory_type} inventory: {search_url}")
+
+        try:
+            result = await self.fetch_search_vehicles_async(session, search_url, discover_pages=self.paginate)
+            if result is None:
+                logger.warning(f"Failed to get content from {search_url}")
+                return []
+
+            page_vehicles, page_urls = result
+            if page_urls:
+                page_vehicles = await self.fetch_remaining_pages_async(session, search_url, page_vehicles, page_urls)
+
+            return self.tag_vehicles(page_vehicles, location_info, inventory_type)
+
+        except Exception as e:
+            logger.error(f"Error processing {search_url}: {e}")
+            return []
+
+    async def fetch_remaining_pages_async(self, session, search_url: str, first_page: List[Dict],
+                                          page_urls: List[str]) -> List[Dict]:
+        """Fetch result pages 2..N in waves of per_host requests, with the same merge and stop rules as the sync engine"""
+        vehicles = []
+        seen = set()
+        if self.merge_first_page(search_url, vehicles, seen, first_page, page_urls):
+            return vehicles
+
+        for wave_start in range(0, len(page_urls), self.per_host):
+            wave = page_urls[wave_start:wave_start + self.per_host]
+            results = await asyncio.gather(*[
+                self.fetch_search_vehicles_async(session, page_url) for page_url in wave
+            ])
+            if self.merge_result_pages(search_url, vehicles, seen, wave, results):
+                break
+
+        return vehicles
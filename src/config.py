@@ -59,9 +59,128 @@ BUSINESS_HOURS = {
 
 SEARCH_TIMES = ['09:00', '13:00', '17:00']  # 9 AM, 1 PM, 5 PM
 
+# Cron-style schedules: 'minute hour day-of-month month day-of-week' (day-of-week 0 or 7 = Sunday, as in
+# cron; names like mon-fri work too), or a list of them. None runs SEARCH_TIMES on BUSINESS_HOURS['days'].
+SEARCH_SCHEDULE = None
+
+# Dealers searched on their own schedule instead of with the rest, e.g.
+# {'autopark_honda': '*/30 9-16 * * mon-sat'} (keys of LEITH_HONDA_LOCATIONS)
+DEALER_SCHEDULES = {}
+
+SCHEDULER = {
+    'workers': 2,        # Jobs that fall due together run side by side (their data updates still take turns)
+    'max_sleep': 3600    # Longest single sleep in seconds, so a changed system clock is noticed within the hour
+}
+
+# Adaptive polling: instead of the schedules above, each dealer is searched on its own interval, learned
+# from how often it has listed new matches (see python main.py --polling-plan). Intervals count business
+# hours only, and all dealers together stay within the request budget.
+ADAPTIVE_POLLING = {
+    'enabled': False,
+    'requests_per_day': None,      # HTTP requests per business day; None spends what the fixed schedule does
+    'min_interval': 30,            # Minutes
+    'max_interval': 8 * 60,        # Minutes (one business day)
+    'window_days': 14,             # New matches and search history this far back set each dealer's rate
+    'prior_matches': 1.0,          # Every dealer starts as if it had listed this many matches ...
+    'prior_hours': 8.0,            # ... in this many business hours, until its own history takes over
+    'requests_per_search': 4       # HTTP requests per dealer search until search history has measured it
+}
+
+# Scraper Concurrency Configuration
+SCRAPER_CONCURRENCY = {
+    'enabled': True,   # Fetch search pages on a worker pool instead of one at a time
+    'max_workers': 8,  # Total worker threads shared by all dealerships
+    'per_host': 2,     # Max simultaneous requests to a single dealer host
+    'max_connections': 100  # Async engine: total pooled keep-alive connections
+}
+
+# Scraper transport: per-host pacing, retries and circuit breaker for dealer requests
+TRANSPORT = {
+    'rate': 2.0,             # Requests per second per dealer host (0 turns pacing off)
+    'burst': 4,              # Requests a host may get back to back before pacing starts
+    'timeout': 30,           # Seconds per request
+    'retries': 2,            # Extra attempts after a 429 / 5xx answer or a dropped connection
+    'backoff': 1.0,          # Backoff base in seconds, doubled per attempt with full jitter
+    'max_backoff': 30.0,     # Cap on any backoff, including a server's Retry-After
+    'failure_threshold': 3,  # Consecutive failures (5xx, 403, 429 without Retry-After, no answer) that open a host's circuit
+    'cooldown': 300          # Seconds a host with an open circuit is skipped before one probe request
+}
+
+# Scraper engine: 'sync' (requests + worker pool) or 'async' (aiohttp event loop)
+SCRAPER_ENGINE = 'sync'
+
+# HTML parser backend: 'lxml' (default), 'html.parser' or 'html5lib'
+HTML_PARSER = 'lxml'
+RESTRICTED_PARSE = False  # Build only anchors and price containers for search pages
+STRUCTURED_DATA = True    # Read embedded JSON-LD / inventory JSON before the HTML heuristics
+
+# Search result pagination: pages 2..N are discovered from page 1 and fetched under the per-host cap
+PAGINATION = {
+    'enabled': True,
+    'max_pages': 10,        # Upper bound on result pages fetched per search URL
+    'stop_on_known': True   # Stop once a page after page 1 lists only already-tracked vehicles
+}
+
+# Conditional-request cache for search pages (ETag / Last-Modified)
+RESPONSE_CACHE = {
+    'enabled': True,
+    'file': 'response_cache.json',
+    'max_entries': 500,    # Least recently used entries beyond this are evicted
+    'max_age_hours': 72    # Entries older than this are revalidated from scratch
+}
+
 # Web Dashboard Configuration
 WEB_DASHBOARD_ENABLED = True
 
+# Dashboard data under docs/: a small manifest plus fixed-size match pages and per-dealership shards
+WEB_DATA = {
+    'dir': 'data',
+    'page_size': 200    # Matches per page file; the newest page fills up before a new one starts
+}
+
+# Optional local dashboard server (python main.py --serve-dashboard): serves docs/ and pushes changes
+DASHBOARD_SERVER = {
+    'host': '127.0.0.1',
+    'port': 8765,
+    'watch_interval': 1.0,     # Seconds between manifest checks, for runs written by another process
+    'keepalive': 15,           # Seconds between keep-alive comments on idle event streams
+    'long_poll_timeout': 25,   # Longest wait on GET /changes
+    'max_events': 100          # Changes kept for clients resuming from a cursor
+}
+
+# Daemon mode (python main.py --daemon): one resident process keeps the scraper, data and dashboard warm
+DAEMON = {
+    'journal': True   # With DATA_BACKEND = 'json', persist each run as journal records (folded into the file on exit)
+}
+
 # File paths
 DATA_FILE = 'previous_matches.json'
+SQLITE_FILE = 'previous_matches.db'
+PARTITION_DIR = 'previous_matches.d'
+
+# Tracked vehicle store: 'json' (previous_matches.json), 'journal' (previous_matches.json plus an
+# append-only previous_matches.json.journal), 'sqlite' (see main.py --migrate-sqlite) or
+# 'partitioned' (one file per day or week of first_seen in PARTITION_DIR, see --migrate-partitions)
+DATA_BACKEND = 'json'
+
+# On-disk encoding of the JSON / journal snapshot: 'json' (indented), 'json-min', 'json-gz' or
+# 'msgpack' (needs the msgpack package). Any of them is detected automatically on load.
+DATA_FORMAT = 'json'
+
+# Journal backend: fold the journal into a new previous_matches.json after this many records
+JOURNAL = {
+    'compact_records': 500
+}
+
+# Partitioned backend: 'day' or 'week' partitions; cleanup deletes whole expired partitions
+PARTITIONS = {
+    'granularity': 'day'
+}
+
+# Duplicate-check index over tracked vehicle ids
+ID_INDEX = {
+    'bloom_filter': False,       # Bloom filter prefilter in front of the exact id lookup (large histories)
+    'bloom_error_rate': 0.001,   # Target false-positive rate
+    'bloom_min_capacity': 10000  # Smallest filter built, so a fresh store has room to grow
+}
 LOG_FILE = 'search.log'
\ No newline at end of file
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Local dashboard server - serves docs/ and pushes dashboard changes to open pages
+
+GET /events streams changes as Server-Sent Events; GET /changes?cursor=N is
+the long-poll equivalent for clients without EventSource. Each change is the
+delta between two versions of docs/data/manifest.json, so a page already
+holding the data applies it without downloading any shard.
+"""
+
+import os
+import sys
+import json
+import logging
+import argparse
+import threading
+from collections import deque
+from functools import partial
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+from typing import Dict, List, Optional
+from config import DASHBOARD_SERVER, WEB_DATA
+from web_updater import DOCS_DIR, load_converter
+
+logger = logging.getLogger(__name__)
+
+# Manifest keys that are not statistics
+INDEX_KEYS = ('page_size', 'version', 'pages', 'dealerships')
+
+# Feeds of the servers running in this process, refreshed as soon as a run has updated the dashboard
+_running_feeds = []
+
+def notify_dashboard_updated():
+    """Publish the change a run just wrote to every dashboard server in this process (no-op when none runs)"""
+    for feed in list(_running_feeds):
+        feed.refresh()
+
+class ChangeFeed:
+    """Numbered log of dashboard changes that clients read from a cursor
+
+    A change lists the matches added (per page file) and removed, the new
+    statistics, and the page and dealership index entries that changed. When
+    a client's cursor is too old, or the data was rebuilt rather than
+    updated, it gets a change with 'reset' set and reloads the manifest.
+    """
+
+    def __init__(self, data_dir: str = None, max_events: int = None):
+        self.data_dir = data_dir or os.path.join(DOCS_DIR, WEB_DATA['dir'])
+        self.events = deque(maxlen=max_events or DASHBOARD_SERVER['max_events'])
+        self.cursor = 0
+        self.converter = load_converter()
+        self.manifest = None
+        self.page_keys = {}  # Page file -> keys of its matches, for the manifest last read
+        self.manifest_mtime = None
+        self.closed = False
+        self.condition = threading.Condition()
+        self.refresh()  # Baseline; nothing to publish yet
+
+    def refresh(self) -> Optional[Dict]:
+        """Re-read the manifest if it changed on disk and publish the difference; returns the change published"""
+        path = os.path.join(self.data_dir, self.converter.MANIFEST_FILE)
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+        with self.condition:
+            if mtime == self.manifest_mtime:
+                return None
+            manifest = self.converter.read_manifest(self.data_dir)
+            if manifest is None or 'pages' not in manifest:
+                return None
+            self.manifest_mtime = mtime
+            previous, self.manifest = self.manifest, manifest
+
+            try:
+                change = self._diff(previous, manifest)
+            except (OSError, ValueError) as e:
+                logger.warning(f"⚠️ Could not read dashboard pages, clients will reload: {e}")
+                self.page_keys = {}
+                change = {'reset': True}
+            if previous is None:
+                return None
+
+            self.cursor += 1
+            change.update(cursor=self.cursor, version=manifest['version'])
+            self.events.append(change)
+            self.condition.notify_all()
+            return change
+
+    def _read_page(self, file: str) -> List[Dict]:
+        with open(os.path.join(self.data_dir, file), 'rb') as f:
+            return json.loads(f.read())
+
+    def _diff(self, previous: Optional[Dict], manifest: Dict) -> Dict:
+        old_pages = {page['file']: page for page in previous['pages']} if previous else {}
+        new_pages = {page['file']: page for page in manifest['pages']}
+        changed_pages = [file for file, page in new_pages.items() if old_pages.get(file, {}).get('hash') != page['hash']]
+        removed_pages = [file for file in old_pages if file not in new_pages]
+
+        old_location = {}
+        for file in changed_pages + removed_pages:
+            for key in self.page_keys.pop(file, ()):
+                old_location[key] = file
+
+        added = {}
+        moved = False
+        entry_key = self.converter.entry_key
+        for file in changed_pages:
+            matches = self._read_page(file)
+            self.page_keys[file] = [entry_key(match) for match in matches]
+            for key, match in zip(self.page_keys[file], matches):
+                old_file = old_location.pop(key, None)
+                if old_file is None:
+                    added.setdefault(file, []).append(match)
+                elif old_file != file:
+                    moved = True
+
+        if previous is None or moved:
+            # First read, or the pages were laid out again by a full rebuild
+            return {'reset': True}
+
+        old_dealerships = previous.get('dealerships', {})
+        new_dealerships = manifest.get('dealerships', {})
+        return {
+            'reset': False,
+            'stats': {key: value for key, value in manifest.items() if key not in INDEX_KEYS},
+            'added': added,
+            'removed': [list(key) for key in old_location],
+            'pages': [new_pages[file] for file in changed_pages],
+            'removed_pages': removed_pages,
+            'dealerships': {name: shard for name, shard in new_dealerships.items()
+                            if old_dealerships.get(name, {}).get('hash') != shard['hash']},
+            'removed_dealerships': [name for name in old_dealerships if name not in new_dealerships]
+        }
+
+    def changes_since(self, cursor: int) -> List[Dict]:
+        """Changes after the cursor; a single reset change when the cursor is unknown or too old"""
+        with self.condition:
+            oldest = self.events[0]['cursor'] if self.events else self.cursor + 1
+            if cursor > self.cursor or cursor < oldest - 1:
+                return [{'cursor': self.cursor, 'reset': True,
+                         'version': self.manifest['version'] if self.manifest else None}]
+            return [change for change in self.events if change['cursor'] > cursor]
+
+    def wait(self, cursor: int, timeout: float) -> List[Dict]:
+        """Block until there are changes after the cursor (or the timeout passes) and return them"""
+        with self.condition:
+            self.condition.wait_for(lambda: self.closed or self.cursor != cursor, timeout)
+        return [] if self.closed else self.changes_since(cursor)
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+
+class DashboardServer:
+    """Threaded local HTTP server for the web dashboard with a push change feed"""
+
+    def __init__(self, host: str = None, port: int = None, docs_dir: str = None, watch_interval: float = None):
+        """
+        Args:
+            host, port: Address to listen on (DASHBOARD_SERVER defaults; port 0 picks a free one)
+            docs_dir: Dashboard directory to serve (docs/)
+            watch_interval: Seconds between checks for dashboard data written by another process
+        """
+        self.host = host or DASHBOARD_SERVER['host']
+        self.port = DASHBOARD_SERVER['port'] if port is None else port
+        self.docs_dir = docs_dir or DOCS_DIR
+        self.watch_interval = watch_interval or DASHBOARD_SERVER['watch_interval']
+        self.feed = ChangeFeed(os.path.join(self.docs_dir, WEB_DATA['dir']))
+        self.streams_open = 0
+        self._stopped = threading.Event()
+        self._server = None
+        self._threads = []
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def _make_handler(self):
+        dashboard = self
+
+        class Handler(SimpleHTTPRequestHandler):
+            def do_GET(self):
+                parsed = urlparse(self.path)
+                query = parse_qs(parsed.query)
+                if parsed.path == '/events':
+                    cursor = self.headers.get('Last-Event-ID') or query.get('cursor', [None])[0]
+                    self.stream_events(int(cursor) if cursor else dashboard.feed.cursor)
+                elif parsed.path == '/changes':
+                    self.long_poll(query)
+                else:
+                    super().do_GET()
+
+            def stream_events(self, cursor: int):
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/event-stream')
+                self.send_header('Cache-Control', 'no-cache')
+                self.end_headers()
+                dashboard.streams_open += 1
+                try:
+                    self.wfile.write(b'retry: 3000\n\n')
+                    self.wfile.flush()
+                    while not dashboard._stopped.is_set():
+                        changes = dashboard.feed.wait(cursor, DASHBOARD_SERVER['keepalive'])
+                        for change in changes:
+                            cursor = change['cursor']
+                            self.wfile.write(f"id: {cursor}\nevent: change\ndata: {json.dumps(change)}\n\n".encode())
+                        if not changes:
+                            self.wfile.write(b': keepalive\n\n')
+                        self.wfile.flush()
+                except (BrokenPipeError, ConnectionResetError):
+                    pass  # Page closed
+                finally:
+                    dashboard.streams_open -= 1
+
+            def long_poll(self, query: dict):
+                cursor = query.get('cursor', [None])[0]
+                if cursor is None:
+                    # No cursor yet: hand out the current one without waiting
+                    body = {'cursor': dashboard.feed.cursor, 'changes': []}
+                else:
+                    timeout = min(float(query.get('timeout', [DASHBOARD_SERVER['long_poll_timeout']])[0]),
+                                  DASHBOARD_SERVER['long_poll_timeout'])
+                    changes = dashboard.feed.wait(int(cursor), timeout)
+                    body = {'cursor': changes[-1]['cursor'] if changes else int(cursor), 'changes': changes}
+                content = json.dumps(body).encode()
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Cache-Control', 'no-cache')
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, format, *args):
+                logger.debug(f"{self.address_string()} {format % args}")
+
+        return partial(Handler, directory=self.docs_dir)
+
+    def _watch(self):
+        while not self._stopped.wait(self.watch_interval):
+            self.feed.refresh()
+
+    def start(self) -> 'DashboardServer':
+        self._server = ThreadingHTTPServer((self.host, self.port), self._make_handler())
+        self._server.daemon_threads = True
+        self._threads = [threading.Thread(target=self._server.serve_forever, daemon=True),
+                         threading.Thread(target=self._watch, daemon=True)]
+        for thread in self._threads:
+            thread.start()
+        _running_feeds.append(self.feed)
+        logger.info(f"📡 Dashboard server running at {self.base_url}/")
+        return self
+
+    def stop(self):
+        if self._server:
+            self._stopped.set()
+            self.feed.close()
+            if self.feed in _running_feeds:
+                _running_feeds.remove(self.feed)
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='Serve the web dashboard with live change events')
+    parser.add_argument('--host', default=None)
+    parser.add_argument('--port', type=int, default=None)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, handlers=[logging.StreamHandler(sys.stdout)])
+    server = DashboardServer(args.host, args.port).start()
+    print(f"📡 Dashboard at {server.base_url}/ (Ctrl+C to stop)")
+    try:
+        server._stopped.wait()
+    except KeyboardInterrupt:
+        server.stop()
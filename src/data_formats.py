@@ -0,0 +1,79 @@
+import gzip
+import json
+import logging
+from typing import Dict, List
+from config import DATA_FORMAT
+
+try:
+    import msgpack
+except ImportError:  # msgpack is only needed for the msgpack data format
+    msgpack = None
+
+logger = logging.getLogger(__name__)
+
+# On-disk encodings for the data file. Loading detects the format from the
+# content, so switching DATA_FORMAT needs no migration step.
+DATA_FORMATS = ['json', 'json-min', 'json-gz', 'msgpack']
+
+DEFAULT_FORMAT = 'json'
+GZIP_MAGIC = b'\x1f\x8b'
+
+# File extensions used by export_data
+FORMAT_EXTENSIONS = {
+    'json': '.json',
+    'json-min': '.json',
+    'json-gz': '.json.gz',
+    'msgpack': '.msgpack'
+}
+
+def available_formats() -> List[str]:
+    """List the data formats that can be used in this environment"""
+    return [name for name in DATA_FORMATS if name != 'msgpack' or msgpack is not None]
+
+def resolve_format(name: str = None) -> str:
+    """Return the requested format if usable, otherwise fall back to pretty-printed JSON"""
+    name = name or DATA_FORMAT
+    if name not in DATA_FORMATS:
+        logger.warning(f"Unknown data format '{name}', using {DEFAULT_FORMAT}")
+        return DEFAULT_FORMAT
+    if name not in available_formats():
+        logger.warning(f"Data format '{name}' needs the msgpack package, using {DEFAULT_FORMAT}")
+        return DEFAULT_FORMAT
+    return name
+
+def encode(data: Dict, data_format: str) -> bytes:
+    """Serialize the data document in the given format"""
+    if data_format == 'msgpack':
+        return msgpack.packb(data, default=str, use_bin_type=True)
+
+    if data_format == 'json':
+        text = json.dumps(data, indent=2, default=str)
+    else:
+        text = json.dumps(data, separators=(',', ':'), default=str)
+    raw = text.encode('utf-8')
+    return gzip.compress(raw, compresslevel=6) if data_format == 'json-gz' else raw
+
+def detect_format(raw: bytes) -> str:
+    """Tell the format of a data file from its first bytes"""
+    if raw.startswith(GZIP_MAGIC):
+        return 'json-gz'
+    stripped = raw.lstrip()
+    if stripped.startswith((b'{', b'[')) or not stripped:
+        return 'json'
+    return 'msgpack'
+
+def decode(raw: bytes) -> Dict:
+    """Deserialize a data file in any supported format"""
+    data_format = detect_format(raw)
+    if data_format == 'json-gz':
+        return json.loads(gzip.decompress(raw))
+    if data_format == 'msgpack':
+        if msgpack is None:
+            raise ValueError("data file is msgpack-encoded but the msgpack package is not installed")
+        return msgpack.unpackb(raw, raw=False, strict_map_key=False)
+    return json.loads(raw)
+
+def read_data_file(path: str) -> Dict:
+    """Load a data file written in any supported format"""
+    with open(path, 'rb') as f:
+        return decode(f.read())
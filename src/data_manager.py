@@ -1,52 +1,85 @@
-import json
-import os
 import logging
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import List, Dict, Set
-from config import DATA_FILE
+from storage import create_store, empty_data
+from vehicle import as_dicts
+import data_formats
 
 logger = logging.getLogger(__name__)
 
 class DataManager:
-    def __init__(self):
-        self.data_file = DATA_FILE
-        self.data = self.load_data()
+    def __init__(self, backend: str = None, data_file: str = None):
+        """
+        Args:
+            backend: Storage backend, 'json', 'journal', 'sqlite' or 'partitioned' (defaults to DATA_BACKEND)
+            data_file: Path of the JSON file, SQLite database or partition directory
+        """
+        self.store = create_store(backend, data_file)
+        self.data_file = self.store.path
+        self._in_transaction = False
+        self._dirty = False
+        self._write_baseline = (0, 0)
+    
+    @property
+    def data(self) -> Dict:
+        """The tracked data as one previous_matches.json document (read-only; change it through the methods below)"""
+        return self.store.snapshot()
     
     def load_data(self) -> Dict:
-        """Load previous search data from file"""
-        try:
-            if os.path.exists(self.data_file):
-                with open(self.data_file, 'r') as f:
-                    data = json.load(f)
-                    logger.info(f"Loaded data from {self.data_file}")
-                    return data
-            else:
-                logger.info(f"No existing data file found, starting fresh")
-                return {
-                    'previous_matches': [],
-                    'last_search': None,
-                    'total_searches': 0,
-                    'notifications_sent': 0
-                }
-        except Exception as e:
-            logger.error(f"Error loading data file: {e}")
-            return {
-                'previous_matches': [],
-                'last_search': None,
-                'total_searches': 0,
-                'notifications_sent': 0
-            }
+        """Load previous search data from the store"""
+        return self.store.load()
     
     def save_data(self) -> bool:
-        """Save current data to file"""
+        """Save current data to the store (deferred to commit inside a transaction)"""
+        if self._in_transaction:
+            self._dirty = True
+            return True
+        return self.store.save()
+    
+    @contextmanager
+    def transaction(self):
+        """Batch every change made inside the block into a single atomic save
+        
+        The changes are written once when the block exits normally and thrown
+        away if it raises. Nested blocks join the outer transaction.
+        """
+        if self._in_transaction:
+            yield self
+            return
+        
+        self._in_transaction = True
+        self._dirty = False
+        self._write_baseline = (self.store.writes, self.store.bytes_written)
         try:
-            with open(self.data_file, 'w') as f:
-                json.dump(self.data, f, indent=2, default=str)
-            logger.info(f"Data saved to {self.data_file}")
+            yield self
+        except Exception:
+            self._in_transaction = False
+            self.rollback()
+            raise
+        self._in_transaction = False
+        self.commit()
+    
+    def commit(self) -> bool:
+        """Write the changes batched by the current run"""
+        if not self._dirty:
             return True
-        except Exception as e:
-            logger.error(f"Error saving data file: {e}")
-            return False
+        self._dirty = False
+        return self.store.save()
+    
+    def rollback(self):
+        """Discard the changes batched by the current run"""
+        self._dirty = False
+        self.store.discard()
+        logger.warning("Discarded uncommitted data changes")
+    
+    def get_write_stats(self) -> Dict:
+        """Writes and bytes written since the last transaction started (or since load)"""
+        writes, bytes_written = self._write_baseline
+        return {
+            'writes': self.store.writes - writes,
+            'bytes_written': self.store.bytes_written - bytes_written
+        }
     
     def generate_vehicle_id(self, vehicle: Dict) -> str:
         """Generate unique identifier for a vehicle"""
@@ -68,16 +101,14 @@ class DataManager:
     
     def is_duplicate(self, vehicle: Dict) -> bool:
         """Check if vehicle has been seen before"""
-        vehicle_id = self.generate_vehicle_id(vehicle)
-        
-        for previous_vehicle in self.data['previous_matches']:
-            if previous_vehicle.get('id') == vehicle_id:
-                return True
-        
-        return False
+        return self.store.contains(self.generate_vehicle_id(vehicle))
+    
+    def get_known_keys(self) -> Set[str]:
+        """VINs and listing URLs of every tracked vehicle, used to stop paginating once results are all known"""
+        return self.store.known_keys()
     
     def get_new_vehicles(self, current_vehicles: List[Dict]) -> List[Dict]:
-        """Filter out vehicles that have been seen before"""
+        """Filter out vehicles (dicts or Vehicle records) that have been seen before"""
         new_vehicles = []
         
         for vehicle in current_vehicles:
@@ -90,44 +121,42 @@ class DataManager:
         return new_vehicles
     
     def add_vehicles(self, vehicles: List[Dict]):
-        """Add new vehicles to the previous matches"""
+        """Add new vehicles (dicts or Vehicle records) to the previous matches"""
         for vehicle in vehicles:
             if 'id' not in vehicle:
                 vehicle['id'] = self.generate_vehicle_id(vehicle)
             if 'first_seen' not in vehicle:
                 vehicle['first_seen'] = datetime.now().isoformat()
         
-        self.data['previous_matches'].extend(vehicles)
+        self.store.add_matches(as_dicts(vehicles))
         self.save_data()
     
-    def update_search_stats(self, vehicles_found: int, notifications_sent: bool = False, no_matches_notification_sent: bool = False):
-        """Update search statistics"""
-        self.data['last_search'] = datetime.now().isoformat()
-        self.data['total_searches'] += 1
+    def update_search_stats(self, vehicles_found: int, notifications_sent: bool = False, no_matches_notification_sent: bool = False,
+                            run_stats: Dict = None):
+        """Update search statistics (run_stats holds per-run scraper counters such as cache hits)"""
+        store = self.store
+        store.set_meta('last_search', datetime.now().isoformat())
+        store.set_meta('total_searches', store.get_meta('total_searches', 0) + 1)
         
         if notifications_sent:
-            self.data['notifications_sent'] += 1
+            store.set_meta('notifications_sent', store.get_meta('notifications_sent', 0) + 1)
             
         if no_matches_notification_sent:
-            self.data['last_no_matches_notification'] = datetime.now().isoformat()
-            if 'no_matches_notifications_sent' not in self.data:
-                self.data['no_matches_notifications_sent'] = 0
-            self.data['no_matches_notifications_sent'] += 1
+            store.set_meta('last_no_matches_notification', datetime.now().isoformat())
+            store.set_meta('no_matches_notifications_sent', store.get_meta('no_matches_notifications_sent', 0) + 1)
         
         # Add search log entry
-        if 'search_history' not in self.data:
-            self.data['search_history'] = []
-        
-        self.data['search_history'].append({
+        history_entry = {
             'timestamp': datetime.now().isoformat(),
             'vehicles_found': vehicles_found,
             'notifications_sent': notifications_sent,
             'no_matches_notification_sent': no_matches_notification_sent
-        })
+        }
+        if run_stats:
+            history_entry['run_stats'] = run_stats
         
         # Keep only last 100 search history entries
-        if len(self.data['search_history']) > 100:
-            self.data['search_history'] = self.data['search_history'][-100:]
+        store.append_history(history_entry, keep=100)
         
         self.save_data()
     
@@ -135,15 +164,7 @@ class DataManager:
         """Remove matches older than specified days"""
         cutoff_date = datetime.now() - timedelta(days=days_to_keep)
         
-        original_count = len(self.data['previous_matches'])
-        
-        self.data['previous_matches'] = [
-            match for match in self.data['previous_matches']
-            if 'first_seen' in match and 
-            datetime.fromisoformat(match['first_seen']) > cutoff_date
-        ]
-        
-        removed_count = original_count - len(self.data['previous_matches'])
+        removed_count = self.store.remove_matches_before(cutoff_date.isoformat())
         
         if removed_count > 0:
             logger.info(f"Cleaned up {removed_count} old matches (older than {days_to_keep} days)")
@@ -156,7 +177,7 @@ class DataManager:
         elif frequency == 'always':
             return True
         
-        last_notification = self.data.get('last_no_matches_notification')
+        last_notification = self.store.get_meta('last_no_matches_notification')
         if not last_notification:
             return True  # Never sent before
         
@@ -178,41 +199,33 @@ class DataManager:
 
     def get_stats(self) -> Dict:
         """Get summary statistics"""
+        store = self.store
         return {
-            'total_matches_tracked': len(self.data['previous_matches']),
-            'total_searches': self.data.get('total_searches', 0),
-            'notifications_sent': self.data.get('notifications_sent', 0),
-            'no_matches_notifications_sent': self.data.get('no_matches_notifications_sent', 0),
-            'last_search': self.data.get('last_search'),
-            'last_no_matches_notification': self.data.get('last_no_matches_notification'),
-            'data_file_size': os.path.getsize(self.data_file) if os.path.exists(self.data_file) else 0
+            'total_matches_tracked': store.count(),
+            'total_searches': store.get_meta('total_searches', 0),
+            'notifications_sent': store.get_meta('notifications_sent', 0),
+            'no_matches_notifications_sent': store.get_meta('no_matches_notifications_sent', 0),
+            'last_search': store.get_meta('last_search'),
+            'last_no_matches_notification': store.get_meta('last_no_matches_notification'),
+            'last_run_stats': (store.get_meta('search_history') or [{}])[-1].get('run_stats', {}),
+            'data_file_size': store.size_bytes()
         }
     
     def get_recent_matches(self, days: int = 7) -> List[Dict]:
         """Get matches from the last N days"""
         cutoff_date = datetime.now() - timedelta(days=days)
-        
-        recent_matches = []
-        for match in self.data['previous_matches']:
-            if 'first_seen' in match:
-                try:
-                    seen_date = datetime.fromisoformat(match['first_seen'])
-                    if seen_date > cutoff_date:
-                        recent_matches.append(match)
-                except ValueError:
-                    continue
-        
-        return recent_matches
+        return self.store.matches_since(cutoff_date.isoformat())
     
-    def export_data(self, filename: str = None) -> str:
-        """Export all data to a JSON file"""
+    def export_data(self, filename: str = None, data_format: str = 'json') -> str:
+        """Export all data to a file (pretty-printed JSON unless another data format is given)"""
+        data_format = data_formats.resolve_format(data_format)
         if not filename:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            filename = f"honda_search_export_{timestamp}.json"
+            filename = f"honda_search_export_{timestamp}{data_formats.FORMAT_EXTENSIONS[data_format]}"
         
         try:
-            with open(filename, 'w') as f:
-                json.dump(self.data, f, indent=2, default=str)
+            with open(filename, 'wb') as f:
+                f.write(data_formats.encode(self.store.snapshot(), data_format))
             
             logger.info(f"Data exported to {filename}")
             return filename
@@ -222,12 +235,6 @@ class DataManager:
     
     def reset_data(self):
         """Reset all data (useful for testing)"""
-        self.data = {
-            'previous_matches': [],
-            'last_search': None,
-            'total_searches': 0,
-            'notifications_sent': 0,
-            'search_history': []
-        }
+        self.store.reset({**empty_data(), 'search_history': []})
         self.save_data()
         logger.info("All data has been reset")
\ No newline at end of file
@@ -0,0 +1,40 @@
+import logging
+from typing import List
+from bs4 import BeautifulSoup, SoupStrainer
+from bs4.builder import builder_registry
+
+logger = logging.getLogger(__name__)
+
+# Parser backends in order of preference. All of them build a BeautifulSoup tree,
+# so extract_vehicles_from_page works unchanged whichever one is selected.
+PARSER_BACKENDS = {
+    'lxml': 'lxml',                # libxml2 via lxml (C, fastest)
+    'html.parser': 'html.parser',  # Pure-Python standard library fallback
+    'html5lib': 'html5lib'         # Optional, browser-grade but slowest
+}
+
+DEFAULT_FALLBACK = 'html.parser'
+
+# Restricted parsing keeps only anchors and the containers the price lookup in
+# extract_vehicles_from_page climbs to; head scripts, styles and JSON blobs are skipped
+SRP_STRAINER = SoupStrainer(['a', 'div', 'section', 'article', 'li'])
+
+def available_backends() -> List[str]:
+    """List the parser backends that can be used in this environment"""
+    return [name for name, feature in PARSER_BACKENDS.items() if builder_registry.lookup(feature)]
+
+def resolve_backend(name: str) -> str:
+    """Return the requested backend if installed, otherwise fall back to html.parser"""
+    if name not in PARSER_BACKENDS:
+        logger.warning(f"Unknown HTML parser backend '{name}', using {DEFAULT_FALLBACK}")
+        return DEFAULT_FALLBACK
+
+    if not builder_registry.lookup(PARSER_BACKENDS[name]):
+        logger.warning(f"HTML parser backend '{name}' is not installed, using {DEFAULT_FALLBACK}")
+        return DEFAULT_FALLBACK
+
+    return name
+
+def parse_html(content, backend: str = DEFAULT_FALLBACK, restricted: bool = False) -> BeautifulSoup:
+    """Parse page content with the given backend, optionally building only SRP-relevant subtrees"""
+    return BeautifulSoup(content, PARSER_BACKENDS[backend], parse_only=SRP_STRAINER if restricted else None)
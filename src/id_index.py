@@ -0,0 +1,93 @@
+import math
+from collections import Counter
+from typing import Iterable
+from config import ID_INDEX
+
+class BloomFilter:
+    """Fixed-size Bloom filter over string keys
+
+    Answers "definitely not present" or "possibly present"; used to skip exact
+    lookups for vehicles that were never tracked. Keys cannot be removed, so
+    stale bits only cost an extra exact check until the filter is rebuilt.
+    """
+
+    def __init__(self, capacity: int, error_rate: float = None):
+        self.capacity = max(capacity, 1)
+        self.error_rate = error_rate or ID_INDEX['bloom_error_rate']
+        self.size = max(8, math.ceil(-self.capacity * math.log(self.error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size / self.capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        # Double hashing from the built-in string hash; the filter only lives in memory,
+        # so per-process hash randomization does not matter
+        h = hash(key)
+        h1 = h & 0xFFFFFFFF
+        h2 = ((h >> 32) & 0xFFFFFFFF) | 1
+        size = self.size
+        return [(h1 + i * h2) % size for i in range(self.hash_count)]
+
+    def add(self, key: str):
+        bits = self.bits
+        for position in self._positions(key):
+            bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        bits = self.bits
+        for position in self._positions(key):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    @property
+    def full(self) -> bool:
+        """True once more keys were added than the filter was sized for"""
+        return self.count > self.capacity
+
+    @classmethod
+    def from_keys(cls, keys: Iterable[str], count: int, error_rate: float = None) -> 'BloomFilter':
+        """Build a filter sized with headroom for `count` keys and growth"""
+        bloom = cls(max(count * 2, ID_INDEX['bloom_min_capacity']), error_rate)
+        for key in keys:
+            bloom.add(key)
+        return bloom
+
+class IdIndex:
+    """In-memory index of tracked vehicle ids, with an optional Bloom filter prefilter
+
+    Ids are reference-counted because previous_matches may list the same
+    vehicle more than once, so removing one copy keeps the id tracked.
+    """
+
+    def __init__(self, ids: Iterable[str] = (), bloom_filter: bool = None):
+        self.counts = Counter(ids)
+        self.bloom_filter = ID_INDEX['bloom_filter'] if bloom_filter is None else bloom_filter
+        self.bloom = None
+        if self.bloom_filter:
+            self.rebuild_bloom()
+
+    def rebuild_bloom(self):
+        self.bloom = BloomFilter.from_keys(self.counts, len(self.counts))
+
+    def add(self, vehicle_id: str):
+        self.counts[vehicle_id] += 1
+        if self.bloom is not None:
+            self.bloom.add(vehicle_id)
+            if self.bloom.full:
+                self.rebuild_bloom()
+
+    def discard(self, vehicle_id: str):
+        if self.counts[vehicle_id] > 1:
+            self.counts[vehicle_id] -= 1
+        else:
+            self.counts.pop(vehicle_id, None)
+
+    def __contains__(self, vehicle_id: str) -> bool:
+        if self.bloom is not None and vehicle_id not in self.bloom:
+            return False
+        return vehicle_id in self.counts
+
+    def __len__(self) -> int:
+        return len(self.counts)
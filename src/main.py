@@ -10,10 +10,10 @@ import logging
 import sys
 import argparse
 from datetime import datetime
-from scraper import HondaScraper
 from data_manager import DataManager
 from scheduler import SearchScheduler
-from config import LOG_FILE
+from search_runner import perform_search
+from config import LOG_FILE, SCRAPER_ENGINE, DATA_FILE, SQLITE_FILE, PARTITION_DIR, DASHBOARD_SERVER, ADAPTIVE_POLLING
 
 # Set up logging
 def setup_logging(log_level=logging.INFO):
@@ -27,55 +27,6 @@ def setup_logging(log_level=logging.INFO):
         ]
     )
 
-def perform_search():
-    """Perform a single search and track inventory matches"""
-    logger = logging.getLogger(__name__)
-    
-    try:
-        # Initialize components
-        scraper = HondaScraper()
-        data_manager = DataManager()
-        
-        logger.info("Starting Honda car search...")
-        
-        # Perform the search
-        current_vehicles = scraper.search_vehicles()
-        logger.info(f"Found {len(current_vehicles)} total vehicles")
-        
-        # Filter for new vehicles
-        new_vehicles = data_manager.get_new_vehicles(current_vehicles)
-        logger.info(f"Found {len(new_vehicles)} new vehicles")
-        
-        # Track new vehicles
-        if new_vehicles:
-            logger.info(f"Tracking {len(new_vehicles)} new vehicles")
-            # Add new vehicles to tracking
-            data_manager.add_vehicles(new_vehicles)
-            logger.info("New vehicles added to tracking")
-        else:
-            logger.info("No new vehicles found")
-        
-        # Update statistics
-        data_manager.update_search_stats(len(current_vehicles), len(new_vehicles) > 0, False)
-        
-        # Update web dashboard
-        try:
-            from web_updater import update_web_dashboard
-            update_web_dashboard()
-        except ImportError:
-            pass  # Web dashboard not available
-        except Exception as e:
-            logger.warning(f"Failed to update web dashboard: {e}")
-        
-        # Clean up old data periodically
-        data_manager.cleanup_old_matches(30)
-        
-        return len(new_vehicles)
-        
-    except Exception as e:
-        logger.error(f"Error during search: {e}")
-        return 0
-
 def main():
     """Main application entry point"""
     parser = argparse.ArgumentParser(description='Honda Car Search System')
@@ -84,6 +35,18 @@ def main():
     parser.add_argument('--reset-data', action='store_true', help='Reset all stored data')
     parser.add_argument('--export-data', action='store_true', help='Export data to JSON file')
     parser.add_argument('--verbose', '-v', action='store_true', help='Enable verbose logging')
+    parser.add_argument('--migrate-sqlite', action='store_true',
+                        help=f'Copy {DATA_FILE} into the SQLite store {SQLITE_FILE} (then set DATA_BACKEND = "sqlite")')
+    parser.add_argument('--migrate-partitions', action='store_true',
+                        help=f'Copy {DATA_FILE} into the partitioned store {PARTITION_DIR} (then set DATA_BACKEND = "partitioned")')
+    parser.add_argument('--engine', choices=['sync', 'async'], default=None,
+                        help=f'Scraper engine to use (default: {SCRAPER_ENGINE})')
+    parser.add_argument('--daemon', action='store_true',
+                        help='Run scheduled searches in one resident process that keeps sessions and data warm')
+    parser.add_argument('--polling-plan', action='store_true',
+                        help='Show each dealer\'s learned churn and adaptive polling interval')
+    parser.add_argument('--serve-dashboard', action='store_true',
+                        help=f"Serve the web dashboard with live updates on http://{DASHBOARD_SERVER['host']}:{DASHBOARD_SERVER['port']}/")
     
     args = parser.parse_args()
     
@@ -94,11 +57,18 @@ def main():
     logger = logging.getLogger(__name__)
     logger.info("Honda Car Search Application Started")
     
+    dashboard_server = None
     try:
+        if args.serve_dashboard:
+            # Runs beside the search (or the scheduler) and pushes each run's dashboard changes
+            from dashboard_server import DashboardServer
+            dashboard_server = DashboardServer().start()
+            print(f"📡 Live dashboard: {dashboard_server.base_url}/")
+        
         if args.search_now:
             # Perform immediate search
             logger.info("Performing manual search...")
-            new_count = perform_search()
+            new_count = perform_search(args.engine)
             print(f"Search completed. Found {new_count} new vehicles.")
             return
         
@@ -114,6 +84,18 @@ def main():
             print(f"Last search: {stats['last_search'] or 'Never'}")
             print(f"Data file size: {stats['data_file_size']} bytes")
             
+            cache_stats = stats['last_run_stats'].get('response_cache')
+            if cache_stats:
+                print(f"Last run response cache: {cache_stats['hits']} not-modified / "
+                      f"{cache_stats.get('unchanged', 0)} unchanged / {cache_stats['misses']} parsed "
+                      f"({cache_stats.get('parse_seconds_saved', 0):.2f}s parse CPU saved)")
+            
+            transport_stats = stats['last_run_stats'].get('transport')
+            if transport_stats:
+                print(f"Last run transport: {transport_stats['requests']} requests / {transport_stats['retries']} retries / "
+                      f"{transport_stats['short_circuited']} skipped ({transport_stats['throttled_seconds']:.1f}s paced)"
+                      + (f", circuit open: {', '.join(transport_stats['open_hosts'])}" if transport_stats['open_hosts'] else ''))
+            
             # Show recent matches
             recent_matches = data_manager.get_recent_matches(7)
             print(f"\n🚗 Recent matches (last 7 days): {len(recent_matches)}")
@@ -122,6 +104,16 @@ def main():
             
             return
         
+        elif args.polling_plan:
+            # Intervals adaptive polling would use now (ADAPTIVE_POLLING in config.py)
+            from adaptive_polling import AdaptivePolling, format_plan, load_polling_history
+            plan = AdaptivePolling(load_polling_history).refresh()
+            print(f"\n🔁 Adaptive polling plan ({'enabled' if ADAPTIVE_POLLING['enabled'] else 'disabled'} in config.py)")
+            print("=" * 72)
+            for line in format_plan(plan):
+                print(line)
+            return
+        
         elif args.reset_data:
             # Reset all data
             data_manager = DataManager()
@@ -129,6 +121,26 @@ def main():
             print("✅ All data has been reset.")
             return
         
+        elif args.migrate_sqlite:
+            # One-shot migration of the JSON data file
+            from storage import migrate_json_to_sqlite
+            migrated = migrate_json_to_sqlite(DATA_FILE, SQLITE_FILE)
+            if migrated is None:
+                print(f"❌ {SQLITE_FILE} already contains tracked vehicles, nothing migrated.")
+            else:
+                print(f"✅ Migrated {migrated} tracked vehicles to {SQLITE_FILE}. Set DATA_BACKEND = 'sqlite' in config.py to use it.")
+            return
+        
+        elif args.migrate_partitions:
+            # One-shot migration of the JSON data file into day/week partitions
+            from storage import migrate_json_to_partitions
+            migrated = migrate_json_to_partitions(DATA_FILE, PARTITION_DIR)
+            if migrated is None:
+                print(f"❌ {PARTITION_DIR} already contains tracked vehicles, nothing migrated.")
+            else:
+                print(f"✅ Migrated {migrated} tracked vehicles to {PARTITION_DIR}. Set DATA_BACKEND = 'partitioned' in config.py to use it.")
+            return
+        
         elif args.export_data:
             # Export data
             data_manager = DataManager()
@@ -147,8 +159,16 @@ def main():
             print("Monitoring Honda dealerships for new inventory matches...")
             print("Press Ctrl+C to stop")
             
-            # Create scheduler with search function
-            scheduler = SearchScheduler(perform_search)
+            # Create scheduler with search function (a resident service in daemon mode)
+            service = None
+            if args.daemon:
+                from search_service import SearchService
+                service = SearchService(args.engine)
+                search_function = service.run_once
+                print(f"♻️  Daemon mode: {service.cold_setup_seconds * 1000:.0f} ms of setup done once and reused by every run")
+            else:
+                search_function = lambda locations=None: perform_search(args.engine, locations=locations)
+            scheduler = SearchScheduler(search_function, load_history=service.polling_history if service else None)
             
             # Show next scheduled runs
             next_runs = scheduler.get_next_scheduled_runs()
@@ -160,7 +180,11 @@ def main():
             print("\n" + "=" * 50)
             
             # Start the scheduler
-            scheduler.run_scheduler()
+            try:
+                scheduler.run_scheduler()
+            finally:
+                if service:
+                    service.close()
     
     except KeyboardInterrupt:
         logger.info("Application stopped by user")
@@ -171,6 +195,10 @@ def main():
         print(f"❌ Error: {e}")
         return 1
     
+    finally:
+        if dashboard_server:
+            dashboard_server.stop()
+    
     return 0
 
 if __name__ == "__main__":
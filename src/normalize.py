@@ -0,0 +1,122 @@
+import re
+from functools import lru_cache
+from typing import Dict, Optional
+
+# Patterns shared by the scraper, the structured-data reader and the dashboard converter, compiled once
+PRICE_PATTERN = re.compile(r'\$[\d,]+')
+PRICE_NUMBER_PATTERN = re.compile(r'\d[\d,]*(?:\.\d+)?')
+YEAR_PATTERN = re.compile(r'\b(19[89]\d|20\d{2})\b')
+URL_YEAR_PATTERN = re.compile(r'/(20\d{2})-')
+URL_ANY_YEAR_PATTERN = re.compile(r'(20\d{2})')
+TITLE_PATTERN = re.compile(r'(\d{4})\s+(Honda)\s+([\w\s]+)', re.I)
+VIN_PATTERN = re.compile(r'\b([A-HJ-NPR-Z0-9]{17})\b', re.I)
+EXPRESS_ID_PATTERN = re.compile(r'/express/([A-Z0-9]+)')
+MILEAGE_PATTERN = re.compile(r'(\d[\d,]*)\s*(?:mi|miles)\b', re.I)
+NUMBER_PATTERN = re.compile(r'\d[\d,]*')
+
+# Trims in order of precedence when a title mentions several ('Sport Touring' reads as Sport)
+TRIM_PATTERNS = [
+    ('Hybrid', re.compile(r'\bhybrid\b', re.I)),
+    ('Sport', re.compile(r'\bsport\b', re.I)),
+    ('Touring', re.compile(r'\btouring\b', re.I)),
+    ('EX', re.compile(r'\bex(?:-l)?\b', re.I)),
+    ('LX', re.compile(r'\blx\b', re.I)),
+]
+
+# Titles, prices and trims repeat across listings and runs, so their parsers are memoized; URLs, VINs and
+# odometer readings are unique per vehicle and would only churn a cache
+CACHE_SIZE = 16384
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_year(text: str) -> Optional[int]:
+    """First model year (1980-2099) standing on its own in a title or record value"""
+    match = YEAR_PATTERN.search(text)
+    return int(match.group(1)) if match else None
+
+def parse_url_year(url: str, anywhere: bool = False) -> Optional[int]:
+    """Model year from a dealer listing path like /used/Honda/2022-Honda-Civic-...
+
+    With anywhere=True the first 20xx anywhere in the URL counts, slugs and query parameters included.
+    """
+    match = (URL_ANY_YEAR_PATTERN if anywhere else URL_YEAR_PATTERN).search(url)
+    return int(match.group(1)) if match else None
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _price_text_cents(text: str) -> Optional[int]:
+    match = PRICE_PATTERN.search(text) or PRICE_NUMBER_PATTERN.search(text)
+    if not match:
+        return None
+    digits = match.group().lstrip('$').replace(',', '')
+    try:
+        cents = round(float(digits) * 100)
+    except ValueError:
+        return None
+    return cents if cents > 0 else None
+
+def parse_price_cents(value) -> Optional[int]:
+    """Price in integer cents from '$23,995', '23995.00', 23995 or similar"""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return round(value * 100) if value > 0 else None
+    return _price_text_cents(str(value))
+
+def format_price(cents: Optional[int]) -> Optional[str]:
+    """Whole-dollar display price like '$23,995'"""
+    return f"${cents // 100:,}" if cents else None
+
+def find_price(text: str) -> Optional[str]:
+    """The first '$23,995'-style price in a block of listing text, as written"""
+    match = PRICE_PATTERN.search(text)
+    return match.group() if match else None
+
+def parse_vin(text: str) -> Optional[str]:
+    """A 17-character VIN (no I, O or Q) in the text, upper-cased"""
+    match = VIN_PATTERN.search(text)
+    return match.group(1).upper() if match else None
+
+def find_express_id(html: str) -> Optional[str]:
+    """Vehicle id from a dealer '/express/<id>' checkout link"""
+    match = EXPRESS_ID_PATTERN.search(html)
+    return match.group(1) if match else None
+
+def _mileage_text(text: str) -> Optional[int]:
+    match = MILEAGE_PATTERN.search(text)
+    digits = match.group(1) if match else None
+    if digits is None:
+        match = NUMBER_PATTERN.search(text)
+        digits = match.group() if match else None
+    return int(digits.replace(',', '')) if digits else None
+
+def parse_mileage(value) -> Optional[int]:
+    """Odometer miles from '15,420 mi', '15420' or 15420"""
+    if value is None or isinstance(value, bool):
+        return None
+    if isinstance(value, (int, float)):
+        return int(value)
+    return _mileage_text(str(value))
+
+def format_mileage(miles: Optional[int]) -> Optional[str]:
+    """Mileage as the dashboard shows it, like '15,420'"""
+    return f"{miles:,}" if miles is not None else None
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_trim(text: str) -> Optional[str]:
+    """Trim level named in a title or listing text"""
+    for trim, pattern in TRIM_PATTERNS:
+        if pattern.search(text):
+            return trim
+    return None
+
+def normalized_fields(vehicle: Dict) -> Dict:
+    """Typed year, price (cents), mileage, VIN and trim for a vehicle dict or Vehicle record"""
+    title = vehicle.get('title') or ''
+    url = vehicle.get('url') or ''
+    year = vehicle.get('year')
+    return {
+        'year': parse_year(str(year)) if year else parse_year(title) or parse_url_year(url),
+        'price_cents': parse_price_cents(vehicle.get('price')),
+        'mileage': parse_mileage(vehicle.get('mileage')),
+        'vin': parse_vin(str(vehicle.get('vin') or url)),
+        'trim': vehicle.get('trim') or parse_trim(title)
+    }
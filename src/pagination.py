@@ -0,0 +1,116 @@
+import re
+import html
+import math
+import logging
+from urllib.parse import urljoin, urlparse, parse_qsl, urlencode, quote
+from typing import List, Dict, Optional, Tuple, Set
+
+logger = logging.getLogger(__name__)
+
+# "1 - 18 of 57" / "Showing 19 to 36 of 57 results", read from the raw page text
+RESULT_COUNT_PATTERN = re.compile(r'\b(\d{1,4})\s*(?:-|–|to)\s*(\d{1,4})\s+of\s+(\d{1,5})\b', re.I)
+
+# Dealer.com pagination objects embedded in inline scripts
+TOTAL_COUNT_PATTERN = re.compile(r'["\']totalCount["\']\s*:\s*(\d+)')
+PAGE_SIZE_PATTERN = re.compile(r'["\']pageSize["\']\s*:\s*(\d+)')
+
+# Pagination links carry either a result offset (start=18) or a page number (page=2)
+PAGE_LINK_PATTERN = re.compile(r'href\s*=\s*["\']([^"\']*[?&](?:amp;)?(?:start|page)=\d+[^"\']*)["\']', re.I)
+PAGE_PARAMS = ('start', 'page')
+PAGE_PARAM_PATTERN = re.compile(r'[?&](?:start|page)=\d+')
+
+def is_page_link(href: str) -> bool:
+    """True for result pagination links, which must not be mistaken for vehicle listings"""
+    return bool(PAGE_PARAM_PATTERN.search(href))
+
+def set_query_param(url: str, key: str, value) -> str:
+    """Return the URL with one query parameter replaced or added, keeping %20-style quoting"""
+    parsed = urlparse(url)
+    params = [(k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True) if k != key]
+    params.append((key, str(value)))
+    return parsed._replace(query=urlencode(params, quote_via=quote)).geturl()
+
+def _result_count(text: str) -> Tuple[Optional[int], Optional[int]]:
+    """Read (total results, page size) from the results summary or the pagination JSON"""
+    match = RESULT_COUNT_PATTERN.search(text)
+    if match:
+        first, last, total = (int(group) for group in match.groups())
+        if 0 < first <= last <= total:
+            return total, last - first + 1
+
+    total_match = TOTAL_COUNT_PATTERN.search(text)
+    size_match = PAGE_SIZE_PATTERN.search(text)
+    if total_match and size_match and int(size_match.group(1)) > 0:
+        return int(total_match.group(1)), int(size_match.group(1))
+
+    return None, None
+
+def _linked_pages(text: str, search_url: str) -> Dict[str, Dict[int, str]]:
+    """Collect pagination links that point back at the same search, as {param: {value: url}}"""
+    search = urlparse(search_url)
+    pages = {}
+    for href in PAGE_LINK_PATTERN.findall(text):
+        url = urljoin(search_url, html.unescape(href))
+        parsed = urlparse(url)
+        if parsed.netloc != search.netloc or parsed.path != search.path:
+            continue
+
+        params = dict(parse_qsl(parsed.query))
+        for param in PAGE_PARAMS:
+            if params.get(param, '').isdigit():
+                pages.setdefault(param, {})[int(params[param])] = url
+                break
+    return pages
+
+def discover_page_urls(content, search_url: str, max_pages: int) -> List[str]:
+    """Find the URLs of result pages 2..N of a search from its first page
+
+    The results summary ("1 - 18 of 57") or the embedded pagination JSON gives
+    every page up front; otherwise the page links on page 1 are used. Returns an
+    empty list for single-page results. Capped at max_pages pages in total.
+    """
+    text = content.decode('utf-8', errors='replace') if isinstance(content, bytes) else content
+    linked = _linked_pages(text, search_url)
+    total, page_size = _result_count(text)
+
+    if total and page_size:
+        if total <= page_size:
+            return []
+        page_count = math.ceil(total / page_size)
+        if 'page' in linked and 'start' not in linked:
+            urls = [set_query_param(search_url, 'page', page) for page in range(2, page_count + 1)]
+        else:
+            urls = [set_query_param(search_url, 'start', page * page_size) for page in range(1, page_count)]
+    else:
+        urls = []
+        for param, pages in linked.items():
+            first_page = 0 if param == 'start' else 1
+            urls.extend(pages[value] for value in sorted(pages) if value > first_page)
+
+    if len(urls) > max_pages - 1:
+        logger.warning(f"{search_url} has {len(urls) + 1} result pages, fetching the first {max_pages}")
+        urls = urls[:max_pages - 1]
+    return urls
+
+def vehicle_keys(vehicle: Dict) -> Set[str]:
+    """Identifiers a vehicle can be recognised by across pages and runs (VIN and listing URL)"""
+    return {key for key in (vehicle.get('vin'), vehicle.get('url')) if key}
+
+def merge_page_vehicles(vehicles: List[Dict], page_vehicles: List[Dict], seen: Set[str]) -> int:
+    """Append the vehicles not already seen in this search and return how many were added"""
+    added = 0
+    for vehicle in page_vehicles:
+        keys = vehicle_keys(vehicle)
+        if keys and keys & seen:
+            continue
+        seen.update(keys)
+        vehicles.append(vehicle)
+        added += 1
+    return added
+
+def only_known_vehicles(page_vehicles: List[Dict], *known_key_sets: Set[str]) -> bool:
+    """True when a page lists nothing new: every vehicle on it is in one of the known key sets"""
+    return all(
+        any(vehicle_keys(vehicle) & known_keys for known_keys in known_key_sets)
+        for vehicle in page_vehicles
+    )
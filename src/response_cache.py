@@ -0,0 +1,177 @@
+import json
+import os
+import re
+import hashlib
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import List, Dict, Optional
+from config import RESPONSE_CACHE
+from storage import write_data_atomically
+
+logger = logging.getLogger(__name__)
+
+# Volatile page fragments that change on every request without the inventory changing
+VOLATILE_PATTERNS = [
+    re.compile(rb'\b(?:nonce|csrf[\w-]*|_token|requestId|request-id|traceId)(["\']?\s*[:=]\s*["\'])[^"\']*(["\'])', re.I),
+    re.compile(rb'\b\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?'),
+    # Unix timestamps in seconds or milliseconds, only under a time-like key (bare ids look the same)
+    re.compile(rb'\b(?:[\w.]*?(?:timestamp|time)|ts|_)(["\']?\s*[:=]\s*["\']?)\d{10}(?:\d{3})?\b', re.I),
+    re.compile(rb'[?&](?:_|ts|t|cb|cachebuster|nocache)=\d+', re.I),  # Cache-buster query parameters
+    re.compile(rb';jsessionid=[\w.-]+', re.I),
+]
+
+def fingerprint_content(content: bytes) -> str:
+    """Hash a page body after stripping timestamps, nonces and session tokens"""
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    for pattern in VOLATILE_PATTERNS:
+        content = pattern.sub(b'', content)
+    return hashlib.sha1(content).hexdigest()
+
+class ResponseCache:
+    """On-disk cache of search page validators and the vehicles extracted from each page
+
+    Entries are keyed by search URL and hold the ETag / Last-Modified validators
+    the dealer sent, so the next run can make a conditional request and reuse
+    the stored vehicle list on a 304 without parsing anything. Each entry also
+    keeps a fingerprint of the normalized body, so dealers that send no useful
+    validators still skip extraction when the page is unchanged.
+    """
+
+    def __init__(self, cache_file: str = None, max_entries: int = None, max_age_hours: float = None):
+        self.cache_file = cache_file or RESPONSE_CACHE['file']
+        self.max_entries = max_entries or RESPONSE_CACHE['max_entries']
+        self.max_age = timedelta(hours=max_age_hours or RESPONSE_CACHE['max_age_hours'])
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.unchanged = 0
+        self.misses = 0
+        self.evictions = 0
+        self.parse_seconds_saved = 0.0
+        self.entries = self.load()
+
+    def load(self) -> Dict:
+        """Load cache entries from disk"""
+        try:
+            if os.path.exists(self.cache_file):
+                with open(self.cache_file, 'r') as f:
+                    return json.load(f).get('entries', {})
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable response cache {self.cache_file}: {e}")
+        return {}
+
+    def save(self) -> bool:
+        """Evict stale entries and write the cache to disk"""
+        with self._lock:
+            self._evict()
+            try:
+                write_data_atomically(self.cache_file, {'entries': self.entries}, 'json')
+                return True
+            except Exception as e:
+                logger.error(f"Error saving response cache: {e}")
+                return False
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """Build If-None-Match / If-Modified-Since headers for a cached URL"""
+        with self._lock:
+            entry = self.entries.get(url)
+            if not entry or self._is_expired(entry):
+                return {}
+
+            headers = {}
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+            return headers
+
+    def get_vehicles(self, url: str) -> Optional[List[Dict]]:
+        """Return a copy of the vehicles extracted the last time this URL was parsed"""
+        with self._lock:
+            entry = self.entries.get(url)
+            if not entry:
+                return None
+
+            self.hits += 1
+            return self._reuse(entry)
+
+    def get_unchanged_vehicles(self, url: str, fingerprint: str) -> Optional[List[Dict]]:
+        """Return the cached vehicles if the page body fingerprint has not changed"""
+        with self._lock:
+            entry = self.entries.get(url)
+            if not entry or not fingerprint or entry.get('fingerprint') != fingerprint:
+                return None
+
+            self.unchanged += 1
+            return self._reuse(entry)
+
+    def get_page_urls(self, url: str) -> List[str]:
+        """Return the result page URLs discovered the last time this URL was parsed"""
+        with self._lock:
+            entry = self.entries.get(url)
+            return list(entry.get('page_urls', [])) if entry else []
+    
+    def _reuse(self, entry: Dict) -> List[Dict]:
+        entry['last_used'] = datetime.now().isoformat()
+        self.parse_seconds_saved += entry.get('parse_seconds', 0.0)
+        return [dict(vehicle) for vehicle in entry['vehicles']]
+
+    def store(self, url: str, headers, vehicles: List[Dict], fingerprint: str = None, parse_seconds: float = 0.0,
+              page_urls: List[str] = None):
+        """Remember a freshly parsed page with its validators, body fingerprint, parse cost and further result pages"""
+        with self._lock:
+            self.misses += 1
+            now = datetime.now().isoformat()
+            self.entries[url] = {
+                'etag': headers.get('ETag'),
+                'last_modified': headers.get('Last-Modified'),
+                'fingerprint': fingerprint,
+                'parse_seconds': parse_seconds,
+                'stored_at': now,
+                'last_used': now,
+                'vehicles': [dict(vehicle) for vehicle in vehicles],
+                'page_urls': list(page_urls or [])
+            }
+
+    def _is_expired(self, entry: Dict) -> bool:
+        try:
+            return datetime.now() - datetime.fromisoformat(entry['stored_at']) > self.max_age
+        except (KeyError, ValueError):
+            return True
+
+    def _evict(self):
+        """Drop expired entries, then the least recently used ones beyond max_entries"""
+        expired = [url for url, entry in self.entries.items() if self._is_expired(entry)]
+        for url in expired:
+            del self.entries[url]
+
+        overflow = len(self.entries) - self.max_entries
+        if overflow > 0:
+            by_last_use = sorted(self.entries, key=lambda url: self.entries[url].get('last_used', ''))
+            for url in by_last_use[:overflow]:
+                del self.entries[url]
+
+        removed = len(expired) + max(overflow, 0)
+        if removed:
+            self.evictions += removed
+            logger.info(f"Evicted {removed} response cache entries")
+
+    def reset_stats(self):
+        """Zero the per-run counters (a resident scraper reuses the cache across runs)"""
+        self.hits = 0
+        self.unchanged = 0
+        self.misses = 0
+        self.evictions = 0
+        self.parse_seconds_saved = 0.0
+
+    def get_stats(self) -> Dict:
+        """Get hit/miss counters for the current run"""
+        return {
+            'hits': self.hits,
+            'unchanged': self.unchanged,
+            'misses': self.misses,
+            'parse_seconds_saved': round(self.parse_seconds_saved, 4),
+            'evictions': self.evictions,
+            'entries': len(self.entries)
+        }
@@ -1,78 +1,404 @@
-import schedule
-import time
+import heapq
 import logging
-from datetime import datetime
-from typing import List
-from config import SEARCH_TIMES, BUSINESS_HOURS
+import itertools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Callable, Dict, List, Optional, Tuple
+from config import (SEARCH_TIMES, BUSINESS_HOURS, SEARCH_SCHEDULE, DEALER_SCHEDULES, SCHEDULER, LEITH_HONDA_LOCATIONS,
+                    ADAPTIVE_POLLING)
 
 logger = logging.getLogger(__name__)
 
+MONTH_NAMES = {name: number for number, name in enumerate(
+    ['jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'], start=1)}
+WEEKDAY_NAMES = {name: number for number, name in enumerate(['sun', 'mon', 'tue', 'wed', 'thu', 'fri', 'sat'])}
+
+def parse_cron_field(text: str, low: int, high: int, names: Dict[str, int] = None) -> List[int]:
+    """Values allowed by one cron field: '*', '5', '1-5', 'mon-fri', '*/15', '9-17/2' or a comma list of them"""
+    values = set()
+    for part in text.lower().split(','):
+        term, _, step_text = part.partition('/')
+        step = int(step_text) if step_text else 1
+        if term == '*':
+            start, end = low, high
+        else:
+            start_text, _, end_text = term.partition('-')
+            start = (names or {}).get(start_text, None)
+            start = int(start_text) if start is None else start
+            if end_text:
+                end = (names or {}).get(end_text, None)
+                end = int(end_text) if end is None else end
+            else:
+                end = high if step_text else start
+        if step < 1 or not low <= start <= end <= high:
+            raise ValueError(f"Cron field {text!r} is outside {low}-{high}")
+        values.update(range(start, end + 1, step))
+    return sorted(values)
+
+class CronExpression:
+    """A 'minute hour day-of-month month day-of-week' schedule, matched the way cron matches it
+
+    Day-of-week counts from Sunday (0 or 7). When both day fields are
+    restricted, a day matching either one is due, as in cron.
+    """
+
+    def __init__(self, expression: str):
+        fields = expression.split()
+        if len(fields) != 5:
+            raise ValueError(f"Cron expression needs 5 fields, got {expression!r}")
+        self.expression = expression
+        self.minutes = parse_cron_field(fields[0], 0, 59)
+        self.hours = parse_cron_field(fields[1], 0, 23)
+        self.days = set(parse_cron_field(fields[2], 1, 31))
+        self.months = set(parse_cron_field(fields[3], 1, 12, MONTH_NAMES))
+        self.weekdays = {day % 7 for day in parse_cron_field(fields[4], 0, 7, WEEKDAY_NAMES)}
+        self.either_day = not fields[2].startswith('*') and not fields[4].startswith('*')
+
+    def day_matches(self, moment: datetime) -> bool:
+        day_of_month = moment.day in self.days
+        day_of_week = (moment.weekday() + 1) % 7 in self.weekdays
+        return (day_of_month or day_of_week) if self.either_day else (day_of_month and day_of_week)
+
+    def next_after(self, moment: datetime) -> datetime:
+        """First matching minute after `moment`"""
+        candidate = moment.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = candidate + timedelta(days=5 * 366)  # Covers every 29 February
+        while candidate < limit:
+            if candidate.month not in self.months:
+                month_start = candidate.replace(day=1, hour=0, minute=0)
+                candidate = (month_start + timedelta(days=32)).replace(day=1)
+            elif not self.day_matches(candidate):
+                candidate = candidate.replace(hour=0, minute=0) + timedelta(days=1)
+            elif candidate.hour not in self.hours:
+                later = [hour for hour in self.hours if hour > candidate.hour]
+                candidate = (candidate.replace(hour=later[0], minute=0) if later else
+                             candidate.replace(hour=0, minute=0) + timedelta(days=1))
+            elif candidate.minute not in self.minutes:
+                later = [minute for minute in self.minutes if minute > candidate.minute]
+                candidate = (candidate.replace(minute=later[0]) if later else
+                             candidate.replace(minute=0) + timedelta(hours=1))
+            else:
+                return candidate
+        raise ValueError(f"Cron expression {self.expression!r} never matches")
+
+def business_day_schedule(times: List[str], weekdays: List[int]) -> List[str]:
+    """Cron expressions for 'HH:MM' times on Python weekdays (0=Monday)"""
+    days = ','.join(str((weekday + 1) % 7) for weekday in sorted(weekdays))
+    expressions = []
+    for search_time in times:
+        hour, minute = search_time.split(':')
+        expressions.append(f"{int(minute)} {int(hour)} * * {days}")
+    return expressions
+
+class SystemClock:
+    """Wall-clock time; a wait ends early when its event is set"""
+
+    def now(self) -> datetime:
+        return datetime.now()
+
+    def wait(self, event: threading.Event, timeout: float) -> bool:
+        return event.wait(timeout)
+
+class SimulatedClock:
+    """Clock for simulations: waiting moves the time forward at once instead of sleeping"""
+
+    def __init__(self, start: datetime):
+        self.current = start
+
+    def now(self) -> datetime:
+        return self.current
+
+    def wait(self, event: threading.Event, timeout: float) -> bool:
+        if event.is_set():
+            return True
+        self.current += timedelta(seconds=timeout)
+        return False
+
+class ScheduledJob:
+    """A function run on one or more cron expressions, or once at a given time"""
+
+    def __init__(self, name: str, function: Callable, expressions: List[CronExpression] = None,
+                 next_run: datetime = None):
+        self.name = name
+        self.function = function
+        self.expressions = expressions or []
+        self.next_run = next_run
+        self.running = False
+        self.cancelled = False
+        self.runs = 0
+        self.skipped = 0
+        self.lateness = []  # Seconds between each due time and the moment the job was started
+
+    def next_after(self, moment: datetime) -> Optional[datetime]:
+        """Next due time after `moment` (None for a one-time job)"""
+        if not self.expressions:
+            return None
+        return min(expression.next_after(moment) for expression in self.expressions)
+
+    def __str__(self) -> str:
+        when = '; '.join(expression.expression for expression in self.expressions) or 'once'
+        return f"{self.name} [{when}] next {self.next_run:%m/%d/%Y %I:%M %p}" if self.next_run else self.name
+
+class EventScheduler:
+    """Jobs in a heap ordered by their next due time; the loop sleeps until the earliest one is due
+
+    Adding or removing a job wakes the loop so it can sleep again for the
+    right length. Jobs due together go to a worker pool; an occurrence that
+    comes round while the previous run of the same job is still going is
+    skipped, and occurrences missed while the machine slept are run once.
+    """
+
+    def __init__(self, clock=None, workers: int = None, max_sleep: float = None):
+        """
+        Args:
+            clock: Source of the time and of sleeping (SystemClock; SimulatedClock in simulations)
+            workers: Threads running due jobs (0 runs them in the scheduler loop)
+            max_sleep: Longest single sleep in seconds
+        """
+        self.clock = clock or SystemClock()
+        self.workers = SCHEDULER['workers'] if workers is None else workers
+        self.max_sleep = max_sleep or SCHEDULER['max_sleep']
+        self.jobs: Dict[str, ScheduledJob] = {}
+        self.wakeups = 0
+        self._heap = []
+        self._sequence = itertools.count()
+        self._lock = threading.Lock()
+        self._changed = threading.Event()
+        self._stopped = threading.Event()
+        self._executor = None
+
+    def add_job(self, name: str, schedule, function: Callable) -> ScheduledJob:
+        """Run `function` on a cron expression or list of them; replaces a job of the same name"""
+        expressions = [schedule] if isinstance(schedule, str) else list(schedule)
+        job = ScheduledJob(name, function, [CronExpression(expression) for expression in expressions])
+        job.next_run = job.next_after(self.clock.now())
+        self._push(job)
+        return job
+
+    def add_one_time_job(self, name: str, run_at: datetime, function: Callable) -> ScheduledJob:
+        """Run `function` once at `run_at`"""
+        job = ScheduledJob(name, function, next_run=run_at)
+        self._push(job)
+        return job
+
+    def _push(self, job: ScheduledJob):
+        with self._lock:
+            previous = self.jobs.get(job.name)
+            if previous:
+                previous.cancelled = True
+            self.jobs[job.name] = job
+            heapq.heappush(self._heap, (job.next_run, next(self._sequence), job))
+        self._changed.set()
+
+    def remove_job(self, name: str) -> bool:
+        with self._lock:
+            job = self.jobs.pop(name, None)
+            if job:
+                job.cancelled = True  # Its heap entry is dropped when it reaches the top
+        self._changed.set()
+        return job is not None
+
+    def clear(self):
+        with self._lock:
+            for job in self.jobs.values():
+                job.cancelled = True
+            self.jobs = {}
+            self._heap = []
+        self._changed.set()
+
+    def _drop_stale(self):
+        # Entries of cancelled jobs and of jobs pushed again with a new time
+        while self._heap and (self._heap[0][2].cancelled or self._heap[0][2].next_run != self._heap[0][0]):
+            heapq.heappop(self._heap)
+
+    def next_run_time(self) -> Optional[datetime]:
+        with self._lock:
+            self._drop_stale()
+            return self._heap[0][0] if self._heap else None
+
+    def upcoming(self, count: int = 5) -> List[Tuple[datetime, str]]:
+        """The next `count` (due time, job name) pairs across all jobs"""
+        with self._lock:
+            jobs = list(self.jobs.values())
+        runs = []
+        for job in jobs:
+            moment = job.next_run
+            for _ in range(count):
+                if moment is None:
+                    break
+                runs.append((moment, job.name))
+                moment = job.next_after(moment)
+        return sorted(runs)[:count]
+
+    def run_pending(self) -> int:
+        """Start every job that is due; returns how many were due"""
+        now = self.clock.now()
+        due = []
+        with self._lock:
+            self._drop_stale()
+            while self._heap and self._heap[0][0] <= now:
+                due_time, _, job = heapq.heappop(self._heap)
+                due.append((due_time, job))
+                job.next_run = job.next_after(now)  # Missed occurrences collapse into this one
+                if job.next_run is None:
+                    del self.jobs[job.name]
+                else:
+                    heapq.heappush(self._heap, (job.next_run, next(self._sequence), job))
+                self._drop_stale()
+
+        for due_time, job in due:
+            if job.running:
+                job.skipped += 1
+                logger.warning(f"⏭️ Skipping {job.name} due {due_time:%H:%M}: its previous run is still going")
+                continue
+            job.running = True
+            job.lateness.append((now - due_time).total_seconds())
+            if self._executor:
+                self._executor.submit(self._run_job, job)
+            else:
+                self._run_job(job)
+        return len(due)
+
+    def _run_job(self, job: ScheduledJob):
+        try:
+            job.function()
+        except Exception as e:
+            logger.error(f"Error in scheduled job {job.name}: {e}")
+        finally:
+            job.runs += 1
+            job.running = False
+
+    def run(self, until: datetime = None):
+        """Run jobs as they fall due until stop() is called (or the clock reaches `until`)"""
+        self._stopped.clear()
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='scheduled-job') if self.workers else None
+        try:
+            while not self._stopped.is_set():
+                self._changed.clear()
+                self.run_pending()
+                now = self.clock.now()
+                if until is not None and now >= until:
+                    break
+                timeout = self.max_sleep
+                next_run = self.next_run_time()
+                if next_run is not None:
+                    timeout = min(timeout, max((next_run - now).total_seconds(), 0.0))
+                if until is not None:
+                    timeout = min(timeout, (until - now).total_seconds())
+                self.clock.wait(self._changed, timeout)
+                self.wakeups += 1
+        finally:
+            if self._executor:
+                self._executor.shutdown(wait=True)
+                self._executor = None
+
+    def stop(self):
+        self._stopped.set()
+        self._changed.set()
+
 class SearchScheduler:
-    def __init__(self, search_function):
+    def __init__(self, search_function, clock=None, workers: int = None, load_history=None):
         """
         Initialize scheduler with a search function to call
-        
+
         Args:
-            search_function: Function to call that performs the search and sends notifications
+            search_function: Function to call that performs the search and sends notifications;
+                called with locations=[...] when dealers are searched on their own schedule
+            clock: Time source for the scheduler (SimulatedClock in simulations)
+            workers: Threads for jobs that fall due together (SCHEDULER['workers'])
+            load_history: Returns (recent matches, search history) for adaptive polling
+                (read through a new DataManager when not given)
         """
         self.search_function = search_function
+        self.scheduler = EventScheduler(clock, workers)
+        self.load_history = load_history
+        self.adaptive = None
         self.setup_schedule()
-    
+
     def setup_schedule(self):
         """Set up the scheduled searches"""
         logger.info("Setting up search schedule...")
-        
-        # Schedule searches at specified times during business days
-        for search_time in SEARCH_TIMES:
-            # Schedule for each business day
-            if 0 in BUSINESS_HOURS['days']:  # Monday
-                schedule.every().monday.at(search_time).do(self.run_scheduled_search)
-            if 1 in BUSINESS_HOURS['days']:  # Tuesday
-                schedule.every().tuesday.at(search_time).do(self.run_scheduled_search)
-            if 2 in BUSINESS_HOURS['days']:  # Wednesday
-                schedule.every().wednesday.at(search_time).do(self.run_scheduled_search)
-            if 3 in BUSINESS_HOURS['days']:  # Thursday
-                schedule.every().thursday.at(search_time).do(self.run_scheduled_search)
-            if 4 in BUSINESS_HOURS['days']:  # Friday
-                schedule.every().friday.at(search_time).do(self.run_scheduled_search)
-            if 5 in BUSINESS_HOURS['days']:  # Saturday
-                schedule.every().saturday.at(search_time).do(self.run_scheduled_search)
-            if 6 in BUSINESS_HOURS['days']:  # Sunday
-                schedule.every().sunday.at(search_time).do(self.run_scheduled_search)
-        
-        logger.info(f"Scheduled searches at {SEARCH_TIMES} on business days")
-    
+        if ADAPTIVE_POLLING['enabled']:
+            self.setup_adaptive_schedule()
+            return
+
+        dealer_schedules = {key: schedule for key, schedule in DEALER_SCHEDULES.items() if key in LEITH_HONDA_LOCATIONS}
+        for key in DEALER_SCHEDULES:
+            if key not in dealer_schedules:
+                logger.warning(f"⚠️ No dealership '{key}' in LEITH_HONDA_LOCATIONS, ignoring its schedule")
+
+        # The default schedule comes from SEARCH_TIMES and keeps the business hours check
+        schedule = SEARCH_SCHEDULE or business_day_schedule(SEARCH_TIMES, BUSINESS_HOURS['days'])
+        remaining = [key for key in LEITH_HONDA_LOCATIONS if key not in dealer_schedules]
+        if remaining:
+            locations = remaining if dealer_schedules else None
+            self.scheduler.add_job('search', schedule,
+                                   partial(self.run_scheduled_search, locations, SEARCH_SCHEDULE is None))
+        for key, dealer_schedule in dealer_schedules.items():
+            self.scheduler.add_job(f"search:{key}", dealer_schedule, partial(self.run_scheduled_search, [key], False))
+
+        for job in self.scheduler.jobs.values():
+            logger.info(f"Scheduled {job}")
+
+    def setup_adaptive_schedule(self):
+        """One job per dealer, rescheduled after each search on the dealer's learned interval"""
+        from adaptive_polling import AdaptivePolling, add_active_hours, format_plan, load_polling_history
+        self.adaptive = AdaptivePolling(self.load_history or load_polling_history)
+        now = self.scheduler.clock.now()
+        plan = self.adaptive.refresh(now)
+        first_run = add_active_hours(now, 0)  # Now, or when business hours next begin
+        for key in plan:
+            self.scheduler.add_one_time_job(f"poll:{key}", first_run, partial(self.run_adaptive_search, key))
+        logger.info("Adaptive polling plan:")
+        for line in format_plan(plan):
+            logger.info(f"  {line}")
+
+    def run_adaptive_search(self, key: str):
+        """Search one dealer, then schedule its next search from the refreshed plan"""
+        self.run_scheduled_search([key], False)
+        now = self.scheduler.clock.now()
+        self.adaptive.refresh(now)
+        next_run = self.adaptive.next_poll(key, now)
+        self.scheduler.add_one_time_job(f"poll:{key}", next_run, partial(self.run_adaptive_search, key))
+        logger.info(f"🔁 Next search of {self.adaptive.plan[key]['name']} at {next_run:%m/%d %I:%M %p} "
+                    f"(every {self.adaptive.plan[key]['interval_minutes']:.0f} business minutes)")
+
     def is_business_hours(self) -> bool:
         """Check if current time is within business hours"""
-        now = datetime.now()
+        now = self.scheduler.clock.now()
         current_hour = now.hour
         current_weekday = now.weekday()
-        
+
         # Check if it's a business day
         if current_weekday not in BUSINESS_HOURS['days']:
             return False
-        
+
         # Check if it's within business hours
         if current_hour < BUSINESS_HOURS['start'] or current_hour >= BUSINESS_HOURS['end']:
             return False
-        
+
         return True
-    
-    def run_scheduled_search(self):
+
+    def run_scheduled_search(self, locations: List[str] = None, check_business_hours: bool = True):
         """Run the scheduled search with business hours check"""
         try:
             # Double-check business hours (in case system time changed)
-            if not self.is_business_hours():
+            if check_business_hours and not self.is_business_hours():
                 logger.info("Skipping search - outside business hours")
                 return
-            
-            logger.info("Running scheduled Honda car search...")
-            self.search_function()
+
+            logger.info(f"Running scheduled Honda car search{' for ' + ', '.join(locations) if locations else ''}...")
+            if locations:
+                self.search_function(locations=locations)
+            else:
+                self.search_function()
             logger.info("Scheduled search completed")
-            
+
         except Exception as e:
             logger.error(f"Error during scheduled search: {e}")
-    
+
     def run_manual_search(self):
         """Run a manual search (ignores business hours)"""
         try:
@@ -81,50 +407,45 @@ class SearchScheduler:
             logger.info("Manual search completed")
         except Exception as e:
             logger.error(f"Error during manual search: {e}")
-    
+
     def run_scheduler(self):
         """Start the scheduler loop"""
         logger.info("Starting Honda car search scheduler...")
         logger.info(f"Next scheduled runs:")
-        
+
         # Show upcoming scheduled jobs
-        for job in schedule.jobs:
+        for job in self.scheduler.jobs.values():
             logger.info(f"  - {job}")
-        
+
         try:
-            while True:
-                schedule.run_pending()
-                time.sleep(60)  # Check every minute
+            self.scheduler.run()
         except KeyboardInterrupt:
             logger.info("Scheduler stopped by user")
         except Exception as e:
             logger.error(f"Scheduler error: {e}")
-    
-    def get_next_scheduled_runs(self) -> List[str]:
+
+    def stop(self):
+        """Stop the scheduler loop (from another thread)"""
+        self.scheduler.stop()
+
+    def get_next_scheduled_runs(self, count: int = 10) -> List[str]:
         """Get list of next scheduled run times"""
-        runs = []
-        for job in schedule.jobs:
-            next_run = job.next_run
-            if next_run:
-                runs.append(next_run.strftime('%m/%d/%Y %I:%M %p'))
-        return sorted(runs)
-    
+        return [run_time.strftime('%m/%d/%Y %I:%M %p') for run_time, _ in self.scheduler.upcoming(count)]
+
     def clear_schedule(self):
         """Clear all scheduled jobs"""
-        schedule.clear()
+        self.scheduler.clear()
         logger.info("All scheduled jobs cleared")
-    
+
     def add_one_time_search(self, delay_minutes: int = 0):
         """Add a one-time search after specified delay"""
         if delay_minutes > 0:
-            schedule.every(delay_minutes).minutes.do(self.run_one_time_search).tag('one-time')
+            run_at = self.scheduler.clock.now() + timedelta(minutes=delay_minutes)
+            self.scheduler.add_one_time_job('one-time', run_at, self.run_one_time_search)
             logger.info(f"One-time search scheduled in {delay_minutes} minutes")
         else:
             self.run_manual_search()
-    
+
     def run_one_time_search(self):
-        """Run one-time search and remove the job"""
+        """Run one-time search (the job is dropped once it has run)"""
         self.run_manual_search()
-        # Remove the one-time job
-        schedule.clear('one-time')
-        return schedule.CancelJob
\ No newline at end of file
@@ -1,21 +1,103 @@
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 import logging
 import re
-from urllib.parse import urljoin, urlencode
-from typing import List, Dict, Optional
-from config import SEARCH_URL_NEW, SEARCH_URL_USED, SEARCH_PARAMS, MIN_YEAR, LEITH_HONDA_LOCATIONS
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urljoin, urlencode, urlparse
+from typing import List, Dict, Optional, Tuple, Set
+from config import SEARCH_URL_NEW, SEARCH_URL_USED, SEARCH_PARAMS, MIN_YEAR, LEITH_HONDA_LOCATIONS, SCRAPER_CONCURRENCY, RESPONSE_CACHE, HTML_PARSER, RESTRICTED_PARSE, STRUCTURED_DATA, PAGINATION
+from response_cache import ResponseCache, fingerprint_content
+from transport import Transport, CircuitOpenError
+import html_parsers
+from structured_data import extract_structured_vehicles
+from pagination import discover_page_urls, is_page_link, merge_page_vehicles, only_known_vehicles
+from vehicle import Vehicle
+from normalize import PRICE_PATTERN, TITLE_PATTERN, find_price, find_express_id, parse_year, parse_url_year
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Link and text patterns used by extract_vehicles_from_page, compiled once
+VEHICLE_LINK_PATTERNS = [
+    re.compile(r'/new/Honda/.*Civic', re.I),
+    re.compile(r'/used/Honda/.*Civic', re.I),
+    re.compile(r'/inventory/.*Honda.*Civic', re.I),
+    re.compile(r'\?.*model.*[Cc]ivic', re.I)  # URLs with civic in parameters
+]
+INVENTORY_LINK_PATTERN = re.compile(r'inventory.*honda|honda.*inventory', re.I)
+HONDA_CIVIC_TEXT_PATTERN = re.compile(r'Honda.*Civic|Civic.*Honda', re.I)
+CIVIC_TEXT_PATTERNS = [
+    re.compile(r'(20\d{2})\s+Honda\s+Civic[^<]*', re.I),
+    re.compile(r'Honda\s+Civic[^<]*', re.I),
+    re.compile(r'Civic\s+(Hybrid|Sport|EX|LX)[^<]*', re.I)
+]
+
 class HondaScraper:
-    def __init__(self):
+    def __init__(self, locations: Dict = None, concurrent: bool = None,
+                 max_workers: int = None, per_host: int = None, use_cache: bool = None,
+                 parser: str = None, restricted_parse: bool = None, structured_data: bool = None,
+                 paginate: bool = None, transport: Transport = None):
+        """
+        Initialize the scraper
+
+        Args:
+            locations: Dealership mapping to search (defaults to LEITH_HONDA_LOCATIONS)
+            concurrent: Fetch search pages on a worker pool (defaults to SCRAPER_CONCURRENCY)
+            max_workers: Size of the shared worker pool
+            per_host: Max simultaneous requests to a single dealer host
+            use_cache: Send conditional requests and reuse cached results (defaults to RESPONSE_CACHE)
+            parser: HTML parser backend (defaults to HTML_PARSER)
+            restricted_parse: Build only anchors and price containers for search pages
+            structured_data: Read embedded JSON-LD / inventory JSON first (defaults to STRUCTURED_DATA)
+            paginate: Fetch result pages 2..N of each search (defaults to PAGINATION)
+            transport: Per-host pacing, retries and circuit breaker (defaults to one built from TRANSPORT)
+        """
+        self.locations = locations if locations is not None else LEITH_HONDA_LOCATIONS
+        self.concurrent = SCRAPER_CONCURRENCY['enabled'] if concurrent is None else concurrent
+        self.max_workers = max_workers or SCRAPER_CONCURRENCY['max_workers']
+        self.per_host = per_host or SCRAPER_CONCURRENCY['per_host']
+        self._host_limits = {}
+        self._host_limits_lock = threading.Lock()
+        self.transport = transport or Transport()
+        
+        self.parser = html_parsers.resolve_backend(parser or HTML_PARSER)
+        self.restricted_parse = RESTRICTED_PARSE if restricted_parse is None else restricted_parse
+        self.structured_data = STRUCTURED_DATA if structured_data is None else structured_data
+        self.structured_pages = 0
+        self.heuristic_pages = 0
+        self._stats_lock = threading.Lock()
+        
+        self.paginate = PAGINATION['enabled'] if paginate is None else paginate
+        self.max_pages = PAGINATION['max_pages']
+        self.stop_on_known = PAGINATION['stop_on_known']
+        self.known_keys: Set[str] = set()  # VINs / URLs of vehicles tracked by earlier runs
+        self.extra_pages = 0
+        self.pagination_stops = 0
+        
+        use_cache = RESPONSE_CACHE['enabled'] if use_cache is None else use_cache
+        self.cache = ResponseCache() if use_cache else None
+        
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36'
         })
+        
+        # Keep one pooled connection per allowed in-flight request for every dealer host
+        adapter = HTTPAdapter(pool_connections=max(len(self.locations), 10), pool_maxsize=self.per_host)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+    
+    def _host_limit(self, url: str) -> threading.BoundedSemaphore:
+        """Get the semaphore that caps concurrent requests to the URL's host"""
+        host = urlparse(url).netloc
+        with self._host_limits_lock:
+            if host not in self._host_limits:
+                self._host_limits[host] = threading.BoundedSemaphore(self.per_host)
+            return self._host_limits[host]
     
     def search_all_honda_inventory(self) -> List[Dict]:
         """Search for any Honda vehicles (broader search for testing)"""
@@ -87,20 +169,133 @@ class HondaScraper:
         query_string = "&".join(query_parts)
         return f"{SEARCH_URL_NEW}?{query_string}"
     
-    def get_page_content(self, url: str) -> Optional[BeautifulSoup]:
-        """Fetch and parse page content"""
+    def fetch(self, url: str, headers: Dict = None) -> Optional[requests.Response]:
+        """Send a GET request through the transport (pacing, retries, circuit breaker) under the host's concurrency cap"""
+        def send() -> requests.Response:
+            return self.session.get(url, headers=headers, timeout=self.transport.timeout)
+        
         try:
             logger.info(f"Fetching page: {url}")
-            response = self.session.get(url, timeout=30)
+            response = self.transport.request(url, send, self._host_limit(url))
             response.raise_for_status()
+            return response
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            return soup
-            
+        except CircuitOpenError as e:
+            logger.warning(f"⛔ Skipping {url}: {e}")
+            return None
         except requests.RequestException as e:
             logger.error(f"Error fetching page: {e}")
             return None
     
+    def get_page_content(self, url: str) -> Optional[BeautifulSoup]:
+        """Fetch and parse page content"""
+        response = self.fetch(url)
+        if response is None:
+            return None
+        
+        return self.parse_html(response.content)
+    
+    def fetch_search_vehicles(self, search_url: str, discover_pages: bool = False) -> Optional[Tuple[List[Dict], List[str]]]:
+        """Fetch a search page (conditionally, when cached) and return its vehicles and further result pages"""
+        headers = self.cache.conditional_headers(search_url) if self.cache else None
+        response = self.fetch(search_url, headers)
+        if response is None:
+            return None
+        
+        return self.extract_search_results(search_url, response.status_code, response.headers, response.content,
+                                           discover_pages)
+    
+    def extract_search_results(self, search_url: str, status_code: int, headers, content,
+                               discover_pages: bool = False) -> Optional[Tuple[List[Dict], List[str]]]:
+        """Turn a search page response into (vehicles, page 2..N URLs), reusing the cached result on a 304 or unchanged body
+        
+        Result page URLs are only looked for when discover_pages is set (page 1 of a search).
+        """
+        if status_code == 304 and self.cache:
+            cached_vehicles = self.cache.get_vehicles(search_url)
+            if cached_vehicles is None:
+                logger.warning(f"Got 304 for {search_url} but no cached result is available")
+                return None
+            
+            logger.info(f"♻️ {search_url} not modified, reusing {len(cached_vehicles)} cached vehicles")
+            return cached_vehicles, self.cache.get_page_urls(search_url) if discover_pages else []
+        
+        fingerprint = None
+        if self.cache:
+            fingerprint = fingerprint_content(content)
+            unchanged_vehicles = self.cache.get_unchanged_vehicles(search_url, fingerprint)
+            if unchanged_vehicles is not None:
+                logger.info(f"♻️ {search_url} body unchanged, reusing {len(unchanged_vehicles)} cached vehicles")
+                return unchanged_vehicles, self.cache.get_page_urls(search_url) if discover_pages else []
+        
+        parse_start = time.thread_time()
+        vehicles = self.parse_search_page(content, search_url)
+        page_urls = discover_page_urls(content, search_url, self.max_pages) if discover_pages else []
+        parse_seconds = time.thread_time() - parse_start
+        
+        if self.cache:
+            self.cache.store(search_url, headers, vehicles, fingerprint, parse_seconds, page_urls)
+        
+        return vehicles, page_urls
+    
+    def reset_stats(self):
+        """Zero the per-run counters before another run with the same scraper"""
+        self.structured_pages = 0
+        self.heuristic_pages = 0
+        self.extra_pages = 0
+        self.pagination_stops = 0
+        if self.cache:
+            self.cache.reset_stats()
+        self.transport.reset_stats()
+    
+    def get_stats(self) -> Dict:
+        """Get scraper counters for the last run"""
+        stats = {
+            'structured_pages': self.structured_pages,
+            'heuristic_pages': self.heuristic_pages,
+            'extra_pages': self.extra_pages,
+            'pagination_stops': self.pagination_stops,
+            'locations': list(self.locations),
+            'transport': self.transport.get_stats()
+        }
+        if self.cache:
+            stats['response_cache'] = self.cache.get_stats()
+        return stats
+    
+    def parse_html(self, content, restricted: bool = False) -> BeautifulSoup:
+        """Parse raw page content into a BeautifulSoup tree with the configured backend"""
+        return html_parsers.parse_html(content, self.parser, restricted)
+    
+    def parse_search_page(self, content, search_url: str) -> List[Dict]:
+        """Parse a search page and extract its vehicles
+        
+        Embedded JSON-LD / inventory JSON is used when present, without building
+        a DOM. Otherwise the HTML heuristics run; in restricted mode only anchors
+        and their containers are built, and since the text-based fallbacks need
+        the whole document the page is parsed again in full if the link-based
+        approaches find nothing.
+        """
+        if self.structured_data:
+            vehicles = extract_structured_vehicles(content, search_url)
+            if vehicles:
+                with self._stats_lock:
+                    self.structured_pages += 1
+                logger.info(f"📦 Read {len(vehicles)} vehicles from structured data on {search_url}")
+                return vehicles
+        
+        with self._stats_lock:
+            self.heuristic_pages += 1
+        
+        if self.restricted_parse:
+            soup = self.parse_html(content, restricted=True)
+            vehicles = self.extract_vehicles_from_page(soup, search_url, text_fallbacks=False)
+            if vehicles:
+                return vehicles
+            logger.debug(f"No vehicle links in restricted parse of {search_url}, parsing full page")
+        
+        soup = self.parse_html(content)
+        return self.extract_vehicles_from_page(soup, search_url)
+    
     def extract_vehicle_info(self, vehicle_element) -> Optional[Dict]:
         """Extract vehicle information from a vehicle listing element"""
         try:
@@ -130,21 +325,21 @@ class HondaScraper:
             if not vehicle_info.get('title'):
                 # Look for year + Honda + model patterns
                 text = vehicle_element.get_text()
-                honda_match = re.search(r'(\d{4})\s+(Honda)\s+([\w\s]+)', text, re.I)
+                honda_match = TITLE_PATTERN.search(text)
                 if honda_match:
                     vehicle_info['title'] = f"{honda_match.group(1)} {honda_match.group(2)} {honda_match.group(3)}".strip()
                 elif 'Honda' in text and 'Civic' in text:
                     vehicle_info['title'] = 'Honda Civic (Details in description)'
             
             # Extract price from anywhere in the element
-            price_match = re.search(r'\$[\d,]+', element_text)
-            if price_match:
-                vehicle_info['price'] = price_match.group()
+            price = find_price(element_text)
+            if price:
+                vehicle_info['price'] = price
             
             # Extract VIN or stock number
-            vin_match = re.search(r'/express/([A-Z0-9]+)', str(vehicle_element))
-            if vin_match:
-                vehicle_info['vin'] = vin_match.group(1)
+            express_id = find_express_id(str(vehicle_element))
+            if express_id:
+                vehicle_info['vin'] = express_id
             
             # Extract additional details from text
             if 'Sport' in element_text:
@@ -181,14 +376,28 @@ class HondaScraper:
             logger.error(f"Error extracting vehicle info: {e}")
             return None
     
-    def search_vehicles(self) -> List[Dict]:
+    def search_vehicles(self) -> List[Vehicle]:
         """Search for vehicles across all Leith Honda locations (new and used inventory)"""
-        all_vehicles = []
+        logger.info(f"🏢 Searching {len(self.locations)} Leith Honda locations...")
+        
+        if self.concurrent:
+            all_vehicles = self._search_locations_concurrently()
+        else:
+            all_vehicles = self._search_locations_serially()
         
-        logger.info(f"🏢 Searching {len(LEITH_HONDA_LOCATIONS)} Leith Honda locations...")
+        if self.cache:
+            self.cache.save()
+        
+        filtered_vehicles = self.filter_vehicles_by_year(all_vehicles)
+        logger.info(f"Found {len(filtered_vehicles)} vehicles matching criteria across all locations")
+        return filtered_vehicles
+    
+    def _search_locations_serially(self) -> List[Dict]:
+        """Search every location one page at a time"""
+        all_vehicles = []
         
         # Search each Leith Honda location
-        for location_key, location_info in LEITH_HONDA_LOCATIONS.items():
+        for location_key, location_info in self.locations.items():
             logger.info(f"🚗 Searching {location_info['name']} - {location_info['location']}")
             
             try:
@@ -206,9 +415,47 @@ class HondaScraper:
                 logger.error(f"❌ Error searching {location_info['name']}: {e}")
                 continue
         
-        # Filter by year (2015 and newer)
+        return all_vehicles
+    
+    def _search_locations_concurrently(self) -> List[Dict]:
+        """Fetch every location's search pages on a bounded worker pool
+        
+        Results are merged in the same location/inventory/URL order as the serial path.
+        """
+        tasks: List[Tuple[str, Dict, str, str]] = []
+        for location_key, location_info in self.locations.items():
+            for inventory_type in ("new", "used"):
+                for search_url in self.build_location_search_urls(location_info, inventory_type):
+                    tasks.append((location_key, location_info, inventory_type, search_url))
+        
+        if not tasks:
+            return []
+        
+        workers = min(self.max_workers, len(tasks))
+        logger.info(f"⚡ Fetching {len(tasks)} search pages with {workers} workers ({self.per_host} per host)")
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            page_results = list(executor.map(
+                lambda task: self.search_page(task[1], task[2], task[3]), tasks
+            ))
+        
+        all_vehicles = []
+        counts = {}
+        for (location_key, location_info, inventory_type, search_url), page_vehicles in zip(tasks, page_results):
+            all_vehicles.extend(page_vehicles)
+            location_counts = counts.setdefault(location_key, {'new': 0, 'used': 0})
+            location_counts[inventory_type] += len(page_vehicles)
+        
+        for location_key, location_counts in counts.items():
+            location_info = self.locations[location_key]
+            logger.info(f"✅ Found {location_counts['new']} new + {location_counts['used']} used vehicles at {location_info['name']}")
+        
+        return all_vehicles
+    
+    def filter_vehicles_by_year(self, vehicles: List[Dict]) -> List[Dict]:
+        """Keep vehicles that are MIN_YEAR or newer (or whose year is unknown)"""
         filtered_vehicles = []
-        for vehicle in all_vehicles:
+        for vehicle in vehicles:
             year = self.extract_year_from_vehicle(vehicle)
             if year and year >= MIN_YEAR:
                 filtered_vehicles.append(vehicle)
@@ -220,52 +467,138 @@ class HondaScraper:
                 logger.info(f"❓ Vehicle {vehicle.get('title')} (year unknown) - including anyway")
                 filtered_vehicles.append(vehicle)
         
-        logger.info(f"Found {len(filtered_vehicles)} vehicles matching criteria across all locations")
         return filtered_vehicles
     
-    def search_location_inventory(self, location_info: Dict, inventory_type: str) -> List[Dict]:
-        """Search specific location's inventory (new or used)"""
-        vehicles = []
-        
-        # Get the appropriate URL for this location and inventory type
+    def build_location_search_urls(self, location_info: Dict, inventory_type: str) -> List[str]:
+        """Build the Honda Civic search URLs for a location's new or used inventory"""
         url_key = 'new_url' if inventory_type == 'new' else 'used_url'
         base_url = location_info.get(url_key)
         
         if not base_url:
             logger.warning(f"No {inventory_type} URL found for {location_info['name']}")
-            return vehicles
+            return []
         
-        # Build search URLs for Honda Civic models
-        search_urls = [
+        return [
             f"{base_url}?make=Honda&model=Civic",
             f"{base_url}?make=Honda&model=Civic%20Hybrid"
         ]
+    
+    def search_location_inventory(self, location_info: Dict, inventory_type: str) -> List[Dict]:
+        """Search specific location's inventory (new or used)"""
+        vehicles = []
         
-        for search_url in search_urls:
-            logger.info(f"Fetching {inventory_type} inventory: {search_url}")
+        for search_url in self.build_location_search_urls(location_info, inventory_type):
+            vehicles.extend(self.search_page(location_info, inventory_type, search_url))
+        
+        return vehicles
+    
+    def search_page(self, location_info: Dict, inventory_type: str, search_url: str) -> List[Dict]:
+        """Fetch one search URL (and its further result pages) and tag its vehicles with the location details"""
+        logger.info(f"Fetching {inventory_type} inventory: {search_url}")
+        
+        try:
+            result = self.fetch_search_vehicles(search_url, discover_pages=self.paginate)
+            if result is None:
+                logger.warning(f"Failed to get content from {search_url}")
+                return []
             
-            try:
-                soup = self.get_page_content(search_url)
-                if not soup:
-                    logger.warning(f"Failed to get content from {search_url}")
-                    continue
-                
-                # Extract vehicles from this page
-                page_vehicles = self.extract_vehicles_from_page(soup, search_url)
-                
-                # Add location info to each vehicle
-                for vehicle in page_vehicles:
-                    vehicle['dealership'] = location_info['name']
-                    vehicle['location'] = location_info['location']
-                    vehicle['inventory_type'] = inventory_type
-                
-                vehicles.extend(page_vehicles)
-                logger.info(f"Found {len(page_vehicles)} vehicles on page")
-                
-            except Exception as e:
-                logger.error(f"Error processing {search_url}: {e}")
+            page_vehicles, page_urls = result
+            if page_urls:
+                page_vehicles = self.fetch_remaining_pages(search_url, page_vehicles, page_urls)
+            
+            return self.tag_vehicles(page_vehicles, location_info, inventory_type)
+            
+        except Exception as e:
+            logger.error(f"Error processing {search_url}: {e}")
+            return []
+    
+    def fetch_remaining_pages(self, search_url: str, first_page: List[Dict], page_urls: List[str]) -> List[Dict]:
+        """Fetch result pages 2..N in waves of per_host concurrent requests and merge them with page 1
+        
+        Vehicles are deduplicated by VIN / URL. No further waves are started once a
+        page is empty, repeats earlier pages or (from page 2 on) lists only
+        already-tracked vehicles.
+        """
+        vehicles = []
+        seen = set()
+        if self.merge_first_page(search_url, vehicles, seen, first_page, page_urls):
+            return vehicles
+        
+        wave_size = self.per_host if self.concurrent else 1
+        for wave_start in range(0, len(page_urls), wave_size):
+            wave = page_urls[wave_start:wave_start + wave_size]
+            if len(wave) == 1:
+                results = [self.fetch_search_vehicles(wave[0])]
+            else:
+                with ThreadPoolExecutor(max_workers=len(wave)) as executor:
+                    results = list(executor.map(self.fetch_search_vehicles, wave))
+            
+            if self.merge_result_pages(search_url, vehicles, seen, wave, results):
+                break
+        
+        return vehicles
+    
+    def merge_first_page(self, search_url: str, vehicles: List[Dict], seen: Set[str],
+                         first_page: List[Dict], page_urls: List[str]) -> bool:
+        """Merge page 1 of a search; return True when the remaining pages need not be fetched
+        
+        Only an empty page 1 stops here. The tracked-vehicle stop needs a page 2: page 1
+        lists only tracked vehicles on almost every repeat run, and the search URLs ask for
+        no sort order, so new vehicles can still be on later pages.
+        """
+        merge_page_vehicles(vehicles, first_page, seen)
+        if not self.page_is_exhausted(search_url, first_page, set(), stop_on_known=False):
+            return False
+        
+        with self._stats_lock:
+            self.pagination_stops += 1
+        logger.info(f"⏹️ Page 1 of {search_url} has nothing new, skipping {len(page_urls)} further pages")
+        return True
+    
+    def merge_result_pages(self, search_url: str, vehicles: List[Dict], seen: Set[str],
+                           page_urls: List[str], results: List) -> bool:
+        """Merge one wave of fetched result pages in page order; return True when pagination should stop"""
+        with self._stats_lock:
+            self.extra_pages += len(page_urls)
+        
+        exhausted = False
+        for page_url, result in zip(page_urls, results):
+            if result is None:
+                logger.warning(f"Failed to get content from {page_url}")
                 continue
+            
+            page_vehicles = result[0]
+            exhausted = exhausted or self.page_is_exhausted(page_url, page_vehicles, seen)
+            added = merge_page_vehicles(vehicles, page_vehicles, seen)
+            logger.debug(f"Result page {page_url} added {added} of {len(page_vehicles)} vehicles")
+        
+        if exhausted:
+            with self._stats_lock:
+                self.pagination_stops += 1
+            logger.info(f"⏹️ Stopping pagination of {search_url} after {len(vehicles)} vehicles")
+        return exhausted
+    
+    def page_is_exhausted(self, page_url: str, page_vehicles: List[Dict], seen: Set[str],
+                          stop_on_known: bool = True) -> bool:
+        """True when a result page is empty, repeats earlier pages or (stop_on_known) lists only tracked vehicles"""
+        if only_known_vehicles(page_vehicles, seen):
+            logger.debug(f"{page_url} has no vehicles beyond the earlier pages")
+            return True
+        if (stop_on_known and self.stop_on_known and self.known_keys and
+                only_known_vehicles(page_vehicles, seen, self.known_keys)):
+            logger.debug(f"{page_url} lists only already-tracked vehicles")
+            return True
+        return False
+    
+    def tag_vehicles(self, page_vehicles: List[Dict], location_info: Dict, inventory_type: str) -> List[Vehicle]:
+        """Turn the vehicles found on a search page into Vehicle records tagged with the location info"""
+        vehicles = [Vehicle.from_dict(vehicle) for vehicle in page_vehicles]
+        for vehicle in vehicles:
+            vehicle['dealership'] = location_info['name']
+            vehicle['location'] = location_info['location']
+            vehicle['inventory_type'] = inventory_type
         
+        logger.info(f"Found {len(vehicles)} vehicles on page")
         return vehicles
     
     def extract_year_from_vehicle(self, vehicle: Dict) -> int:
@@ -283,27 +616,17 @@ class HondaScraper:
         if 'title' in vehicle:
             title = vehicle['title']
             logger.debug(f"Extracting year from title: {title}")
-            # Look for 4-digit year (2000-2029)
-            year_match = re.search(r'\b(20[0-2]\d)\b', title)
-            if year_match:
-                try:
-                    year = int(year_match.group(1))
-                    logger.debug(f"Extracted year {year} from title")
-                    return year
-                except ValueError:
-                    pass
+            year = parse_year(title)
+            if year:
+                logger.debug(f"Extracted year {year} from title")
+                return year
         
         # Try to extract from URL
         if 'url' in vehicle:
-            url = vehicle['url']
-            year_match = re.search(r'/(20[0-2]\d)-', url)
-            if year_match:
-                try:
-                    year = int(year_match.group(1))
-                    logger.debug(f"Extracted year {year} from URL")
-                    return year
-                except ValueError:
-                    pass
+            year = parse_url_year(vehicle['url'])
+            if year:
+                logger.debug(f"Extracted year {year} from URL")
+                return year
         
         logger.debug(f"No year found for vehicle: {vehicle.get('title', 'Unknown')}")
         return None
@@ -350,9 +673,9 @@ class HondaScraper:
         params = parse_qs(parsed_url.query)
         
         # Extract year from URL path or parameters
-        year_match = re.search(r'(20\d{2})', url)
-        if year_match:
-            vehicle_info['year'] = year_match.group(1)
+        year = parse_url_year(url, anywhere=True)
+        if year:
+            vehicle_info['year'] = str(year)
         
         # Extract make, model, and trim from parameters
         if 'make' in params:
@@ -423,28 +746,56 @@ class HondaScraper:
         
         return ' '.join(parts)
 
-    def extract_vehicles_from_page(self, soup, base_url: str) -> List[Dict]:
-        """Extract vehicle information from a single page"""
+    def scan_anchors(self, soup) -> Dict[str, List]:
+        """Collect every <a> in one traversal and classify it against all link patterns
+        
+        Returns the anchors matching each VEHICLE_LINK_PATTERNS entry (in pattern order),
+        the inventory-page links and the links whose text mentions Honda Civic, each in
+        document order.
+        """
+        vehicle_links = [[] for _ in VEHICLE_LINK_PATTERNS]
+        inventory_links = []
+        honda_civic_links = []
+        
+        for link in soup.find_all('a'):
+            href = link.get('href')
+            if href is not None and not is_page_link(href):
+                for matches, pattern in zip(vehicle_links, VEHICLE_LINK_PATTERNS):
+                    if pattern.search(href):
+                        matches.append(link)
+                if INVENTORY_LINK_PATTERN.search(href):
+                    inventory_links.append(link)
+            
+            link_string = link.string
+            if link_string is not None and HONDA_CIVIC_TEXT_PATTERN.search(link_string):
+                honda_civic_links.append(link)
+        
+        return {
+            'vehicle_links': vehicle_links,
+            'inventory_links': inventory_links,
+            'honda_civic_links': honda_civic_links
+        }
+    
+    def extract_vehicles_from_page(self, soup, base_url: str, text_fallbacks: bool = True) -> List[Dict]:
+        """Extract vehicle information from a single page
+        
+        text_fallbacks=False stops after the link-based approaches (1 and 2).
+        """
         vehicles = []
         
-        # Debug: Check if page has content
-        page_text = soup.get_text().lower()
-        logger.debug(f"Page contains 'civic': {'civic' in page_text}")
-        logger.debug(f"Page contains 'honda': {'honda' in page_text}")
+        # Debug: Check if page has content (full-text pass only when debugging)
+        if logger.isEnabledFor(logging.DEBUG):
+            page_text = soup.get_text().lower()
+            logger.debug(f"Page contains 'civic': {'civic' in page_text}")
+            logger.debug(f"Page contains 'honda': {'honda' in page_text}")
         
-        # Try multiple approaches to find vehicles
+        # Every link-based approach below is fed from this single pass over the tree
+        anchors = self.scan_anchors(soup)
+        parent_prices = {}
         
         # Approach 1: Look for vehicle links directly (both new and used)
-        vehicle_patterns = [
-            r'/new/Honda/.*Civic',
-            r'/used/Honda/.*Civic',
-            r'/inventory/.*Honda.*Civic',
-            r'\?.*model.*[Cc]ivic'  # URLs with civic in parameters
-        ]
-        
-        for pattern in vehicle_patterns:
-            vehicle_links = soup.find_all('a', href=re.compile(pattern, re.I))
-            logger.debug(f"Pattern '{pattern}' found {len(vehicle_links)} vehicle links")
+        for pattern, vehicle_links in zip(VEHICLE_LINK_PATTERNS, anchors['vehicle_links']):
+            logger.debug(f"Pattern '{pattern.pattern}' found {len(vehicle_links)} vehicle links")
             
             for link in vehicle_links:
                 try:
@@ -463,13 +814,14 @@ class HondaScraper:
                         **url_info  # Include all extracted info
                     }
                     
-                    # Look for price in nearby elements
+                    # Look for price in nearby elements (each container is read once)
                     parent = link.find_parent(['div', 'section', 'article', 'li'])
                     if parent:
-                        price_text = parent.get_text()
-                        price_match = re.search(r'\$[\d,]+', price_text)
-                        if price_match:
-                            vehicle_info['price'] = price_match.group()
+                        if id(parent) not in parent_prices:
+                            price_match = PRICE_PATTERN.search(parent.get_text())
+                            parent_prices[id(parent)] = price_match.group() if price_match else None
+                        if parent_prices[id(parent)]:
+                            vehicle_info['price'] = parent_prices[id(parent)]
                     
                     vehicles.append(vehicle_info)
                     logger.debug(f"Found vehicle: {vehicle_info['title']}")
@@ -478,8 +830,7 @@ class HondaScraper:
         
         # Approach 2: Look for inventory page links that might contain vehicle data
         if not vehicles:
-            # Look for links to inventory pages with Honda Civic parameters
-            inventory_links = soup.find_all('a', href=re.compile(r'inventory.*honda|honda.*inventory', re.I))
+            inventory_links = anchors['inventory_links']
             logger.debug(f"Found {len(inventory_links)} inventory links")
             
             for link in inventory_links:
@@ -500,16 +851,11 @@ class HondaScraper:
                     logger.debug(f"Error processing inventory link: {e}")
         
         # Approach 3: Look for text patterns that indicate vehicles
-        if not vehicles:
-            # Look for Honda Civic text patterns with years
-            civic_patterns = [
-                r'(20\d{2})\s+Honda\s+Civic[^<]*',
-                r'Honda\s+Civic[^<]*',
-                r'Civic\s+(Hybrid|Sport|EX|LX)[^<]*'
-            ]
+        if not vehicles and text_fallbacks:
+            page_text = soup.get_text()
             
-            for pattern in civic_patterns:
-                matches = re.findall(pattern, soup.get_text(), re.I)
+            for pattern in CIVIC_TEXT_PATTERNS:
+                matches = pattern.findall(page_text)
                 for match in matches:
                     title_text = match if isinstance(match, str) else ' '.join(match)
                     vehicle_info = {
@@ -520,11 +866,11 @@ class HondaScraper:
                     logger.debug(f"Found vehicle by pattern: {vehicle_info['title']}")
         
         # Approach 4: Try broader Honda search
-        if not vehicles:
+        if not vehicles and text_fallbacks:
             logger.debug("Trying broader search approach...")
             
-            # Try to find any links with Honda and Civic in them
-            honda_links = soup.find_all('a', text=re.compile(r'Honda.*Civic|Civic.*Honda', re.I))
+            # Links whose text mentions both Honda and Civic
+            honda_links = anchors['honda_civic_links']
             logger.debug(f"Found {len(honda_links)} Honda Civic links")
             
             for link in honda_links:
@@ -571,9 +917,9 @@ class HondaScraper:
             if price_elem:
                 price_parent = price_elem.parent
                 price_text = price_parent.get_text() if price_parent else ""
-                price_match = re.search(r'\$[\d,]+', price_text)
-                if price_match:
-                    details['price'] = price_match.group()
+                price = find_price(price_text)
+                if price:
+                    details['price'] = price
             
             # Extract specifications
             spec_elements = soup.find_all(['dt', 'dd', 'li'], text=re.compile(r'Engine|Transmission|MPG|Color', re.I))
@@ -0,0 +1,91 @@
+import logging
+import threading
+from scraper import HondaScraper
+from data_manager import DataManager
+from config import SCRAPER_ENGINE, LEITH_HONDA_LOCATIONS
+
+# Scheduled jobs can search on several worker threads at once; their data and dashboard updates take turns.
+# Kept here rather than in main.py so that main.py run as __main__ and SearchService share one lock.
+store_lock = threading.Lock()
+_runs_saved = 0  # Runs this process has saved, to spot data loaded before another job's save
+
+def create_scraper(engine: str = None, locations: list = None):
+    """Create the scraper for the requested engine ('sync' or 'async'), optionally for some location keys only"""
+    engine = engine or SCRAPER_ENGINE
+    if locations is not None:
+        locations = {key: LEITH_HONDA_LOCATIONS[key] for key in locations}
+    if engine == 'async':
+        from async_scraper import AsyncHondaScraper
+        return AsyncHondaScraper(locations=locations)
+    return HondaScraper(locations=locations)
+
+def perform_search(engine: str = None, scraper=None, data_manager=None, dashboard_state: dict = None,
+                   locations: list = None):
+    """Perform a single search and track inventory matches
+    
+    Builds a fresh scraper and DataManager unless warm ones are passed in
+    (SearchService does, along with the dashboard state it keeps).
+    `locations` limits a fresh scraper to those LEITH_HONDA_LOCATIONS keys.
+    """
+    global _runs_saved
+    logger = logging.getLogger(__name__)
+    
+    try:
+        # Initialize components
+        scraper = scraper or create_scraper(engine, locations)
+        fresh_data = data_manager is None
+        with store_lock:
+            data_manager = data_manager or DataManager()
+            loaded_after = _runs_saved
+            scraper.known_keys = data_manager.get_known_keys()
+        
+        logger.info("Starting Honda car search...")
+        
+        # Perform the search
+        current_vehicles = scraper.search_vehicles()
+        logger.info(f"Found {len(current_vehicles)} total vehicles")
+        
+        with store_lock:
+            if fresh_data and loaded_after != _runs_saved:
+                data_manager.store.discard()  # Another job saved while this one searched; start from its data
+            
+            # Every change from this run is written once, atomically, when the block exits
+            with data_manager.transaction():
+                # Filter for new vehicles
+                new_vehicles = data_manager.get_new_vehicles(current_vehicles)
+                logger.info(f"Found {len(new_vehicles)} new vehicles")
+            
+                # Track new vehicles
+                if new_vehicles:
+                    logger.info(f"Tracking {len(new_vehicles)} new vehicles")
+                    # Add new vehicles to tracking
+                    data_manager.add_vehicles(new_vehicles)
+                    logger.info("New vehicles added to tracking")
+                else:
+                    logger.info("No new vehicles found")
+            
+                # Update statistics
+                data_manager.update_search_stats(len(current_vehicles), len(new_vehicles) > 0, False,
+                                                 run_stats=scraper.get_stats())
+            
+                # Clean up old data periodically
+                data_manager.cleanup_old_matches(30)
+        
+            _runs_saved += 1
+            write_stats = data_manager.get_write_stats()
+            logger.info(f"💾 Saved run in {write_stats['writes']} write(s), {write_stats['bytes_written']:,} bytes")
+        
+            # Update web dashboard
+            try:
+                from web_updater import update_web_dashboard
+                update_web_dashboard(new_vehicles, data_manager=data_manager, dashboard_state=dashboard_state)
+            except ImportError:
+                pass  # Web dashboard not available
+            except Exception as e:
+                logger.warning(f"Failed to update web dashboard: {e}")
+        
+        return len(new_vehicles)
+        
+    except Exception as e:
+        logger.error(f"Error during search: {e}")
+        return 0
@@ -0,0 +1,115 @@
+import time
+import logging
+from typing import Dict, List, Tuple
+from config import DATA_BACKEND, DAEMON
+from data_manager import DataManager
+from storage import JournalStore
+from search_runner import create_scraper, perform_search, store_lock
+from web_updater import load_converter
+from adaptive_polling import load_polling_history
+
+logger = logging.getLogger(__name__)
+
+class SearchService:
+    """Resident search process for scheduled runs (python main.py --daemon)
+
+    perform_search on its own builds a new scraper (a new requests.Session,
+    so new TCP/TLS handshakes to every dealer host) and a new DataManager (the
+    whole data file parsed and its id index rebuilt) for every run. The
+    service builds them once, together with the parsed dashboard pages, and
+    hands the same objects to each run. With the JSON backend runs are
+    persisted as journal records, the size of the run's changes, instead of
+    a rewrite of the data file; close() folds them back into the file.
+    """
+
+    def __init__(self, engine: str = None, scraper=None, data_manager: DataManager = None):
+        """
+        Args:
+            engine: Scraper engine ('sync' or 'async'); the async engine opens a new aiohttp
+                session per run, so only its cache, data and dashboard state stay warm
+            scraper, data_manager: Use these instead of building them (tests, benchmarks)
+        """
+        start = time.perf_counter()
+        self.engine = engine
+        self.scraper = scraper or create_scraper(engine)
+        self.scrapers = {None: self.scraper}  # Location keys -> warm scraper, for dealers on their own schedule
+        scraper_ready = time.perf_counter()
+
+        if data_manager is None:
+            backend = 'journal' if DATA_BACKEND == 'json' and DAEMON['journal'] else None
+            data_manager = DataManager(backend)
+        self.data_manager = data_manager
+        data_ready = time.perf_counter()
+
+        self.dashboard_state = {}
+        converter = load_converter()
+        loaded = converter.read_web_data() if converter else None
+        if loaded is not None:
+            self.dashboard_state['dashboard'] = loaded
+        dashboard_ready = time.perf_counter()
+
+        # What a cold run spends before its first request; a warm run skips all of it
+        self.setup_seconds = {
+            'scraper': scraper_ready - start,
+            'data': data_ready - scraper_ready,
+            'dashboard': dashboard_ready - data_ready
+        }
+        self.cold_setup_seconds = sum(self.setup_seconds.values())
+        self.runs = 0
+        self.last_run_setup_seconds = 0.0
+        self.setup_seconds_saved = 0.0
+        logger.info(f"♻️ Search service ready in {self.cold_setup_seconds * 1000:.0f} ms "
+                    f"(scraper {self.setup_seconds['scraper'] * 1000:.0f}, data {self.setup_seconds['data'] * 1000:.0f}, "
+                    f"dashboard {self.setup_seconds['dashboard'] * 1000:.0f})")
+
+    def run_once(self, locations: List[str] = None) -> int:
+        """Run one search with the warm components; returns the number of new vehicles
+
+        Args:
+            locations: Search only these LEITH_HONDA_LOCATIONS keys (each set gets a warm scraper of its own)
+        """
+        start = time.perf_counter()
+        key = tuple(locations) if locations else None
+        scraper = self.scrapers.get(key)
+        if scraper is None:
+            scraper = self.scrapers[key] = create_scraper(self.engine, locations)
+        scraper.reset_stats()
+        self.last_run_setup_seconds = time.perf_counter() - start
+
+        new_count = perform_search(scraper=scraper, data_manager=self.data_manager,
+                                   dashboard_state=self.dashboard_state)
+
+        self.runs += 1
+        self.setup_seconds_saved += max(self.cold_setup_seconds - self.last_run_setup_seconds, 0.0)
+        logger.info(f"♻️ Warm run {self.runs}: setup {self.last_run_setup_seconds * 1000:.1f} ms instead of "
+                    f"{self.cold_setup_seconds * 1000:.0f} ms ({self.setup_seconds_saved:.2f}s saved so far)")
+        return new_count
+
+    def polling_history(self) -> Tuple[List[Dict], List[Dict]]:
+        """Recent matches and search history for adaptive polling, read from the warm data"""
+        with store_lock:
+            return load_polling_history(self.data_manager)
+
+    def get_stats(self) -> Dict:
+        """Setup cost of a cold run and what reusing the warm components has saved"""
+        return {
+            'runs': self.runs,
+            'cold_setup_ms': round(self.cold_setup_seconds * 1000, 1),
+            'setup_ms': {part: round(seconds * 1000, 1) for part, seconds in self.setup_seconds.items()},
+            'last_run_setup_ms': round(self.last_run_setup_seconds * 1000, 3),
+            'setup_seconds_saved': round(self.setup_seconds_saved, 3),
+            'setup_ms_saved_per_run': round(self.setup_seconds_saved * 1000 / self.runs, 1) if self.runs else 0.0
+        }
+
+    def close(self):
+        """Fold journaled runs into the data file and release connections"""
+        store = self.data_manager.store
+        if isinstance(store, JournalStore):
+            store.compact()
+        elif hasattr(store, 'close'):
+            store.close()
+        for scraper in self.scrapers.values():
+            session = getattr(scraper, 'session', None)
+            if session is not None:
+                session.close()
+        logger.info(f"♻️ Search service stopped after {self.runs} runs ({self.setup_seconds_saved:.2f}s setup saved)")
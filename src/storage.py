@@ -0,0 +1,824 @@
+import json
+import os
+import sqlite3
+import logging
+from datetime import date, timedelta
+from functools import lru_cache
+from typing import List, Dict, Set, Iterable, Optional, Tuple
+from config import DATA_FILE, DATA_BACKEND, SQLITE_FILE, PARTITION_DIR, ID_INDEX, JOURNAL, PARTITIONS
+from id_index import IdIndex, BloomFilter
+import data_formats
+
+logger = logging.getLogger(__name__)
+
+def empty_data() -> Dict:
+    """The data layout of a fresh previous_matches.json"""
+    return {
+        'previous_matches': [],
+        'last_search': None,
+        'total_searches': 0,
+        'notifications_sent': 0
+    }
+
+def fsync_directory(path: str):
+    """Make a rename inside the file's directory durable (no-op where directories can't be opened)"""
+    try:
+        fd = os.open(os.path.dirname(os.path.abspath(path)), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+def write_data_atomically(path: str, data: Dict, data_format: str) -> int:
+    """Encode data, write it to a temp file, fsync it and rename it over `path`; returns bytes written
+
+    A crash at any point leaves either the old or the new file, never a partial one.
+    """
+    return write_bytes_atomically(path, data_formats.encode(data, data_format))
+
+def write_bytes_atomically(path: str, content: bytes) -> int:
+    """Write bytes to a temp file, fsync it and rename it over `path`; returns bytes written"""
+    temp_path = path + '.tmp'
+    with open(temp_path, 'wb') as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, path)
+    fsync_directory(path)
+    return len(content)
+
+def append_and_fsync(path: str, content: bytes) -> int:
+    """Append bytes to a file and fsync it; returns bytes written"""
+    with open(path, 'ab') as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    return len(content)
+
+UNDATED_PARTITION = 'undated'
+
+@lru_cache(maxsize=4096)
+def partition_key(day: str, granularity: str) -> str:
+    """Partition name for a first_seen date ('YYYY-MM-DD', or ISO week 'YYYY-Www')"""
+    try:
+        first_seen = date.fromisoformat(day)
+    except ValueError:
+        return UNDATED_PARTITION
+    if granularity == 'week':
+        year, week, _ = first_seen.isocalendar()
+        return f"{year}-W{week:02d}"
+    return day
+
+@lru_cache(maxsize=4096)
+def partition_range(partition: str) -> Tuple[str, str]:
+    """First day and the day after the last day of a partition, as ISO dates
+
+    Every first_seen in the partition compares >= the start and < the end, so
+    whole partitions can be tested against a cutoff without reading them. The
+    undated partition gets an empty range and is always past any cutoff.
+    """
+    try:
+        if '-W' in partition:
+            year, week = partition.split('-W')
+            start = date.fromisocalendar(int(year), int(week), 1)
+            end = start + timedelta(days=7)
+        else:
+            start = date.fromisoformat(partition)
+            end = start + timedelta(days=1)
+    except ValueError:
+        return '', ''
+    return start.isoformat(), end.isoformat()
+
+class JsonStore:
+    """Tracked vehicles and search bookkeeping kept in one JSON document
+
+    The whole file is loaded into memory and rewritten on every save, in the
+    configured data format (pretty, minified or gzipped JSON, or msgpack); any
+    of them is read back regardless of the setting. Duplicate checks go through
+    an id index built once at load and kept in step by add_matches and
+    remove_matches_before.
+    """
+
+    def __init__(self, path: str = None, bloom_filter: bool = None, data_format: str = None):
+        self.path = path or DATA_FILE
+        self.bloom_filter = bloom_filter
+        self.data_format = data_formats.resolve_format(data_format)
+        self.writes = 0
+        self.bytes_written = 0
+        self.data = self.load()
+        self.index = self._build_index()
+
+    def _build_index(self) -> IdIndex:
+        ids = (match.get('id') for match in self.data['previous_matches'])
+        return IdIndex((vehicle_id for vehicle_id in ids if vehicle_id), self.bloom_filter)
+
+    def load(self) -> Dict:
+        """Load previous search data from file"""
+        try:
+            if os.path.exists(self.path):
+                data = data_formats.read_data_file(self.path)
+                logger.info(f"Loaded data from {self.path}")
+                return data
+            else:
+                logger.info("No existing data file found, starting fresh")
+                return empty_data()
+        except Exception as e:
+            logger.error(f"Error loading data file: {e}")
+            return empty_data()
+
+    def save(self) -> bool:
+        """Save current data to file (atomically)"""
+        try:
+            self.bytes_written += write_data_atomically(self.path, self.data, self.data_format)
+            self.writes += 1
+            logger.info(f"Data saved to {self.path}")
+            return True
+        except Exception as e:
+            logger.error(f"Error saving data file: {e}")
+            return False
+
+    def discard(self):
+        """Drop unsaved changes by reloading from disk"""
+        self.data = self.load()
+        self.index = self._build_index()
+
+    def get_meta(self, key: str, default=None):
+        return self.data.get(key, default)
+
+    def set_meta(self, key: str, value):
+        self.data[key] = value
+
+    def append_history(self, entry: Dict, keep: int):
+        """Add a search log entry, keeping only the last `keep` entries"""
+        search_history = (self.data.get('search_history') or []) + [entry]
+        self.data['search_history'] = search_history[-keep:]
+
+    def contains(self, vehicle_id: str) -> bool:
+        return vehicle_id in self.index
+
+    def known_keys(self) -> Set[str]:
+        """VINs and listing URLs of every tracked vehicle"""
+        keys = set()
+        for match in self.data['previous_matches']:
+            for field in ('vin', 'url'):
+                if match.get(field):
+                    keys.add(match[field])
+        return keys
+
+    def add_matches(self, vehicles: List[Dict]):
+        vehicles = list(vehicles)
+        self.data['previous_matches'].extend(vehicles)
+        for vehicle in vehicles:
+            if vehicle.get('id'):
+                self.index.add(vehicle['id'])
+
+    def remove_matches_before(self, cutoff: str) -> int:
+        """Drop matches first seen at or before the ISO timestamp (and matches without one)"""
+        kept = []
+        removed = 0
+        for match in self.data['previous_matches']:
+            if 'first_seen' in match and match['first_seen'] > cutoff:
+                kept.append(match)
+            else:
+                removed += 1
+                if match.get('id'):
+                    self.index.discard(match['id'])
+        self.data['previous_matches'] = kept
+        return removed
+
+    def matches_since(self, cutoff: str) -> List[Dict]:
+        return [match for match in self.data['previous_matches'] if match.get('first_seen', '') > cutoff]
+
+    def all_matches(self) -> List[Dict]:
+        return self.data['previous_matches']
+
+    def count(self) -> int:
+        return len(self.data['previous_matches'])
+
+    def snapshot(self) -> Dict:
+        """The full data document, as stored in previous_matches.json"""
+        return self.data
+
+    def reset(self, data: Dict):
+        self.data = data
+        self.index = self._build_index()
+
+    def size_bytes(self) -> int:
+        return os.path.getsize(self.path) if os.path.exists(self.path) else 0
+
+class JournalStore(JsonStore):
+    """JsonStore that appends changes to a JSON Lines journal instead of rewriting the file
+
+    Each save appends the pending records (new matches, bookkeeping values,
+    search history entries, cleanups) to previous_matches.json.journal and
+    fsyncs it, so a save costs the size of the change rather than the size of
+    the history. Once the journal holds compact_records records it is folded
+    into a fresh snapshot written atomically. Loading replays the journal on
+    top of the snapshot; records carry sequence numbers so a crash between
+    writing the snapshot and truncating the journal never applies a record
+    twice, and a torn final line from a crash mid-append is dropped.
+    """
+
+    def __init__(self, path: str = None, bloom_filter: bool = None, compact_records: int = None,
+                 data_format: str = None):
+        self.journal_path = (path or DATA_FILE) + '.journal'
+        self.compact_records = compact_records or JOURNAL['compact_records']
+        self.pending = []
+        self.journal_records = 0
+        self.seq = 0
+        self._needs_compaction = False
+        super().__init__(path, bloom_filter, data_format)
+
+    def load(self) -> Dict:
+        """Load the snapshot and replay the journal on top of it"""
+        data = super().load()
+        self.seq = data.get('journal_seq', 0)
+        self.journal_records = 0
+        if not os.path.exists(self.journal_path):
+            return data
+
+        with open(self.journal_path, 'rb') as f:
+            lines = f.readlines()
+
+        replayed = 0
+        offset = 0
+        for number, line in enumerate(lines, 1):
+            try:
+                if not line.endswith(b'\n'):
+                    raise ValueError('incomplete line')
+                record = json.loads(line)
+            except ValueError as e:
+                if number == len(lines):
+                    # A crash mid-append leaves a torn final line; it was never committed,
+                    # so cut it off and let the next append start on a clean line
+                    logger.warning(f"Dropping torn final journal record in {self.journal_path}: {e}")
+                    with open(self.journal_path, 'r+b') as f:
+                        f.truncate(offset)
+                        os.fsync(f.fileno())
+                else:
+                    logger.error(f"Skipping corrupt journal record on line {number} of {self.journal_path}: {e}")
+                    offset += len(line)
+                continue
+
+            offset += len(line)
+            self.journal_records += 1
+            if record.get('seq', 0) > self.seq:
+                self._apply(data, record)
+                self.seq = record['seq']
+                replayed += 1
+
+        logger.info(f"Replayed {replayed} journal records from {self.journal_path}")
+        return data
+
+    @staticmethod
+    def _apply(data: Dict, record: Dict):
+        op = record.get('op')
+        if op == 'add':
+            data['previous_matches'].append(record['match'])
+        elif op == 'meta':
+            data[record['key']] = record['value']
+        elif op == 'history':
+            search_history = (data.get('search_history') or []) + [record['entry']]
+            data['search_history'] = search_history[-record['keep']:]
+        elif op == 'cleanup':
+            data['previous_matches'] = [
+                match for match in data['previous_matches']
+                if 'first_seen' in match and match['first_seen'] > record['cutoff']
+            ]
+        else:
+            logger.warning(f"Skipping unknown journal record: {op}")
+
+    def _record(self, record: Dict):
+        self.seq += 1
+        record['seq'] = self.seq
+        self.pending.append(record)
+
+    def set_meta(self, key: str, value):
+        super().set_meta(key, value)
+        self._record({'op': 'meta', 'key': key, 'value': value})
+
+    def append_history(self, entry: Dict, keep: int):
+        super().append_history(entry, keep)
+        self._record({'op': 'history', 'entry': entry, 'keep': keep})
+
+    def add_matches(self, vehicles: List[Dict]):
+        vehicles = list(vehicles)
+        super().add_matches(vehicles)
+        for vehicle in vehicles:
+            self._record({'op': 'add', 'match': vehicle})
+
+    def remove_matches_before(self, cutoff: str) -> int:
+        removed = super().remove_matches_before(cutoff)
+        if removed:
+            self._record({'op': 'cleanup', 'cutoff': cutoff})
+        return removed
+
+    def reset(self, data: Dict):
+        super().reset(data)
+        self.pending = []
+        self._needs_compaction = True
+
+    def save(self) -> bool:
+        """Append and fsync pending records, compacting into a snapshot when the journal is long"""
+        if self._needs_compaction or self.journal_records + len(self.pending) >= self.compact_records:
+            return self.compact()
+        if not self.pending:
+            return True
+
+        try:
+            lines = ''.join(json.dumps(record, default=str, separators=(',', ':')) + '\n' for record in self.pending)
+            with open(self.journal_path, 'a') as f:
+                f.write(lines)
+                f.flush()
+                os.fsync(f.fileno())
+            self.writes += 1
+            self.bytes_written += len(lines.encode('utf-8'))
+            self.journal_records += len(self.pending)
+            logger.info(f"Journaled {len(self.pending)} records to {self.journal_path}")
+            self.pending = []
+            return True
+        except Exception as e:
+            logger.error(f"Error writing data journal: {e}")
+            return False
+
+    def compact(self) -> bool:
+        """Fold everything into a new snapshot (atomic rename), then empty the journal"""
+        self.data['journal_seq'] = self.seq
+        try:
+            self.bytes_written += write_data_atomically(self.path, self.data, self.data_format)
+            self.writes += 1
+
+            with open(self.journal_path, 'w') as f:
+                os.fsync(f.fileno())
+            logger.info(f"Compacted {self.journal_records + len(self.pending)} journal records into {self.path}")
+            self.journal_records = 0
+            self.pending = []
+            self._needs_compaction = False
+            return True
+        except Exception as e:
+            logger.error(f"Error compacting data journal: {e}")
+            return False
+
+    def discard(self):
+        """Drop pending records and reload snapshot plus journal"""
+        self.pending = []
+        self._needs_compaction = False
+        super().discard()
+
+    def size_bytes(self) -> int:
+        journal_size = os.path.getsize(self.journal_path) if os.path.exists(self.journal_path) else 0
+        return super().size_bytes() + journal_size
+
+class SqliteStore:
+    """Tracked vehicles in an indexed SQLite table, bookkeeping in a key/value table
+
+    Each vehicle is one row holding its JSON document alongside the indexed id
+    and first_seen columns, so dedupe lookups, inserts and cleanup touch only
+    the rows involved instead of rewriting every tracked vehicle. With the
+    Bloom filter option, ids that were never tracked skip the query entirely.
+    """
+
+    def __init__(self, path: str = None, bloom_filter: bool = None):
+        self.path = path or SQLITE_FILE
+        # Scheduled jobs may use the store from worker threads, one at a time (search_runner.store_lock)
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        with self.conn:
+            self.conn.execute('CREATE TABLE IF NOT EXISTS matches '
+                              '(rowid INTEGER PRIMARY KEY, id TEXT, first_seen TEXT, vehicle TEXT NOT NULL)')
+            self.conn.execute('CREATE INDEX IF NOT EXISTS idx_matches_id ON matches (id)')
+            self.conn.execute('CREATE INDEX IF NOT EXISTS idx_matches_first_seen ON matches (first_seen)')
+            self.conn.execute('CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)')
+        self.bloom_filter = ID_INDEX['bloom_filter'] if bloom_filter is None else bloom_filter
+        self.bloom = self._build_bloom() if self.bloom_filter else None
+        self.writes = 0
+        self.bytes_written = 0
+        self._pending_bytes = 0  # Serialized size of rows written since the last commit
+        logger.info(f"Opened SQLite data store {self.path} ({self.count()} matches)")
+
+    def _build_bloom(self) -> BloomFilter:
+        ids = (row[0] for row in self.conn.execute('SELECT id FROM matches WHERE id IS NOT NULL'))
+        return BloomFilter.from_keys(ids, self.count())
+
+    def load(self) -> Dict:
+        return self.snapshot()
+
+    def save(self) -> bool:
+        """Commit pending changes"""
+        if not self.conn.in_transaction:
+            return True
+        try:
+            self.conn.commit()
+            self.writes += 1
+            self.bytes_written += self._pending_bytes
+            self._pending_bytes = 0
+            return True
+        except sqlite3.Error as e:
+            logger.error(f"Error saving SQLite data store: {e}")
+            return False
+
+    def discard(self):
+        """Roll back uncommitted changes"""
+        self.conn.rollback()
+        self._pending_bytes = 0
+        if self.bloom is not None:
+            self.bloom = self._build_bloom()
+
+    def get_meta(self, key: str, default=None):
+        row = self.conn.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return json.loads(row[0]) if row else default
+
+    def set_meta(self, key: str, value):
+        value = json.dumps(value, default=str)
+        self._pending_bytes += len(key) + len(value)
+        self.conn.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', (key, value))
+
+    def append_history(self, entry: Dict, keep: int):
+        """Add a search log entry, keeping only the last `keep` entries"""
+        search_history = (self.get_meta('search_history') or []) + [entry]
+        self.set_meta('search_history', search_history[-keep:])
+
+    def contains(self, vehicle_id: str) -> bool:
+        if self.bloom is not None and vehicle_id not in self.bloom:
+            return False
+        return self.conn.execute('SELECT 1 FROM matches WHERE id = ? LIMIT 1', (vehicle_id,)).fetchone() is not None
+
+    def known_keys(self) -> Set[str]:
+        """VINs and listing URLs of every tracked vehicle"""
+        rows = self.conn.execute("SELECT json_extract(vehicle, '$.vin'), json_extract(vehicle, '$.url') FROM matches")
+        return {key for row in rows for key in row if key}
+
+    def add_matches(self, vehicles: Iterable[Dict]):
+        rows = [(vehicle.get('id'), vehicle.get('first_seen'), json.dumps(vehicle, default=str)) for vehicle in vehicles]
+        self.conn.executemany('INSERT INTO matches (id, first_seen, vehicle) VALUES (?, ?, ?)', rows)
+        self._pending_bytes += sum(len(row[2]) for row in rows)
+
+        if self.bloom is not None:
+            for vehicle_id, _, _ in rows:
+                if vehicle_id:
+                    self.bloom.add(vehicle_id)
+            if self.bloom.full:
+                self.bloom = self._build_bloom()
+
+    def remove_matches_before(self, cutoff: str) -> int:
+        """Drop matches first seen at or before the ISO timestamp (and matches without one)"""
+        cursor = self.conn.execute('DELETE FROM matches WHERE first_seen IS NULL OR first_seen <= ?', (cutoff,))
+        return cursor.rowcount
+
+    def matches_since(self, cutoff: str) -> List[Dict]:
+        rows = self.conn.execute('SELECT vehicle FROM matches WHERE first_seen > ? ORDER BY rowid', (cutoff,))
+        return [json.loads(row[0]) for row in rows]
+
+    def all_matches(self) -> List[Dict]:
+        return [json.loads(row[0]) for row in self.conn.execute('SELECT vehicle FROM matches ORDER BY rowid')]
+
+    def count(self) -> int:
+        return self.conn.execute('SELECT COUNT(*) FROM matches').fetchone()[0]
+
+    def snapshot(self) -> Dict:
+        """The full data document in the previous_matches.json layout"""
+        data = {key: json.loads(value) for key, value in self.conn.execute('SELECT key, value FROM meta')}
+        data['previous_matches'] = self.all_matches()
+        return {**empty_data(), **data}
+
+    def reset(self, data: Dict):
+        self.conn.execute('DELETE FROM matches')
+        self.conn.execute('DELETE FROM meta')
+        for key, value in data.items():
+            if key != 'previous_matches':
+                self.set_meta(key, value)
+        if self.bloom is not None:
+            self.bloom = self._build_bloom()
+        self.add_matches(data.get('previous_matches', []))
+
+    def size_bytes(self) -> int:
+        return sum(os.path.getsize(path) for path in (self.path, self.path + '-wal') if os.path.exists(path))
+
+    def close(self):
+        self.conn.close()
+
+class PartitionedStore:
+    """Tracked vehicles split into one JSON Lines file per day (or week) of first_seen
+
+    Bookkeeping lives in meta.json next to the partitions. New matches are
+    appended to their partition, so a save costs the size of the change.
+    Cleanup deletes partitions that lie entirely before the cutoff and
+    rewrites at most the one partition straddling it; recent-match queries
+    read only the partitions after the cutoff. Each partition has a .keys
+    sidecar (id, VIN and URL per match) so duplicate checks and known keys
+    load without parsing the matches themselves.
+
+    meta.json is written after the partitions and records their sizes, so a
+    partition whose size disagrees after a crash is rebuilt from its readable
+    lines on the next open.
+    """
+
+    def __init__(self, path: str = None, bloom_filter: bool = None, granularity: str = None,
+                 data_format: str = None):
+        self.path = path or PARTITION_DIR
+        self.bloom_filter = bloom_filter
+        self.granularity = granularity or PARTITIONS['granularity']
+        self.data_format = data_formats.resolve_format(data_format)
+        self.meta_path = os.path.join(self.path, 'meta.json')
+        self.writes = 0
+        self.bytes_written = 0
+        os.makedirs(self.path, exist_ok=True)
+        self._open()
+
+    def _open(self):
+        """Read meta.json and every partition's keys, rebuilding partitions left inconsistent by a crash"""
+        self.meta = {key: value for key, value in empty_data().items() if key != 'previous_matches'}
+        self.sizes = {}
+        dropped = []
+        if os.path.exists(self.meta_path):
+            try:
+                document = data_formats.read_data_file(self.meta_path)
+                self.meta.update(document.get('meta', {}))
+                self.sizes = document.get('partitions', {})
+                dropped = document.get('dropped', [])
+            except Exception as e:
+                logger.error(f"Error loading partition metadata: {e}")
+
+        self.keys = {}      # partition -> [(id, vin, url), ...] in storage order
+        self.loaded = {}    # partition -> all of its matches, for partitions to rewrite on save
+        self.appended = {}  # partition -> matches to append on save
+        self.dropped = set()
+        self._meta_dirty = False
+
+        # Finish deleting partitions a cleanup dropped before it was interrupted
+        for partition in dropped:
+            if partition not in self.sizes:
+                self._delete_files(partition)
+
+        for name in sorted(os.listdir(self.path)):
+            if not name.endswith('.jsonl'):
+                continue
+            partition = name[:-len('.jsonl')]
+            if os.path.getsize(self._file(partition)) == self.sizes.get(partition) and \
+                    os.path.exists(self._keys_file(partition)):
+                self.keys[partition] = self._read_keys(partition)
+            else:
+                logger.warning(f"Rebuilding partition {partition} in {self.path} after an interrupted save")
+                matches = self._read_partition(partition)
+                self.keys[partition] = [self._match_keys(match) for match in matches]
+                self.loaded[partition] = matches
+                self._meta_dirty = True
+        self.sizes = {partition: size for partition, size in self.sizes.items() if partition in self.keys}
+
+        ids = (keys[0] for partition_keys in self.keys.values() for keys in partition_keys)
+        self.index = IdIndex((vehicle_id for vehicle_id in ids if vehicle_id), self.bloom_filter)
+        logger.info(f"Opened partitioned data store {self.path} ({len(self.keys)} partitions, {self.count()} matches)")
+
+    def _file(self, partition: str) -> str:
+        return os.path.join(self.path, partition + '.jsonl')
+
+    def _keys_file(self, partition: str) -> str:
+        return os.path.join(self.path, partition + '.keys')
+
+    def _delete_files(self, partition: str):
+        for path in (self._file(partition), self._keys_file(partition)):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def _partition(self, match: Dict) -> str:
+        first_seen = match.get('first_seen')
+        if not first_seen:
+            return UNDATED_PARTITION
+        return partition_key(str(first_seen)[:10], self.granularity)
+
+    @staticmethod
+    def _match_keys(match: Dict) -> Tuple[str, str, str]:
+        return tuple(str(match.get(field) or '') for field in ('id', 'vin', 'url'))
+
+    @staticmethod
+    def _encode_matches(matches: List[Dict]) -> bytes:
+        return ''.join(json.dumps(match, default=str, separators=(',', ':')) + '\n' for match in matches).encode('utf-8')
+
+    @staticmethod
+    def _encode_keys(keys: List[Tuple[str, str, str]]) -> bytes:
+        return ''.join('\t'.join(match_keys) + '\n' for match_keys in keys).encode('utf-8')
+
+    def _read_keys(self, partition: str) -> List[Tuple[str, str, str]]:
+        with open(self._keys_file(partition), 'r', encoding='utf-8') as f:
+            return [tuple(line.rstrip('\n').split('\t')) for line in f]
+
+    def _read_partition(self, partition: str) -> List[Dict]:
+        path = self._file(partition)
+        if not os.path.exists(path):
+            return []
+        matches = []
+        with open(path, 'rb') as f:
+            for number, line in enumerate(f, 1):
+                try:
+                    matches.append(json.loads(line))
+                except ValueError as e:
+                    logger.error(f"Skipping unreadable line {number} of {path}: {e}")
+        return matches
+
+    def _matches(self, partition: str) -> List[Dict]:
+        if partition in self.loaded:
+            return self.loaded[partition]
+        return self._read_partition(partition) + self.appended.get(partition, [])
+
+    def _drop(self, partition: str):
+        for vehicle_id, _, _ in self.keys.pop(partition):
+            if vehicle_id:
+                self.index.discard(vehicle_id)
+        self.loaded.pop(partition, None)
+        self.appended.pop(partition, None)
+        self.dropped.add(partition)
+
+    def load(self) -> Dict:
+        return self.snapshot()
+
+    def save(self) -> bool:
+        """Rewrite or append to changed partitions, then write meta.json and delete dropped partitions"""
+        if not (self.loaded or self.appended or self.dropped or self._meta_dirty):
+            return True
+        try:
+            for partition, matches in self.loaded.items():
+                self.bytes_written += write_bytes_atomically(self._file(partition), self._encode_matches(matches))
+                self.bytes_written += write_bytes_atomically(self._keys_file(partition),
+                                                             self._encode_keys(self.keys[partition]))
+                self.writes += 2
+            for partition, matches in self.appended.items():
+                self.bytes_written += append_and_fsync(self._file(partition), self._encode_matches(matches))
+                self.bytes_written += append_and_fsync(self._keys_file(partition),
+                                                       self._encode_keys(self.keys[partition][-len(matches):]))
+                self.writes += 2
+            for partition in list(self.loaded) + list(self.appended):
+                self.sizes[partition] = os.path.getsize(self._file(partition))
+            for partition in self.dropped:
+                self.sizes.pop(partition, None)
+
+            document = {'meta': self.meta, 'partitions': self.sizes, 'dropped': sorted(self.dropped)}
+            self.bytes_written += write_data_atomically(self.meta_path, document, self.data_format)
+            self.writes += 1
+
+            for partition in self.dropped:
+                self._delete_files(partition)
+            logger.info(f"Data saved to {self.path} ({len(self.loaded)} partitions rewritten, "
+                        f"{len(self.appended)} appended, {len(self.dropped)} dropped)")
+            self.loaded = {}
+            self.appended = {}
+            self.dropped = set()
+            self._meta_dirty = False
+            return True
+        except Exception as e:
+            logger.error(f"Error saving partitioned data store: {e}")
+            return False
+
+    def discard(self):
+        """Drop unsaved changes by reopening from disk"""
+        self._open()
+
+    def get_meta(self, key: str, default=None):
+        return self.meta.get(key, default)
+
+    def set_meta(self, key: str, value):
+        self.meta[key] = value
+        self._meta_dirty = True
+
+    def append_history(self, entry: Dict, keep: int):
+        """Add a search log entry, keeping only the last `keep` entries"""
+        search_history = (self.meta.get('search_history') or []) + [entry]
+        self.set_meta('search_history', search_history[-keep:])
+
+    def contains(self, vehicle_id: str) -> bool:
+        return vehicle_id in self.index
+
+    def known_keys(self) -> Set[str]:
+        """VINs and listing URLs of every tracked vehicle"""
+        return {key for partition_keys in self.keys.values() for _, vin, url in partition_keys
+                for key in (vin, url) if key}
+
+    def add_matches(self, vehicles: Iterable[Dict]):
+        for vehicle in vehicles:
+            partition = self._partition(vehicle)
+            if partition in self.dropped:
+                # Recreated after being dropped in the same run: the old file must be replaced, not appended to
+                self.dropped.discard(partition)
+                self.loaded[partition] = []
+            match_keys = self._match_keys(vehicle)
+            self.keys.setdefault(partition, []).append(match_keys)
+            if partition in self.loaded:
+                self.loaded[partition].append(vehicle)
+            else:
+                self.appended.setdefault(partition, []).append(vehicle)
+            if match_keys[0]:
+                self.index.add(match_keys[0])
+
+    def remove_matches_before(self, cutoff: str) -> int:
+        """Drop matches first seen at or before the ISO timestamp (and matches without one)
+
+        Partitions that end before the cutoff are dropped unread; only the
+        partition containing the cutoff is filtered match by match.
+        """
+        removed = 0
+        for partition in list(self.keys):
+            start, end = partition_range(partition)
+            if end <= cutoff:
+                removed += len(self.keys[partition])
+                self._drop(partition)
+            elif start <= cutoff:
+                matches = self._matches(partition)
+                kept = [match for match in matches if 'first_seen' in match and match['first_seen'] > cutoff]
+                if len(kept) == len(matches):
+                    continue
+                removed += len(matches) - len(kept)
+                self._drop(partition)
+                if kept:
+                    self.add_matches(kept)
+        return removed
+
+    def matches_since(self, cutoff: str) -> List[Dict]:
+        """Matches first seen after the ISO timestamp, reading only the partitions that can hold them"""
+        matches = []
+        for partition in sorted(self.keys):
+            start, end = partition_range(partition)
+            if end <= cutoff:
+                continue
+            if start > cutoff:
+                matches.extend(self._matches(partition))
+            else:
+                matches.extend(match for match in self._matches(partition) if match.get('first_seen', '') > cutoff)
+        return matches
+
+    def all_matches(self) -> List[Dict]:
+        return [match for partition in sorted(self.keys) for match in self._matches(partition)]
+
+    def count(self) -> int:
+        return sum(len(partition_keys) for partition_keys in self.keys.values())
+
+    def snapshot(self) -> Dict:
+        """The full data document in the previous_matches.json layout"""
+        return {**self.meta, 'previous_matches': self.all_matches()}
+
+    def reset(self, data: Dict):
+        for partition in list(self.keys):
+            self._drop(partition)
+        self.meta = {key: value for key, value in data.items() if key != 'previous_matches'}
+        self._meta_dirty = True
+        self.add_matches(data.get('previous_matches', []))
+
+    def size_bytes(self) -> int:
+        return sum(os.path.getsize(os.path.join(self.path, name)) for name in os.listdir(self.path))
+
+STORE_BACKENDS = {
+    'json': JsonStore,
+    'journal': JournalStore,
+    'sqlite': SqliteStore,
+    'partitioned': PartitionedStore
+}
+
+def create_store(backend: str = None, path: str = None):
+    """Open the configured data store backend"""
+    backend = backend or DATA_BACKEND
+    if backend not in STORE_BACKENDS:
+        logger.warning(f"Unknown data backend '{backend}', using json")
+        backend = 'json'
+    return STORE_BACKENDS[backend](path)
+
+def migrate_json_to_sqlite(json_file: str = None, sqlite_file: str = None) -> Optional[int]:
+    """One-shot copy of previous_matches.json into a new SQLite store
+
+    Returns the number of matches migrated, or None when the SQLite store
+    already holds matches (it is never overwritten).
+    """
+    source = JsonStore(json_file)
+    target = SqliteStore(sqlite_file)
+    try:
+        if target.count():
+            logger.warning(f"{target.path} already holds {target.count()} matches, not migrating")
+            return None
+
+        with target.conn:
+            target.reset(source.snapshot())
+        migrated = target.count()
+        logger.info(f"Migrated {migrated} matches from {source.path} to {target.path}")
+        return migrated
+    finally:
+        target.close()
+
+def migrate_json_to_partitions(json_file: str = None, partition_dir: str = None) -> Optional[int]:
+    """One-shot copy of previous_matches.json into a new partitioned store
+
+    Returns the number of matches migrated, or None when the partitioned store
+    already holds matches (it is never overwritten).
+    """
+    source = JsonStore(json_file)
+    target = PartitionedStore(partition_dir)
+    if target.count():
+        logger.warning(f"{target.path} already holds {target.count()} matches, not migrating")
+        return None
+
+    target.reset(source.snapshot())
+    target.save()
+    migrated = target.count()
+    logger.info(f"Migrated {migrated} matches from {source.path} into {len(target.keys)} partitions in {target.path}")
+    return migrated
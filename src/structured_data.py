@@ -0,0 +1,160 @@
+import json
+import re
+import logging
+from urllib.parse import urljoin
+from typing import List, Dict, Optional, Iterator
+from normalize import parse_price_cents, format_price, parse_mileage, format_mileage, parse_year
+
+logger = logging.getLogger(__name__)
+
+# <script type="application/ld+json"> blocks, matched on the raw page so no DOM is built
+JSON_LD_PATTERN = re.compile(r'<script[^>]+type=["\']application/ld\+json["\'][^>]*>(.*?)</script>', re.I | re.S)
+
+# Dealer.com-style inventory objects assigned in inline scripts
+INVENTORY_MARKERS = [
+    re.compile(r'DDC\.dataLayer\s*\[\s*["\']vehicles["\']\s*\]\s*=\s*'),
+    re.compile(r'["\'](?:inventory|vehicles)["\']\s*:\s*(?=\[)'),
+]
+
+JSON_LD_VEHICLE_TYPES = {'Car', 'Vehicle', 'MotorizedVehicle', 'Product'}
+
+# Field aliases seen in JSON-LD and dealer inventory objects, in order of preference
+FIELD_ALIASES = {
+    'vin': ['vehicleIdentificationNumber', 'vin', 'VIN'],
+    'year': ['vehicleModelDate', 'modelDate', 'modelYear', 'year'],
+    'make': ['brand', 'manufacturer', 'make'],
+    'model': ['model', 'modelName'],
+    'trim': ['vehicleConfiguration', 'trim', 'trimLevel'],
+    'color': ['color', 'exteriorColor', 'normalExteriorColor'],
+    'mileage': ['mileageFromOdometer', 'odometer', 'mileage'],
+    'price': ['internetPrice', 'finalPrice', 'salePrice', 'price', 'askingPrice', 'msrp'],
+    'url': ['url', 'link', 'vdpUrl', 'detailUrl'],
+    'title': ['name', 'title'],
+}
+
+def _first(record: Dict, field: str):
+    for key in FIELD_ALIASES[field]:
+        value = record.get(key)
+        if value not in (None, '', [], {}):
+            return value
+    return None
+
+def _text(value) -> Optional[str]:
+    """Flatten JSON-LD values like {"@type": "Brand", "name": "Honda"} to plain text"""
+    if isinstance(value, dict):
+        value = value.get('name') or value.get('value')
+    if isinstance(value, list):
+        value = value[0] if value else None
+    if value is None:
+        return None
+    return str(value).strip() or None
+
+def _price(record: Dict) -> Optional[str]:
+    """Read the price from the record or its offers, formatted like the scraped '$23,995'"""
+    value = _first(record, 'price')
+    if value is None:
+        offers = record.get('offers')
+        if isinstance(offers, list):
+            offers = offers[0] if offers else None
+        if isinstance(offers, dict):
+            value = offers.get('price') or offers.get('lowPrice')
+    if isinstance(value, dict):
+        value = value.get('value')
+    return format_price(parse_price_cents(value))
+
+def _mileage(record: Dict) -> Optional[str]:
+    """Read the odometer value formatted like the dashboard's '15,420'"""
+    return format_mileage(parse_mileage(_text(_first(record, 'mileage'))))
+
+def _year(record: Dict) -> Optional[str]:
+    year = parse_year(str(_first(record, 'year') or ''))
+    return str(year) if year else None
+
+def normalize_record(record: Dict, base_url: str) -> Optional[Dict]:
+    """Map a JSON-LD or inventory record onto the scraper's vehicle dict"""
+    vehicle = {
+        'vin': _text(_first(record, 'vin')),
+        'year': _year(record),
+        'make': _text(_first(record, 'make')),
+        'model': _text(_first(record, 'model')),
+        'trim': _text(_first(record, 'trim')),
+        'color': _text(_first(record, 'color')),
+        'mileage': _mileage(record),
+        'price': _price(record),
+    }
+
+    url = _text(_first(record, 'url'))
+    if not url and isinstance(record.get('offers'), dict):
+        url = _text(record['offers'].get('url'))
+    vehicle['url'] = urljoin(base_url, url) if url else None
+
+    title = _text(_first(record, 'title'))
+    if not title:
+        title = ' '.join(part for part in (vehicle['year'], vehicle['make'], vehicle['model'], vehicle['trim']) if part)
+    vehicle['title'] = title or None
+
+    vehicle = {key: value for key, value in vehicle.items() if value}
+    if not (vehicle.get('vin') or vehicle.get('url')):
+        return None
+    return vehicle
+
+def _walk_json_ld(node) -> Iterator[Dict]:
+    """Yield vehicle-like objects from a JSON-LD document, including @graph and ItemList entries"""
+    if isinstance(node, list):
+        for item in node:
+            yield from _walk_json_ld(item)
+    elif isinstance(node, dict):
+        node_type = node.get('@type')
+        types = set(node_type) if isinstance(node_type, list) else {node_type}
+        if types & JSON_LD_VEHICLE_TYPES:
+            yield node
+        for key in ('@graph', 'itemListElement', 'item'):
+            if key in node:
+                yield from _walk_json_ld(node[key])
+
+def _json_ld_records(text: str) -> List[Dict]:
+    records = []
+    for block in JSON_LD_PATTERN.findall(text):
+        try:
+            records.extend(_walk_json_ld(json.loads(block)))
+        except ValueError as e:
+            logger.debug(f"Skipping unparsable JSON-LD block: {e}")
+    return records
+
+def _inventory_records(text: str) -> List[Dict]:
+    decoder = json.JSONDecoder()
+    records = []
+    for marker in INVENTORY_MARKERS:
+        for match in marker.finditer(text):
+            try:
+                value, _ = decoder.raw_decode(text, match.end())
+            except ValueError:
+                continue
+            if isinstance(value, list):
+                records.extend(item for item in value if isinstance(item, dict))
+    return records
+
+def extract_structured_vehicles(content, base_url: str, model_filter: str = 'civic') -> List[Dict]:
+    """Extract vehicles from embedded JSON-LD or inventory JSON without building a DOM
+
+    Returns an empty list when the page carries no structured vehicle data, in
+    which case the caller should fall back to the HTML heuristics.
+    """
+    text = content.decode('utf-8', errors='replace') if isinstance(content, bytes) else content
+
+    vehicles = []
+    seen = set()
+    for record in _json_ld_records(text) + _inventory_records(text):
+        vehicle = normalize_record(record, base_url)
+        if not vehicle:
+            continue
+        if model_filter and model_filter not in (vehicle.get('model') or vehicle.get('title') or '').lower():
+            continue
+
+        identifier = vehicle.get('vin') or vehicle.get('url')
+        if identifier not in seen:
+            seen.add(identifier)
+            vehicles.append(vehicle)
+
+    logger.debug(f"Found {len(vehicles)} vehicles in structured data on {base_url}")
+    return vehicles
@@ -0,0 +1,321 @@
+import time
+import random
+import asyncio
+import logging
+import threading
+from urllib.parse import urlparse
+from typing import Callable, Dict, Optional
+import requests
+from config import TRANSPORT
+
+try:
+    import aiohttp
+except ImportError:  # aiohttp is only needed for the async engine
+    aiohttp = None
+
+logger = logging.getLogger(__name__)
+
+# Statuses worth asking again for: rate limited or a temporary server-side failure
+RETRYABLE_STATUSES = {429, 500, 502, 503, 504}
+
+# Statuses that mean the host is refusing the scraper: not retried, but they count towards opening its circuit
+BLOCKING_STATUSES = {403}
+
+ASYNC_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError) if aiohttp else (asyncio.TimeoutError,)
+
+class _NoSlot:
+    """Stand-in for a caller without a per-host concurrency cap"""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+NO_SLOT = _NoSlot()
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request to a host whose circuit is open"""
+
+    def __init__(self, host: str, retry_in: float):
+        super().__init__(f"{host} is failing, circuit open for another {retry_in:.0f}s")
+        self.host = host
+        self.retry_in = retry_in
+
+def is_retryable_error(error: Exception) -> bool:
+    """Connection failures are retried; timeouts are not, since each one already cost the full timeout"""
+    if isinstance(error, (requests.Timeout, asyncio.TimeoutError)):
+        return False
+    if aiohttp is not None and isinstance(error, aiohttp.ServerTimeoutError):
+        return False
+    return isinstance(error, requests.ConnectionError) or (
+        aiohttp is not None and isinstance(error, aiohttp.ClientConnectionError))
+
+def parse_retry_after(headers) -> Optional[float]:
+    """Seconds from a Retry-After header (the delta-seconds form)"""
+    value = headers.get('Retry-After') if headers is not None else None
+    try:
+        return max(float(value), 0.0) if value is not None else None
+    except ValueError:
+        return None
+
+class TokenBucket:
+    """Allows `rate` requests a second on average and bursts of up to `capacity`
+
+    A request takes a token straight away and is told how long to wait
+    before using it, so waiting requests queue up in order and the bucket
+    serves threads and coroutines alike.
+    """
+
+    def __init__(self, rate: float, capacity: float, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.clock = clock
+        self.updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token; returns the seconds to wait before sending"""
+        with self._lock:
+            now = self.clock()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            return max(-self.tokens / self.rate, 0.0)
+
+class CircuitBreaker:
+    """Stops requests to a host after repeated failures, then lets one probe through after a cooldown
+
+    closed: requests flow; `failure_threshold` failures in a row open it.
+    open: requests are refused until `cooldown` seconds have passed.
+    half_open: one probe request is let through; success closes the
+    circuit, failure opens it for another cooldown.
+    """
+
+    CLOSED, OPEN, HALF_OPEN = 'closed', 'open', 'half_open'
+
+    def __init__(self, failure_threshold: int, cooldown: float, clock: Callable[[], float] = time.monotonic):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.clock = clock
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = None
+        self.trips = 0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == self.OPEN and self.clock() - self.opened_at >= self.cooldown:
+                self.state = self.HALF_OPEN
+                self._probing = False
+            if self.state == self.HALF_OPEN:
+                if self._probing:
+                    return False
+                self._probing = True
+            return self.state != self.OPEN
+
+    def retry_in(self) -> float:
+        """Seconds until an open circuit lets a probe through"""
+        if self.state != self.OPEN:
+            return 0.0
+        return max(self.cooldown - (self.clock() - self.opened_at), 0.0)
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._probing = False
+
+    def record_failure(self) -> bool:
+        """Count a failure; returns True when it opened the circuit"""
+        with self._lock:
+            self.failures += 1
+            self._probing = False
+            if self.state == self.HALF_OPEN or (self.state == self.CLOSED and self.failure_threshold and
+                                                 self.failures >= self.failure_threshold):
+                self.state = self.OPEN
+                self.opened_at = self.clock()
+                self.trips += 1
+                return True
+            return False
+
+class HostState:
+    """Token bucket, circuit breaker and counters of one dealer host"""
+
+    def __init__(self, host: str, bucket: Optional[TokenBucket], breaker: CircuitBreaker):
+        self.host = host
+        self.bucket = bucket
+        self.breaker = breaker
+        self.counters = {'requests': 0, 'retries': 0, 'failures': 0, 'short_circuited': 0, 'throttled_seconds': 0.0}
+
+class Transport:
+    """Per-host request pacing, retries and circuit breaking for dealer requests
+
+    Every request to a host first takes a token from the host's bucket
+    (waiting if the host was asked too often), and is refused at once while
+    the host's circuit is open. 429 / 5xx answers and connection failures
+    are retried with exponential backoff and full jitter, honouring
+    Retry-After; a timeout or a 403 is not retried but counts towards
+    opening the circuit. Used by both scraper engines.
+    """
+
+    def __init__(self, rate: float = None, burst: float = None, retries: int = None, backoff: float = None,
+                 max_backoff: float = None, failure_threshold: int = None, cooldown: float = None,
+                 timeout: float = None, clock: Callable[[], float] = time.monotonic, rng: random.Random = None):
+        """
+        Args:
+            rate, burst: Requests per second and burst size per host (rate 0 turns pacing off)
+            retries: Extra attempts after a retryable failure
+            backoff, max_backoff: Base and cap of the backoff in seconds
+            failure_threshold: Consecutive failures that open a host's circuit (0 never opens it)
+            cooldown: Seconds an open circuit refuses requests
+            timeout: Seconds per request, for the scraper's HTTP client
+            clock, rng: Time source and random generator (for tests)
+        """
+        self.rate = TRANSPORT['rate'] if rate is None else rate
+        self.burst = burst or TRANSPORT['burst']
+        self.retries = TRANSPORT['retries'] if retries is None else retries
+        self.backoff = TRANSPORT['backoff'] if backoff is None else backoff
+        self.max_backoff = TRANSPORT['max_backoff'] if max_backoff is None else max_backoff
+        self.failure_threshold = TRANSPORT['failure_threshold'] if failure_threshold is None else failure_threshold
+        self.cooldown = TRANSPORT['cooldown'] if cooldown is None else cooldown
+        self.timeout = timeout or TRANSPORT['timeout']
+        self.clock = clock
+        self.rng = rng or random.Random()
+        self.hosts: Dict[str, HostState] = {}
+        self._lock = threading.Lock()
+
+    def host(self, url: str) -> HostState:
+        name = urlparse(url).netloc
+        with self._lock:
+            if name not in self.hosts:
+                bucket = TokenBucket(self.rate, self.burst, self.clock) if self.rate else None
+                self.hosts[name] = HostState(name, bucket, CircuitBreaker(self.failure_threshold, self.cooldown, self.clock))
+            return self.hosts[name]
+
+    def _count(self, host: HostState, counter: str, amount=1):
+        with self._lock:
+            host.counters[counter] += amount
+
+    def _pace(self, host: HostState) -> float:
+        """Take a token from the host's bucket; returns the seconds to wait before sending"""
+        wait = host.bucket.reserve() if host.bucket else 0.0
+        self._count(host, 'throttled_seconds', wait)
+        return wait
+
+    def _admit(self, host: HostState):
+        """Let a request through the host's breaker (checked once it holds a host slot)"""
+        if not host.breaker.allow():
+            self._count(host, 'short_circuited')
+            raise CircuitOpenError(host.host, host.breaker.retry_in())
+        self._count(host, 'requests')
+
+    def _outcome(self, host: HostState, attempt: int, status: Optional[int], headers,
+                 error: Optional[Exception]) -> Optional[float]:
+        """Record how an attempt went; returns the seconds to wait before retrying, or None when done
+
+        Connection failures, 5xx, 403 and a 429 without Retry-After count
+        towards opening the host's circuit. A 429 with Retry-After is the
+        host pacing us: it is retried after the given delay without
+        counting against the host. Other statuses are successes.
+        """
+        retry_after = parse_retry_after(headers) if error is None else None
+        retryable = is_retryable_error(error) if error is not None else status in RETRYABLE_STATUSES
+        if error is None and not retryable and status not in BLOCKING_STATUSES:
+            host.breaker.record_success()
+            return None
+        self._count(host, 'failures')
+        if not (status == 429 and retry_after is not None) and host.breaker.record_failure():
+            logger.warning(f"⛔ {host.host} failed {host.breaker.failures} times in a row, "
+                           f"skipping it for {self.cooldown:.0f}s")
+        if not retryable or attempt >= self.retries or host.breaker.state == CircuitBreaker.OPEN:
+            return None
+        self._count(host, 'retries')
+        delay = self.rng.uniform(0, min(self.max_backoff, self.backoff * 2 ** attempt))
+        if retry_after is not None:
+            delay = max(delay, min(retry_after, self.max_backoff))
+        return delay
+
+    def request(self, url: str, send: Callable[[], requests.Response], slot=None) -> requests.Response:
+        """Send with `send()` under the host's limits, retrying retryable failures
+
+        `slot` is the caller's per-host concurrency cap: tokens are taken
+        before waiting for it and the breaker is checked once it is held, so
+        requests queued behind a failing host are skipped as soon as its
+        circuit opens. Returns the last response (check its status) and
+        raises the last request error, or CircuitOpenError without sending.
+        """
+        host = self.host(url)
+        attempt = 0
+        while True:
+            wait = self._pace(host)
+            if wait:
+                time.sleep(wait)
+            with slot or NO_SLOT:
+                self._admit(host)
+                try:
+                    response, error = send(), None
+                except requests.RequestException as e:
+                    response, error = None, e
+            delay = self._outcome(host, attempt, response.status_code if error is None else None,
+                                  response.headers if error is None else None, error)
+            if delay is None:
+                if error is not None:
+                    raise error
+                return response
+            attempt += 1
+            logger.info(f"🔁 Retrying {url} in {delay:.1f}s (attempt {attempt + 1} of {self.retries + 1})")
+            time.sleep(delay)
+
+    async def request_async(self, url: str, send, slot=None):
+        """request() for the async engine: `send()` is a coroutine returning (status, headers, content)"""
+        host = self.host(url)
+        attempt = 0
+        while True:
+            wait = self._pace(host)
+            if wait:
+                await asyncio.sleep(wait)
+            async with slot or NO_SLOT:
+                self._admit(host)
+                try:
+                    result, error = await send(), None
+                except ASYNC_ERRORS as e:
+                    result, error = None, e
+            delay = self._outcome(host, attempt, result[0] if error is None else None,
+                                  result[1] if error is None else None, error)
+            if delay is None:
+                if error is not None:
+                    raise error
+                return result
+            attempt += 1
+            logger.info(f"🔁 Retrying {url} in {delay:.1f}s (attempt {attempt + 1} of {self.retries + 1})")
+            await asyncio.sleep(delay)
+
+    def get_stats(self) -> Dict:
+        """Counters since the last reset, summed and per host, with each host's circuit state"""
+        with self._lock:
+            hosts = {name: {**state.counters, 'throttled_seconds': round(state.counters['throttled_seconds'], 2),
+                            'state': state.breaker.state, 'trips': state.breaker.trips}
+                     for name, state in self.hosts.items()}
+        stats = {counter: sum(host[counter] for host in hosts.values())
+                 for counter in ('requests', 'retries', 'failures', 'short_circuited', 'throttled_seconds')}
+        stats['throttled_seconds'] = round(stats['throttled_seconds'], 2)
+        stats['open_hosts'] = [name for name, host in hosts.items() if host['state'] != CircuitBreaker.CLOSED]
+        stats['hosts'] = hosts
+        return stats
+
+    def reset_stats(self):
+        """Zero the counters (circuit states are kept, so a resident scraper remembers failing hosts)"""
+        with self._lock:
+            for state in self.hosts.values():
+                state.counters = dict.fromkeys(state.counters, 0)
+                state.counters['throttled_seconds'] = 0.0
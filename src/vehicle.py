@@ -0,0 +1,183 @@
+import sys
+from collections.abc import MutableMapping
+from typing import Dict, Iterable, Iterator, List
+
+# Canonical vehicle fields, in the order they are written out
+FIELDS = (
+    'id', 'title', 'url', 'price', 'vin', 'year', 'make', 'model', 'trim', 'type', 'color',
+    'body_style', 'mileage', 'dealership', 'location', 'inventory_type', 'first_seen'
+)
+
+# Other names the same data goes by (the dashboard's data.json uses link / dealer_link for the listing URL)
+FIELD_ALIASES = {
+    'link': 'url',
+    'dealer_link': 'url'
+}
+
+# Fields with few distinct values; their strings are interned so every vehicle shares one copy
+SHARED_VALUE_FIELDS = frozenset(('year', 'make', 'model', 'trim', 'type', 'color', 'body_style',
+                                 'dealership', 'location', 'inventory_type'))
+
+_FIELD_SET = frozenset(FIELDS)
+
+def _canonical_value(field: str, value):
+    if field in SHARED_VALUE_FIELDS and type(value) is str:
+        return sys.intern(value)
+    return value
+
+class Vehicle(MutableMapping):
+    """A vehicle listing with one slot per canonical field
+
+    Behaves like the dict the scraper used to pass around (vehicle['vin'],
+    vehicle.get('price'), 'year' in vehicle, dict(vehicle)), so dict-based
+    code keeps working, while taking a fraction of a dict's memory. Unset
+    fields read as missing keys; keys outside FIELDS are kept in `extra`.
+    """
+
+    __slots__ = FIELDS + ('extra',)
+
+    def __init__(self, **fields):
+        for field in FIELDS:
+            setattr(self, field, None)
+        self.extra = None
+        if fields:
+            self.update(fields)
+
+    @classmethod
+    def from_dict(cls, data) -> 'Vehicle':
+        """Adapt a vehicle dict (or return a Vehicle unchanged)"""
+        if isinstance(data, cls):
+            return data
+        vehicle = cls()
+        for key, value in data.items():
+            if key in _FIELD_SET:
+                setattr(vehicle, key, _canonical_value(key, value))
+            else:
+                vehicle[key] = value
+        return vehicle
+
+    def to_dict(self) -> Dict:
+        """The vehicle as a plain dict with only the fields that are set, as stored in previous_matches"""
+        data = {}
+        for field in FIELDS:
+            value = getattr(self, field)
+            if value is not None:
+                data[field] = value
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def __getitem__(self, key: str):
+        field = FIELD_ALIASES.get(key, key)
+        if field in FIELDS:
+            value = getattr(self, field)
+            if value is None:
+                raise KeyError(key)
+            return value
+        if self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __setitem__(self, key: str, value):
+        field = FIELD_ALIASES.get(key, key)
+        if field in FIELDS:
+            # An alias never overrides the canonical field it stands for
+            if field != key and getattr(self, field) is not None:
+                return
+            setattr(self, field, _canonical_value(field, value))
+        else:
+            if self.extra is None:
+                self.extra = {}
+            self.extra[key] = value
+
+    def __delitem__(self, key: str):
+        self[key]  # KeyError when not set
+        field = FIELD_ALIASES.get(key, key)
+        if field in FIELDS:
+            setattr(self, field, None)
+        else:
+            del self.extra[key]
+
+    def __iter__(self) -> Iterator[str]:
+        for field in FIELDS:
+            if getattr(self, field) is not None:
+                yield field
+        if self.extra:
+            yield from self.extra
+
+    def __len__(self) -> int:
+        return sum(1 for field in FIELDS if getattr(self, field) is not None) + len(self.extra or ())
+
+    def __repr__(self) -> str:
+        return f"Vehicle({self.to_dict()!r})"
+
+def as_dicts(vehicles: Iterable) -> List[Dict]:
+    """Plain dicts for Vehicles or dicts, e.g. before writing them out as JSON"""
+    return [vehicle.to_dict() if isinstance(vehicle, Vehicle) else vehicle for vehicle in vehicles]
+
+class VehicleBatch:
+    """Many vehicles stored column by column: one list per canonical field
+
+    For bulk work over large histories (dashboard conversion, benchmarks):
+    a column is scanned without touching the other fields, and a vehicle
+    costs one list slot per field instead of an object or dict of its own.
+    """
+
+    __slots__ = ('columns', 'extras')
+
+    def __init__(self):
+        self.columns = {field: [] for field in FIELDS}
+        self.extras = []  # Per-row dict of non-canonical keys, or None
+
+    @classmethod
+    def from_dicts(cls, vehicles: Iterable) -> 'VehicleBatch':
+        """Build a batch from vehicle dicts or Vehicles"""
+        batch = cls()
+        for vehicle in vehicles:
+            batch.append(vehicle)
+        return batch
+
+    def append(self, vehicle):
+        if not isinstance(vehicle, Vehicle) and _FIELD_SET.issuperset(vehicle):
+            # Plain dict with canonical keys only: fill the columns without building a Vehicle
+            for field, column in self.columns.items():
+                column.append(_canonical_value(field, vehicle.get(field)))
+            self.extras.append(None)
+            return
+        vehicle = Vehicle.from_dict(vehicle)
+        for field, column in self.columns.items():
+            column.append(getattr(vehicle, field))
+        self.extras.append(vehicle.extra)
+
+    def column(self, field: str) -> List:
+        """Every vehicle's value for one field (None where unset)"""
+        return self.columns[FIELD_ALIASES.get(field, field)]
+
+    def row(self, index: int) -> Vehicle:
+        vehicle = Vehicle()
+        for field, column in self.columns.items():
+            setattr(vehicle, field, column[index])
+        vehicle.extra = self.extras[index]
+        return vehicle
+
+    def select(self, indexes: Iterable[int]) -> 'VehicleBatch':
+        """A new batch holding the given rows, in the given order"""
+        indexes = list(indexes)
+        batch = VehicleBatch()
+        for field, column in self.columns.items():
+            batch.columns[field] = [column[index] for index in indexes]
+        batch.extras = [self.extras[index] for index in indexes]
+        return batch
+
+    def to_dicts(self) -> List[Dict]:
+        return [self.row(index).to_dict() for index in range(len(self))]
+
+    def __len__(self) -> int:
+        return len(self.extras)
+
+    def __iter__(self) -> Iterator[Vehicle]:
+        for index in range(len(self)):
+            yield self.row(index)
+
+    def __getitem__(self, index: int) -> Vehicle:
+        return self.row(index)
@@ -6,44 +6,74 @@ Web Dashboard Updater - Call this from main.py after each search
 import os
 import sys
 import json
-import subprocess
+import importlib
 from datetime import datetime
+from config import WEB_DATA
+from storage import write_data_atomically
 
-def update_web_dashboard():
-    """Update the web dashboard data after a search"""
-    
-    # Get the project root directory
-    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    docs_dir = os.path.join(project_root, 'docs')
+DOCS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'docs')
+
+def load_converter():
+    """Import docs/convert_data.py in-process (None when the web dashboard is not set up)"""
+    if not os.path.exists(os.path.join(DOCS_DIR, 'convert_data.py')):
+        return None
+    if DOCS_DIR not in sys.path:
+        sys.path.append(DOCS_DIR)
+    return importlib.import_module('convert_data')
+
+def update_web_dashboard(new_vehicles: list = None, search_stats: dict = None, days_to_keep: int = 30,
+                         data_manager=None, dashboard_state: dict = None):
+    """Update the web dashboard data after a search
     
-    if not os.path.exists(docs_dir):
-        print("📱 Web dashboard not set up yet")
-        return
+    With the run's new vehicles only that delta is merged into docs/data/;
+    otherwise the dashboard is rebuilt, from the data_manager's in-memory data
+    when one is given and from the data file when not. Runs in this process;
+    `python3 docs/convert_data.py` remains the command-line equivalent.
+    A resident service passes the same dashboard_state dict to every call so
+    the parsed dashboard pages stay in memory between runs.
+    """
     
     try:
-        # Run the data conversion script
-        result = subprocess.run(
-            ['python3', 'convert_data.py'],
-            cwd=docs_dir,
-            capture_output=True,
-            text=True
-        )
+        converter = load_converter()
+        if converter is None:
+            print("📱 Web dashboard not set up yet")
+            return
+        
+        if search_stats is None and data_manager is not None:
+            search_stats = data_manager.get_stats()
+        
+        web_data = None
+        if new_vehicles is not None:
+            try:
+                web_data = converter.update_web_data_incrementally(new_vehicles, search_stats or {}, days_to_keep,
+                                                                   state=dashboard_state)
+            except Exception as e:
+                print(f"⚠️ Incremental dashboard update failed ({e}), rebuilding it")
+            else:
+                if web_data is None:
+                    print("Dashboard manifest missing or damaged, rebuilding it")
+        
+        if web_data is None:
+            if dashboard_state is not None:
+                dashboard_state.clear()  # Rebuilt from scratch; read back on the next run
+            original_data = data_manager.store.snapshot() if data_manager is not None else None
+            web_data = converter.convert_data_for_web(original_data)
         
-        if result.returncode == 0:
+        if web_data is not None:
             print("📱 Web dashboard updated successfully")
-            print(result.stdout.strip())
+            # Push the change to pages open on a dashboard server running in this process
+            from dashboard_server import notify_dashboard_updated
+            notify_dashboard_updated()
         else:
-            print("❌ Failed to update web dashboard:")
-            print(result.stderr.strip())
+            print("❌ Failed to update web dashboard: no tracked data")
             
     except Exception as e:
         print(f"❌ Error updating web dashboard: {e}")
 
 def update_dashboard_stats(search_stats):
-    """Update dashboard with search statistics"""
+    """Update the dashboard manifest with search statistics (the match shards are left alone)"""
     
-    project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-    data_file = os.path.join(project_root, 'docs', 'data.json')
+    data_file = os.path.join(DOCS_DIR, WEB_DATA['dir'], 'manifest.json')
     
     if not os.path.exists(data_file):
         return
@@ -61,8 +91,7 @@ def update_dashboard_stats(search_stats):
         data['last_search'] = search_stats.get('last_search', data.get('last_search', ''))
         
         # Write back
-        with open(data_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        write_data_atomically(data_file, data, 'json')
             
         print("📊 Dashboard statistics updated")
         